@@ -0,0 +1,79 @@
+"""
+Parity check and timings of the VibeFrame compute backends.
+
+    python scripts/benchmark_backends.py --rows 2000000 --backends pandas arrow polars
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from vibequant.utils.backend import get_backend, parity_check
+from vibequant.wrappers.vibes import VibeFrame
+
+
+def synthetic_bars(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2000-01-01", periods=rows, freq="5min", name="Date")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 1e-3, rows)))
+    open_ = close * np.exp(rng.normal(0, 5e-4, rows))
+    return pd.DataFrame(
+        {
+            "Open": open_,
+            "High": np.maximum(open_, close) * 1.001,
+            "Low": np.minimum(open_, close) * 0.999,
+            "Close": close,
+            "Volume": rng.integers(100, 10_000, rows),
+        },
+        index=index,
+    )
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--backends", nargs="+", default=["pandas", "arrow", "polars"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    bars = synthetic_bars(args.rows)
+    reference = VibeFrame(bars, returns=["Change", "Gap"]).original_df
+    print(f"{args.rows:,} rows")
+    print(f"{'backend':<8} {'features':>9} {'W':>7} {'M':>7} {'DWM':>7} {'stats':>7}  parity")
+    for name in args.backends:
+        try:
+            backend = get_backend(name)
+            parity_check(reference, backend)
+            parity = "ok"
+        except ImportError as e:
+            print(f"{name:<8} skipped ({e})")
+            continue
+        except AssertionError as e:
+            parity = f"FAILED: {str(e).splitlines()[0]}"
+        returns = ["Change", "Gap"]
+        features = timed(
+            lambda: VibeFrame._ensure_time_features(bars, returns, backend), args.repeat
+        )
+        views = [
+            timed(lambda t=t: VibeFrame(reference, returns=returns, backend=backend)._view(t), args.repeat)
+            for t in ("W", "M", "DWM")
+        ]
+        vf = VibeFrame(reference, returns=returns, backend=backend)
+        stats = timed(lambda: vf.grouped_stats(["Month", "Weekday"]), args.repeat)
+        cells = " ".join(f"{s:7.3f}" for s in views)
+        print(f"{name:<8} {features:9.3f} {cells} {stats:7.3f}  {parity}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vibequant.utils.backend import STATS, ComputeBackend, get_backend, parity_check
+from vibequant.wrappers.vibes import CRYPTO_WEEK_DAYS, VibeFrame
+
+VIEWS = ["W", "M", "D", "WM", "DWM"]
+
+
+@pytest.fixture(params=["arrow", "polars"])
+def backend(request):
+    pytest.importorskip("pyarrow" if request.param == "arrow" else "polars")
+    return get_backend(request.param)
+
+
+def _bars(index: pd.DatetimeIndex, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(index))))
+    open_ = close * np.exp(rng.normal(0, 0.002, len(index)))
+    close[rng.random(len(index)) < 0.02] = np.nan  # missing bars give NaN returns
+    return pd.DataFrame({"Open": open_, "Close": close}, index=index)
+
+
+FRAMES = {
+    "stock": lambda: _bars(pd.bdate_range("2012-01-01", "2024-12-31", name="Date")),
+    "crypto": lambda: _bars(pd.date_range("2016-01-01", "2024-12-31", freq="D", name="Date")),
+    # Hourly bars in New York: calendar fields come from the wall time, not UTC
+    "tz-aware": lambda: _bars(
+        pd.date_range("2022-01-01", periods=20_000, freq="h", tz="America/New_York", name="Date")
+    ),
+}
+
+
+@pytest.fixture(params=list(FRAMES))
+def bars(request):
+    return request.param, FRAMES[request.param]()
+
+
+def test_calendar_matches_pandas(backend, bars):
+    kind, df = bars
+    expected = get_backend("pandas").calendar(df.index)
+    got = backend.calendar(df.index)
+    assert list(got) == list(expected)
+    for name in expected:
+        np.testing.assert_array_equal(np.asarray(got[name]), np.asarray(expected[name]))
+        assert np.asarray(got[name]).dtype == np.asarray(expected[name]).dtype
+
+
+@pytest.mark.parametrize("view", VIEWS)
+def test_views_match_pandas(backend, bars, view):
+    kind, df = bars
+    is_stock = kind == "stock"
+    returns = ["Change", "Gap"]
+    expected = VibeFrame(df, is_stock=is_stock, returns=returns, backend="pandas")._view(view)
+    got = VibeFrame(df, is_stock=is_stock, returns=returns, backend=backend)._view(view)
+    pd.testing.assert_frame_equal(got, expected, check_exact=False, rtol=1e-12)
+    if kind == "crypto" and view == "W":
+        assert list(got.index) == CRYPTO_WEEK_DAYS
+
+
+@pytest.mark.parametrize("by", ["Weekday", "Month", ["Month", "Weekday"]])
+def test_grouped_stats_match_pandas(backend, bars, by):
+    kind, df = bars
+    expected = VibeFrame(df, is_stock=kind == "stock", backend="pandas").grouped_stats(by)
+    got = VibeFrame(df, is_stock=kind == "stock", backend=backend).grouped_stats(by)
+    pd.testing.assert_frame_equal(got, expected, check_exact=False, rtol=1e-12)
+
+
+def test_group_agg_drops_nan_keys(backend):
+    df = VibeFrame(FRAMES["crypto"](), is_stock=False).original_df
+    df["Month"] = df["Month"].astype(np.float64)
+    rng = np.random.default_rng(1)
+    df.loc[rng.random(len(df)) < 0.05, "Month"] = np.nan
+    df.loc[rng.random(len(df)) < 0.05, "Weekday"] = None
+    reference = get_backend("pandas")
+    for keys in (["Weekday"], ["Month"], ["Month", "Weekday"]):
+        pd.testing.assert_frame_equal(
+            backend.group_agg(df, keys, ["Change"], STATS),
+            reference.group_agg(df, keys, ["Change"], STATS),
+            check_exact=False,
+            rtol=1e-12,
+        )
+
+
+def test_parity_check(backend, bars):
+    _, df = bars
+    parity_check(VibeFrame(df, returns=["Change", "Gap"]).original_df, backend)
+
+
+def test_incomplete_backend_cannot_be_instantiated():
+    class CalendarOnly(ComputeBackend):
+        def calendar(self, dates):
+            return get_backend("pandas").calendar(dates)
+
+    with pytest.raises(TypeError):
+        CalendarOnly()
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vibequant.analysis.cube import MomentCube
+from vibequant.wrappers.vibes import VibeFrame
+
+
+@pytest.fixture(scope="module")
+def prices():
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range("2015-01-01", periods=1500, name="Date")
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.01, len(dates))))
+    return pd.DataFrame({"Open": close * 0.999, "Close": close}, index=dates)
+
+
+@pytest.fixture(scope="module")
+def frames(prices):
+    """The same bars as a DatetimeIndex frame and as a Date-column frame."""
+    return VibeFrame(prices), VibeFrame(prices.reset_index())
+
+
+def test_cycles_use_the_date_column(frames):
+    indexed, column = frames
+    pd.testing.assert_frame_equal(column.cycles(), indexed.cycles())
+
+
+@pytest.mark.parametrize("view", ["W", "M"])
+def test_year_breakdowns_use_the_date_column(frames, view):
+    indexed, column = frames
+    pd.testing.assert_frame_equal(column.yearly_view(view), indexed.yearly_view(view))
+    pd.testing.assert_frame_equal(column.stability(view), indexed.stability(view))
+
+
+def test_top_year_share_is_a_share(frames):
+    scores = frames[0].stability("DWM")
+    share = scores["top_year_share"].dropna()
+    assert len(share) > 0
+    assert ((share >= 0) & (share <= 1)).all()
+
+
+def test_cube_uses_the_date_column(frames):
+    indexed, column = frames
+    dims = ["Weekday", "Year", "Vol"]
+    pd.testing.assert_frame_equal(
+        column.cube(dims).stats(["Year", "Vol"]), indexed.cube(dims).stats(["Year", "Vol"])
+    )
+
+
+def test_cube_year_needs_dates(prices):
+    frame = prices.reset_index().assign(Change=prices["Close"].pct_change().to_numpy())
+    with pytest.raises(ValueError, match="DatetimeIndex"):
+        MomentCube(frame, ["Year"])
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vibequant.analysis.pairs import pairs_scan
+
+
+def _universe(rows: int = 1500, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2015-01-01", periods=rows, name="Date")
+    walks = np.cumsum(rng.normal(0, 0.01, (rows, 4)), axis=0)
+    prices = pd.DataFrame(100 * np.exp(walks), index=index, columns=["A", "B", "C", "D"])
+    # B tracks A with a mean-reverting spread
+    spread = np.zeros(rows)
+    for t in range(1, rows):
+        spread[t] = 0.8 * spread[t - 1] + rng.normal(0, 0.005)
+    prices["B"] = prices["A"] * np.exp(spread)
+    return prices
+
+
+def test_finds_the_cointegrated_pair():
+    out = pairs_scan(_universe(), min_corr=None)
+    assert len(out) == 6
+    best = out.iloc[0]
+    assert {best["y"], best["x"]} == {"A", "B"}
+    assert best["coint_5pct"]
+    assert best["half_life"] < 10
+    assert not out.iloc[1:]["coint_5pct"].all()
+
+
+def test_recent_listing_does_not_truncate_the_universe():
+    prices = _universe()
+    prices["NEW"] = np.nan
+    prices.iloc[-300:, prices.columns.get_loc("NEW")] = 50.0 + np.arange(300) * 0.01
+    out = pairs_scan(prices, min_corr=None)
+    assert "NEW" not in set(out["y"]) | set(out["x"])
+    # Same statistics as without the listing: all 1500 rows were used
+    expected = pairs_scan(prices.drop(columns="NEW"), min_corr=None)
+    pd.testing.assert_frame_equal(out, expected)
+
+
+def test_min_coverage_zero_keeps_short_histories():
+    prices = _universe()
+    prices.iloc[:1000, prices.columns.get_loc("D")] = np.nan
+    out = pairs_scan(prices, min_corr=None, min_coverage=0.0)
+    assert "D" in set(out["y"]) | set(out["x"])
+
+
+def test_needs_two_tickers():
+    with pytest.raises(ValueError):
+        pairs_scan(_universe()[["A"]])
@@ -0,0 +1,133 @@
+import threading
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+
+from vibequant.sources import yfinance_source
+from vibequant.sources.fake_source import FakeSource
+from vibequant.sources.prefetch import PrefetchScheduler
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_700_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class RecordingSource(FakeSource):
+    def __init__(self, failing=(), **kwargs):
+        super().__init__(**kwargs)
+        self.failing = set(failing)
+        self.fetched = []
+
+    def fetch(self, ticker, start=None, end=None):
+        self.fetched.append(ticker)
+        if ticker in self.failing:
+            raise ConnectionError(f"{ticker} is down")
+        return super().fetch(ticker, start, end)
+
+
+def test_tick_runs_only_when_due():
+    clock = FakeClock()
+    source = RecordingSource()
+    scheduler = PrefetchScheduler(source, ["AAA", "BBB"], interval=60, clock=clock)
+    assert scheduler.tick()
+    assert sorted(source.fetched) == ["AAA", "BBB"]
+    clock.advance(59)
+    assert not scheduler.tick()
+    clock.advance(1)
+    assert scheduler.tick()
+    assert len(source.fetched) == 4
+
+
+def test_status_tracks_cold_warm_stale_and_error():
+    clock = FakeClock()
+    source = RecordingSource(failing={"BBB"})
+    scheduler = PrefetchScheduler(source, ["AAA", "BBB", "CCC"], interval=60, clock=clock)
+    assert scheduler.status()["state"].tolist() == ["cold"] * 3
+
+    scheduler.run_once(["AAA", "BBB"])
+    status = scheduler.status()
+    assert status.loc["AAA", "state"] == "warm"
+    assert status.loc["AAA", "age"] == 0
+    assert status.loc["AAA", "fetched_at"] == pd.Timestamp(clock.now, unit="s", tz="UTC")
+    assert status.loc["BBB", "state"] == "error"
+    assert "BBB is down" in status.loc["BBB", "error"]
+    assert status.loc["CCC", "state"] == "cold"
+
+    clock.advance(61)
+    status = scheduler.status()
+    assert status.loc["AAA", "state"] == "stale"
+    assert status.loc["AAA", "age"] == 61
+
+
+def test_priority_orders_the_run():
+    source = RecordingSource()
+    scheduler = PrefetchScheduler(
+        source, ["AAA", "BBB", "CCC"], max_workers=1, priority={"CCC": -1}, clock=FakeClock()
+    )
+    scheduler.run_once()
+    assert source.fetched == ["CCC", "AAA", "BBB"]
+
+
+def test_daily_slot_is_next_close_in_local_time():
+    tz = ZoneInfo("America/New_York")
+    clock = FakeClock(datetime(2024, 3, 8, 17, 0, tzinfo=tz).timestamp())
+    scheduler = PrefetchScheduler(FakeSource(), ["AAA"], at="16:15", clock=clock)
+    assert scheduler.tick()
+    assert datetime.fromtimestamp(scheduler.next_run, tz) == datetime(2024, 3, 9, 16, 15, tzinfo=tz)
+    clock.now = scheduler.next_run - 1
+    assert not scheduler.tick()
+    clock.now = scheduler.next_run
+    assert scheduler.tick()
+
+
+def test_workers_fetch_in_parallel():
+    source = FakeSource(delay=0.2, tickers=["A", "B", "C", "D"])
+    scheduler = PrefetchScheduler(source, source.tickers, max_workers=4)
+    started = time.perf_counter()
+    assert set(scheduler.run_once().values()) == {"warm"}
+    assert time.perf_counter() - started < 0.6
+
+
+def test_yfinance_downloads_run_concurrently_and_keep_their_bars(monkeypatch):
+    barrier = threading.Barrier(3, timeout=5)
+
+    class Ticker:
+        def __init__(self, ticker):
+            self.ticker = ticker
+
+        def history(self, period=None, start=None, end=None):
+            barrier.wait()  # all three downloads in flight at once
+            index = pd.date_range("2024-01-02", periods=3, freq="D", tz="America/New_York")
+            price = float(ord(self.ticker[0]))
+            columns = ["Open", "High", "Low", "Close", "Volume", "Dividends", "Stock Splits"]
+            values = [price, price, price, price, 1, 0.0, 0.0]
+            return pd.DataFrame([values] * len(index), index=index, columns=columns)
+
+    monkeypatch.setattr(yfinance_source.yf, "Ticker", Ticker)
+    source = yfinance_source.YFinanceSource()
+    scheduler = PrefetchScheduler(source, ["AAA", "BBB", "CCC"], max_workers=3)
+    assert set(scheduler.run_once().values()) == {"warm"}
+    for ticker in ["AAA", "BBB", "CCC"]:
+        df = source.fetch(ticker)
+        assert (df["Close"] == float(ord(ticker[0]))).all()
+        assert df.index.tz is None and df.index.name == "Date"
+        assert "Dividends" not in df.columns
+        assert df["Weekday"].tolist() == ["Tuesday", "Wednesday", "Thursday"]
+    assert scheduler.status()["state"].tolist() == ["warm"] * 3
+
+
+@pytest.mark.parametrize("failing", [True, False])
+def test_refresh_failures_are_reported_not_raised(failing):
+    source = RecordingSource(failing={"AAA"} if failing else ())
+    scheduler = PrefetchScheduler(source, ["AAA"], clock=FakeClock())
+    assert scheduler.run_once() == {"AAA": "error" if failing else "warm"}
@@ -0,0 +1,111 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vibequant.analysis.preview import StratifiedPreview
+from vibequant.wrappers.vibes import VibeFrame
+
+KEYS = [
+    ["Weekday"],
+    ["Month"],
+    ["DayOfMonth"],
+    ["DayOfMonth", "Weekday"],
+    ["Month", "DayOfMonth", "Weekday"],
+]
+
+
+def _exact(df, keys, cols, index):
+    # Same groups as the estimates, which list weekdays in calendar order
+    exact = df.groupby(keys)[cols]
+    mean, count = exact.mean(), exact.count().astype(np.int64)
+    assert len(mean) == len(index)
+    return mean.reindex(index), count.reindex(index)
+
+
+@pytest.fixture(scope="module")
+def bars():
+    # 200k 15-minute bars with fat-tailed returns, about 80 rows per DWM cell
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2018-01-01", periods=200_000, freq="15min", name="Date")
+    close = 100 * np.exp(np.cumsum(rng.standard_t(4, len(index)) * 2e-3))
+    open_ = close * np.exp(rng.normal(0, 1e-3, len(index)))
+    df = pd.DataFrame({"Open": open_, "Close": close}, index=index)
+    return VibeFrame(df, is_stock=False, returns=["Change", "Gap"]).original_df
+
+
+def test_every_cell_gets_min_per_cell_rows(bars):
+    preview = StratifiedPreview(bars, fraction=0.05, min_per_cell=5)
+    present = preview.rows > 0
+    expected = np.minimum(np.ceil(np.maximum(0.05 * preview.rows, 5)), preview.rows)
+    np.testing.assert_array_equal(preview.sampled[present], expected[present])
+
+
+@pytest.mark.parametrize("keys", KEYS)
+def test_sample_estimates_have_calibrated_errors(bars, keys):
+    z = []
+    for seed in range(10):
+        mean, se, _ = StratifiedPreview(bars, fraction=0.05, seed=seed).estimate(keys)
+        exact = _exact(bars, keys, "Change", mean.index)[0]
+        assert mean["Change"].notna().all() and (se["Change"] > 0).all()
+        z.append(((mean["Change"] - exact) / se["Change"]).to_numpy())
+    z = np.concatenate(z)
+    assert 0.8 < z.std() < 1.25
+    assert 0.9 < np.mean(np.abs(z) < 1.96)
+
+
+@pytest.mark.parametrize("keys", KEYS)
+def test_refined_to_full_fraction_is_exact(bars, keys):
+    preview = StratifiedPreview(bars, ["Change", "Gap"], fraction=0.05)
+    for fraction in (0.1, 0.4, None, 1.0):
+        preview.refine(fraction)
+    assert preview.is_exact
+    assert preview.sampled.sum() == len(bars)
+    mean, se, counts = preview.estimate(keys)
+    exact, exact_counts = _exact(bars, keys, ["Change", "Gap"], mean.index)
+    pd.testing.assert_frame_equal(mean, exact, check_exact=False, rtol=1e-9)
+    pd.testing.assert_frame_equal(counts, exact_counts)
+    assert (se.to_numpy() == 0).all()
+
+
+def test_refining_adds_rows_incrementally(bars):
+    preview = StratifiedPreview(bars, fraction=0.05, seed=3)
+    preview.refine(0.2)
+    direct = StratifiedPreview(bars, fraction=0.2, seed=3)
+    np.testing.assert_array_equal(preview.sampled, direct.sampled)
+    np.testing.assert_allclose(preview.sums, direct.sums, rtol=1e-12, atol=1e-15)
+
+
+def test_approximate_views_match_exact_views(bars):
+    vf = VibeFrame(bars, is_stock=False)
+    exact = vf._view("DWM")
+    vf.approximate(0.05)
+    estimate = vf._view("DWM")
+    assert estimate.shape == exact.shape
+    assert estimate.notna().equals(exact.notna())
+    vf.refine(1.0)
+    pd.testing.assert_frame_equal(
+        vf._view("DWM"), exact, check_exact=False, rtol=1e-9, check_index_type=False
+    )
+
+
+def _best_time(fn, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def test_preview_is_faster_than_the_exact_view():
+    # 2M one-minute bars: sampling 1% must beat computing the exact DWM view
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2016-01-01", periods=2_000_000, freq="1min", name="Date")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 1e-4, len(index))))
+    vf = VibeFrame(pd.DataFrame({"Open": close, "Close": close}, index=index), is_stock=False)
+    transform = VibeFrame._get_transform_map()["DWM"]
+    exact = _best_time(lambda: transform(vf.original_df, vf.returns, vf.backend))
+    approximate = _best_time(lambda: vf.approximate(0.01))
+    assert approximate < exact
@@ -0,0 +1,48 @@
+import os
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from vibequant.plots.cache import RenderCache  # noqa: E402
+
+
+def _draw():
+    plt.plot([1, 2, 3])
+
+
+def test_clear_removes_only_cache_entries(tmp_path):
+    cache = RenderCache(disk_dir=str(tmp_path))
+    (tmp_path / "notes.txt").write_text("keep me")
+    key = RenderCache.key("line", [pd.DataFrame({"a": [1, 2]})])
+    cache.get_or_render(key, _draw)
+    assert f"{key}.png" in os.listdir(tmp_path)
+
+    cache.clear(disk=True)
+    assert os.listdir(tmp_path) == ["notes.txt"]
+    assert cache.stats()["size"] == 0
+
+
+def test_disk_tier_survives_a_new_instance(tmp_path):
+    key = RenderCache.key("line", [pd.DataFrame({"a": [1, 2]})])
+    first = RenderCache(disk_dir=str(tmp_path)).get_or_render(key, _draw)
+    other = RenderCache(disk_dir=str(tmp_path))
+    assert other.get_or_render(key, lambda: 1 / 0) == first
+    assert other.stats()["disk_hits"] == 1
+
+
+def test_frame_and_array_kwargs_are_hashed_by_content():
+    big = pd.DataFrame({"a": np.arange(1000.0)})
+    changed = big.copy()
+    changed.iloc[500, 0] = -1.0  # same truncated repr
+    assert repr(big) == repr(changed)
+    assert RenderCache.key("f", [], highlight=big) != RenderCache.key("f", [], highlight=changed)
+    array = np.arange(5000.0)
+    other = array.copy()
+    other[2500] = 0.5
+    assert RenderCache.key("f", [], levels=array) != RenderCache.key("f", [], levels=other)
+    assert RenderCache.key("f", [], levels=array) == RenderCache.key("f", [], levels=array.copy())
@@ -0,0 +1,154 @@
+import time
+
+import pytest
+
+from vibequant.sources.fake_source import FakeSource
+from vibequant.sources.router import SourceRouter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def make_router():
+    routers = []
+
+    def make(sources, **kwargs):
+        router = SourceRouter(sources, **kwargs)
+        routers.append(router)
+        return router
+
+    yield make
+    for router in routers:
+        router.close()
+
+
+def test_slow_primary_is_hedged_after_hedge_after(make_router):
+    primary, backup = FakeSource(delay=1.0), FakeSource()
+    router = make_router({"primary": primary, "backup": backup}, hedge_after=0.05)
+    started = time.perf_counter()
+    df = router.fetch("AAA")
+    elapsed = time.perf_counter() - started
+    assert 0.05 <= elapsed < 0.5
+    assert len(df) > 0
+    assert router.hedges == 1
+    assert router.stats().loc["backup", "wins"] == 1
+
+
+def test_fast_primary_is_not_hedged(make_router):
+    primary, backup = FakeSource(), FakeSource()
+    router = make_router({"primary": primary, "backup": backup}, hedge_after=0.5)
+    router.fetch("AAA")
+    assert router.hedges == 0
+    assert backup.calls == 0
+
+
+def test_error_fails_over_without_waiting_for_the_hedge(make_router):
+    primary, backup = FakeSource(fail_rate=1.0), FakeSource()
+    router = make_router({"primary": primary, "backup": backup}, hedge_after=10.0)
+    started = time.perf_counter()
+    df = router.fetch("AAA")
+    assert time.perf_counter() - started < 1.0
+    assert len(df) > 0
+    router.fetch("BBB")
+    stats = router.stats()
+    assert stats.loc["primary", "errors"] == 2
+    assert stats.loc["backup", "wins"] == 2
+
+
+def test_empty_answers_fail_over_but_do_not_trip_the_breaker(make_router):
+    primary, backup = FakeSource(empty=True), FakeSource()
+    router = make_router(
+        {"primary": primary, "backup": backup}, hedge_after=10.0, failure_threshold=2
+    )
+    for _ in range(3):
+        assert len(router.fetch("UNKNOWN")) > 0
+    assert router.breakers["primary"].state == "closed"
+    assert primary.calls == 3
+
+
+def test_breaker_opens_half_opens_and_closes(make_router):
+    clock = FakeClock()
+    primary, backup = FakeSource(fail_rate=1.0), FakeSource()
+    router = make_router(
+        {"primary": primary, "backup": backup},
+        hedge_after=10.0,
+        failure_threshold=2,
+        reset_after=30.0,
+        clock=clock,
+    )
+    router.fetch("AAA")
+    router.fetch("AAA")
+    assert router.breakers["primary"].state == "open"
+
+    router.fetch("AAA")
+    assert primary.calls == 2  # skipped while open
+
+    clock.now = 30.0
+    assert router.breakers["primary"].state == "half-open"
+    router.fetch("AAA")  # the trial fails and re-opens the breaker
+    assert primary.calls == 3
+    assert router.breakers["primary"].state == "open"
+
+    clock.now = 60.0
+    primary.fail_rate = 0.0
+    router.fetch("AAA")  # the trial succeeds and closes it
+    assert primary.calls == 4
+    assert router.breakers["primary"].state == "closed"
+    assert router.stats().loc["primary", "wins"] == 1
+
+
+def test_unsent_hedge_leaves_the_trial_slot_free(make_router):
+    clock = FakeClock()
+    primary, backup = FakeSource(fail_rate=1.0), FakeSource(fail_rate=1.0)
+    router = make_router(
+        {"primary": primary, "backup": backup},
+        hedge_after=10.0,
+        failure_threshold=1,
+        reset_after=30.0,
+        clock=clock,
+    )
+    with pytest.raises(RuntimeError, match="All sources failed"):
+        router.fetch("AAA")
+    clock.now = 30.0
+    primary.fail_rate = 0.0
+    router.fetch("AAA")  # answered by primary before any hedge to backup
+    assert backup.calls == 1
+    assert router.breakers["backup"].state == "half-open"
+    assert router.breakers["backup"].allow()
+
+
+def test_all_breakers_open_raises(make_router):
+    clock = FakeClock()
+    router = make_router(
+        {"only": FakeSource(fail_rate=1.0)}, failure_threshold=1, reset_after=30.0, clock=clock
+    )
+    with pytest.raises(RuntimeError, match="All sources failed"):
+        router.fetch("AAA")
+    with pytest.raises(RuntimeError, match="circuit breakers are open"):
+        router.fetch("AAA")
+
+
+def test_overall_timeout(make_router):
+    router = make_router(
+        {"a": FakeSource(delay=2.0), "b": FakeSource(delay=2.0)}, hedge_after=0.05, timeout=0.2
+    )
+    started = time.perf_counter()
+    with pytest.raises(RuntimeError, match="Timed out"):
+        router.fetch("AAA")
+    assert time.perf_counter() - started < 1.0
+    assert router.hedges == 1
+
+
+def test_answers_are_normalized_whichever_source_wins(make_router):
+    raw = make_router({"raw": FakeSource(style="raw")}).fetch("AAA", "2021-01-01", "2021-03-01")
+    plain = FakeSource().fetch("AAA", "2021-01-01", "2021-03-01")
+    assert list(raw.columns[:5]) == ["Open", "High", "Low", "Close", "Volume"]
+    assert raw.index.name == "Date"
+    assert (raw["Close"].to_numpy() == plain["Close"].to_numpy()).all()
+    assert {"DayOfMonth", "Weekday", "Month"} <= set(raw.columns)
@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vibequant.analysis.screen import MetricStore, Screen
+
+
+def _mask(expr, frame):
+    return Screen(expr).evaluate(lambda c: frame[c].to_numpy(), len(frame))
+
+
+@pytest.mark.parametrize(
+    "text, value",
+    [("2k", 2e3), ("1.5M", 1.5e6), ("3b", 3e9), ("30%", 30.0), (".5", 0.5), ("1e3", 1e3)],
+)
+def test_number_suffixes(text, value):
+    assert Screen(f"x > {text}").tree == ("cmp", ">", ("col", "x"), ("num", value))
+
+
+def test_precedence():
+    assert Screen("a > 1 or b > 1 and c > 1").tree[0] == "or"
+    assert Screen("not a > 1 and b > 1").tree == (
+        "and",
+        ("not", ("cmp", ">", ("col", "a"), ("num", 1.0))),
+        ("cmp", ">", ("col", "b"), ("num", 1.0)),
+    )
+    frame = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4.0, 0.0, -1.0]})
+    assert _mask("1 + 2 * a == 7", frame).tolist() == [False, False, True]
+    assert _mask("(1 + 2) * a == 9", frame).tolist() == [False, False, True]
+    assert _mask("-a * 2 < -3", frame).tolist() == [False, True, True]
+    assert _mask("abs(b) >= 1 and a in (1, 3)", frame).tolist() == [True, False, True]
+    assert _mask("2 < a", frame).tolist() == [False, False, True]
+
+
+@pytest.mark.parametrize(
+    "expr, message",
+    [
+        ("x > ", "at end"),
+        ("x > 2 y", "Unexpected token at 6 ('y')"),
+        ("x > $2", "Unexpected character at 4"),
+        ("(x > 2", "Expected ')' at end"),
+        ("x in 1", "Expected '(' at 5"),
+        ("", "Empty screen"),
+    ],
+)
+def test_errors_name_the_position(expr, message):
+    with pytest.raises(ValueError, match=message.replace("(", r"\(").replace(")", r"\)")):
+        Screen(expr)
+
+
+def test_missing_metrics_never_match():
+    frame = pd.DataFrame({"x": [1.0, 3.0, np.nan], "y": [1.0, 1.0, 1.0]})
+    assert _mask("x > 2", frame).tolist() == [False, True, False]
+    assert _mask("not x > 2", frame).tolist() == [True, False, False]
+    assert _mask("x != 1", frame).tolist() == [False, True, False]
+    assert _mask("not not x > 2", frame).tolist() == [False, True, False]
+    # Three-valued and / or: false and unknown is false, true or unknown is true
+    assert _mask("not (x > 2 and y > 5)", frame).tolist() == [True, True, True]
+    assert _mask("x > 2 or y > 0", frame).tolist() == [True, True, True]
+    assert _mask("not (x > 2 or y > 5)", frame).tolist() == [True, False, False]
+
+
+@pytest.fixture
+def store(tmp_path):
+    pytest.importorskip("pyarrow")
+    return MetricStore(str(tmp_path / "store"))
+
+
+def _metrics(n: int = 300, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame(
+        {
+            "t_Monday": rng.normal(0, 2, n),
+            "vol_1y": rng.uniform(5, 80, n),
+            "avg_volume": rng.lognormal(13, 2, n),
+        },
+        index=[f"T{i:03d}" for i in range(n)],
+    )
+    frame.iloc[::17, 0] = np.nan
+    frame.iloc[5, 1] = 30.0  # exact bound
+    return frame
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "t_Monday > 2",
+        "t_Monday >= 0 and vol_1y <= 30%",
+        "vol_1y == 30",
+        "2 > t_Monday",
+        "not t_Monday < 1 or avg_volume > 1M",
+        "t_Monday != 0 and abs(t_Monday) * 10 > vol_1y",
+    ],
+)
+def test_indexed_screen_matches_brute_force(store, expr):
+    metrics = _metrics()
+    for ticker, row in metrics.iterrows():
+        store.add(ticker, row.to_dict(), "2024-06-28")
+    store.flush()
+    result = store.screen(expr)
+    expected = metrics.index[_mask(expr, metrics)]
+    assert list(result.index) == list(expected)
+    assert (result.asof_date == "2024-06-28").all()
+
+
+def test_latest_rows_stand_in_for_missing_tickers(store):
+    store.add("AAA", {"x": 1.0}, "2024-06-20")
+    store.add("BBB", {"x": 2.0}, "2024-06-26")
+    store.add("CCC", {"x": 9.0}, "2024-06-26")
+    store.add("AAA", {"x": 3.0}, "2024-06-28")
+    store.add("CCC", {"x": 4.0}, "2024-06-28")
+    store.flush()
+
+    result = store.screen("x > 0")
+    assert result["x"].to_dict() == {"AAA": 3.0, "BBB": 2.0, "CCC": 4.0}
+    assert result["asof_date"].to_dict() == {
+        "AAA": "2024-06-28",
+        "BBB": "2024-06-26",
+        "CCC": "2024-06-28",
+    }
+    assert list(store.screen("x > 0", max_age=0).index) == ["AAA", "CCC"]
+    assert list(store.screen("x > 0", max_age=1).index) == ["AAA", "CCC"]
+    assert list(store.screen("x > 0", max_age=2).index) == ["AAA", "BBB", "CCC"]
+    # An earlier as-of only sees rows up to it
+    earlier = store.screen("x > 0", asof="2024-06-27", max_age=None)
+    assert earlier["x"].to_dict() == {"AAA": 1.0, "BBB": 2.0, "CCC": 9.0}
+
+
+def test_unknown_metric_lists_the_available_ones(store):
+    store.add("AAA", {"x": 1.0}, "2024-06-28")
+    store.flush()
+    with pytest.raises(ValueError, match="Unknown metric.*Available: x"):
+        store.screen("y > 1")
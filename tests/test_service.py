@@ -0,0 +1,112 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vibequant.service import SeasonalityService, make_server
+from vibequant.wrappers.vibes import VibeFrame
+
+
+def _frame(seed: int) -> VibeFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2020-01-01", periods=500, name="Date")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(index))))
+    return VibeFrame(pd.DataFrame({"Open": close * 0.999, "Close": close}, index=index))
+
+
+@pytest.fixture
+def served():
+    service = SeasonalityService(views=["W"])
+    service.add("AAA", _frame(0))
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield service, f"http://{host}:{port}"
+    server.shutdown()
+    server.server_close()
+
+
+def _get(url: str, etag: str = None):
+    request = urllib.request.Request(url, headers={"If-None-Match": etag} if etag else {})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, dict(response.headers), response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), e.read()
+
+
+def test_seasonality_returns_the_view(served):
+    _, base = served
+    status, headers, body = _get(f"{base}/seasonality/AAA?view=W")
+    assert status == 200
+    assert headers["Content-Type"] == "application/json"
+    assert headers["ETag"]
+    payload = json.loads(body)
+    assert payload["view"] == "W" and payload["returns"] == ["Change"]
+    assert len(payload["data"]["index"]) == 5
+
+
+def test_if_none_match_gives_304_until_the_data_changes(served):
+    service, base = served
+    _, headers, _ = _get(f"{base}/seasonality/AAA?view=W")
+    etag = headers["ETag"]
+    status, headers, body = _get(f"{base}/seasonality/AAA?view=W", etag)
+    assert status == 304 and body == b"" and headers["ETag"] == etag
+
+    service.add("AAA", _frame(1))
+    status, headers, _ = _get(f"{base}/seasonality/AAA?view=W", etag)
+    assert status == 200 and headers["ETag"] != etag
+
+
+def test_etag_depends_on_content_not_process(served):
+    _, base = served
+    _, headers, _ = _get(f"{base}/seasonality/AAA?view=W")
+    other = SeasonalityService(views=["W"])
+    other.add("AAA", _frame(0))
+    assert other.seasonality("AAA", "W")[0] == headers["ETag"]
+
+
+def test_plot_is_png(served):
+    _, base = served
+    status, headers, body = _get(f"{base}/plot/AAA.png?view=M")
+    assert status == 200
+    assert headers["Content-Type"] == "image/png"
+    assert body.startswith(b"\x89PNG")
+
+
+def test_bad_view_is_400(served):
+    _, base = served
+    status, _, body = _get(f"{base}/seasonality/AAA?view=XYZ")
+    assert status == 400
+    assert "XYZ" in json.loads(body)["error"]
+
+
+@pytest.mark.parametrize("path", ["/seasonality/ZZZ?view=W", "/nope"])
+def test_unknown_ticker_or_route_is_404(served, path):
+    _, base = served
+    status, _, _ = _get(base + path)
+    assert status == 404
+
+
+def test_concurrent_misses_render_once():
+    calls = []
+    service = SeasonalityService(views=["W"])
+    service.add("AAA", _frame(0))
+    render = service._render_json
+
+    def counting(vf, view):
+        calls.append(view)
+        return render(vf, view)
+
+    service._render_json = counting
+    threads = [threading.Thread(target=service.seasonality, args=("AAA", "W")) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert calls == ["W"]
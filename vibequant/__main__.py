@@ -0,0 +1,5 @@
+import sys
+
+from vibequant.cli import main
+
+sys.exit(main())
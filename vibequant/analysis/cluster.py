@@ -0,0 +1,175 @@
+from typing import Any, Dict, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from scipy.cluster.hierarchy import fcluster, linkage
+
+from vibequant.analysis.matrix import to_matrix
+from vibequant.analysis.simulate import VIEW_KEYS, calendar_codes
+from vibequant.analysis.stability import calendar_frame, cell_moments
+
+METHODS = ("kmeans", "ward")
+
+
+def seasonal_features(
+    data: Union[pd.DataFrame, Dict[str, Any]],
+    views: Sequence[str] = ("W", "M"),
+    col: str = "Change",
+    demean: bool = True,
+    min_obs: int = 250,
+) -> pd.DataFrame:
+    """
+    Ticker x seasonal-feature matrix: every ticker's view means side by side.
+
+    All tickers are reduced together: calendar codes come from the shared date index
+    and each view is one bincount over the whole return matrix.
+
+    Args:
+        data (pd.DataFrame or dict): Date x ticker returns, or ticker -> VibeFrame/DataFrame
+            (then `col` is taken from each frame).
+        views (list): View types from VIEW_KEYS ("W", "M", "D", "WM").
+        col (str): Return column when `data` is a dict of frames.
+        demean (bool): Subtract each ticker's overall mean, so profiles compare shapes
+            rather than drifts.
+        min_obs (int): Drop tickers with fewer observations.
+
+    Returns:
+        pd.DataFrame: One row per ticker, (view, group) columns in calendar order.
+    """
+    returns = to_matrix(data, col) if isinstance(data, dict) else data
+    returns = returns.loc[:, returns.count() >= min_obs]
+    if returns.shape[1] == 0:
+        raise ValueError(f"No ticker has at least {min_obs} observations.")
+    unknown = [v for v in views if v not in VIEW_KEYS]
+    if unknown:
+        raise ValueError(f"Unknown view(s) {unknown}. Available views: {', '.join(VIEW_KEYS)}")
+    calendar = calendar_frame(pd.DatetimeIndex(returns.index))
+    values = returns.to_numpy(dtype=np.float64)
+    overall = np.nanmean(values, axis=0) if demean else 0.0
+    blocks, columns = [], []
+    for view in views:
+        codes, labels = calendar_codes(calendar, VIEW_KEYS[view])
+        sums, _, counts = cell_moments(values, codes, len(labels))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            blocks.append((sums / counts - overall).T)
+        flat = [v if not isinstance(v, tuple) else "/".join(map(str, v)) for v in labels]
+        columns += [(view, v) for v in flat]
+    return pd.DataFrame(
+        np.hstack(blocks),
+        index=returns.columns,
+        columns=pd.MultiIndex.from_tuples(columns, names=["View", "Group"]),
+    )
+
+
+def kmeans(
+    X: np.ndarray, k: int, n_init: int = 10, max_iter: int = 100, tol: float = 1e-8, seed=0
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Lloyd's k-means with k-means++ seeding, all `n_init` restarts run together as one
+    batch of array operations.
+
+    Args:
+        X (np.ndarray): (n, d) points.
+        k (int): Number of clusters.
+        n_init (int): Restarts; the one with the lowest inertia wins.
+        max_iter (int): Iteration cap.
+        tol (float): Stop when no center moves by more than this (squared).
+        seed: Seed or np.random.Generator.
+
+    Returns:
+        Tuple: (n,) labels, (k, d) centers and the inertia (sum of squared distances).
+    """
+    n, d = X.shape
+    if not 1 <= k <= n:
+        raise ValueError("k must be between 1 and the number of points.")
+    rng = np.random.default_rng(seed)
+    xx = (X * X).sum(axis=1)
+
+    def sq_dist(centers: np.ndarray) -> np.ndarray:
+        # (runs, n, k) squared distances
+        cc = (centers * centers).sum(axis=-1)
+        return np.maximum(xx[None, :, None] - 2 * X @ centers.transpose(0, 2, 1) + cc[:, None, :], 0)
+
+    centers = np.empty((n_init, k, d))
+    centers[:, 0] = X[rng.integers(0, n, n_init)]
+    closest = sq_dist(centers[:, :1])[..., 0]
+    for j in range(1, k):
+        weights = closest / closest.sum(axis=1, keepdims=True)
+        pick = (weights.cumsum(axis=1) < rng.random((n_init, 1))).sum(axis=1)
+        centers[:, j] = X[np.minimum(pick, n - 1)]
+        closest = np.minimum(closest, sq_dist(centers[:, j : j + 1])[..., 0])
+
+    for _ in range(max_iter):
+        labels = sq_dist(centers).argmin(axis=-1)
+        onehot = labels[..., None] == np.arange(k)
+        counts = onehot.sum(axis=1)
+        sums = np.einsum("rnk,nd->rkd", onehot, X)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            updated = sums / counts[..., None]
+        # An emptied cluster keeps its previous center
+        updated = np.where(counts[..., None] > 0, updated, centers)
+        shift = ((updated - centers) ** 2).sum(axis=-1).max()
+        centers = updated
+        if shift <= tol:
+            break
+    dist = sq_dist(centers)
+    labels = dist.argmin(axis=-1)
+    inertia = dist.min(axis=-1).sum(axis=1)
+    best = int(np.argmin(inertia))
+    return labels[best], centers[best], float(inertia[best])
+
+
+def cluster_profiles(
+    data: Union[pd.DataFrame, Dict[str, Any]],
+    k: int = 6,
+    views: Sequence[str] = ("W", "M"),
+    method: str = "kmeans",
+    col: str = "Change",
+    demean: bool = True,
+    min_obs: int = 250,
+    seed: int = 0,
+    **kwargs,
+) -> Tuple[pd.Series, pd.DataFrame]:
+    """
+    Group tickers with similar seasonal profiles.
+
+    Features (see seasonal_features) are z-scored across tickers so every calendar
+    cell weighs the same; missing cells (e.g. weekends for stocks) count as average.
+
+    Args:
+        data (pd.DataFrame or dict): Date x ticker returns, or ticker -> VibeFrame/DataFrame.
+        k (int): Number of clusters.
+        views (list): View types ("W", "M", "D", "WM").
+        method (str): "kmeans" (batched restarts) or "ward" (hierarchical).
+        col (str): Return column when `data` is a dict of frames.
+        demean (bool): Compare profile shapes rather than drifts.
+        min_obs (int): Drop tickers with fewer observations.
+        seed (int): Seed for k-means.
+        **kwargs: kmeans options (n_init, max_iter, tol).
+
+    Returns:
+        Tuple[pd.Series, pd.DataFrame]: Cluster of every ticker (0 = largest cluster),
+            and the centroid profiles in return units, one row per cluster
+            (labels.value_counts() gives the sizes).
+    """
+    features = seasonal_features(data, views, col, demean, min_obs)
+    X = features.to_numpy()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        Z = (X - np.nanmean(X, axis=0)) / np.nanstd(X, axis=0)
+    Z = np.nan_to_num(Z, nan=0.0, posinf=0.0, neginf=0.0)
+    k = min(k, len(Z))
+    if method == "kmeans":
+        labels, _, _ = kmeans(Z, k, seed=seed, **kwargs)
+    elif method == "ward":
+        labels = fcluster(linkage(Z, method="ward"), k, criterion="maxclust") - 1
+    else:
+        raise ValueError(f"Unknown method '{method}'. Available methods: {', '.join(METHODS)}")
+    # Number clusters by size so results read the same across runs and methods
+    sizes = np.bincount(labels, minlength=labels.max() + 1)
+    rank = np.empty_like(sizes)
+    rank[np.argsort(-sizes, kind="stable")] = np.arange(len(sizes))
+    labels = rank[labels]
+    assigned = pd.Series(labels, index=features.index, name="Cluster")
+    centroids = features.groupby(labels).mean()
+    centroids.index.name = "Cluster"
+    return assigned, centroids
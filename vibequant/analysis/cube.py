@@ -0,0 +1,290 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from vibequant.analysis.stability import cell_moments
+
+_WEEKDAY_ORDER = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+DimSpec = Union[str, Callable[[pd.DataFrame], Any]]
+
+
+def vol_regime(
+    df: pd.DataFrame,
+    col: str = "Change",
+    window: int = 20,
+    bins: int = 2,
+    min_periods: Optional[int] = None,
+) -> pd.Series:
+    """
+    Volatility regime: trailing `window`-row std of `col` at the previous row, split into
+    `bins` buckets ("low"/"high" for 2, "q1".."qN" otherwise) by the expanding quantiles
+    of its history, so a row's label only uses data known before it and appending rows
+    never relabels earlier ones. Rows before `min_periods` volatility values (default
+    5 * window) are unlabeled.
+    """
+    vol = df[col].rolling(window).std().shift(1)
+    labels = ["low", "high"] if bins == 2 else [f"q{i + 1}" for i in range(bins)]
+    history = vol.expanding(min_periods or 5 * window)
+    edges = np.column_stack([history.quantile(i / bins).to_numpy() for i in range(1, bins)])
+    # Right-closed buckets, like pd.qcut
+    bucket = (vol.to_numpy()[:, None] > edges).sum(axis=1)
+    known = vol.notna().to_numpy() & ~np.isnan(edges).any(axis=1)
+    out = pd.Series(np.asarray(labels, dtype=object)[bucket], index=df.index, dtype=object)
+    return out.where(known)
+
+
+def ma_regime(df: pd.DataFrame, window: int = 200, price: str = "Close") -> pd.Series:
+    """
+    "above" / "below" the `window`-row moving average at the previous close.
+    """
+    close = df[price]
+    above = (close > close.rolling(window).mean()).shift(1)
+    labels = np.where(above.astype(bool), "above", "below")
+    out = pd.Series(labels, index=df.index, dtype=object)
+    return out.where(close.rolling(window).count().shift(1) >= window)
+
+
+def bull_regime(df: pd.DataFrame, threshold: float = 0.2, price: str = "Close") -> pd.Series:
+    """
+    "bear" while the previous close is more than `threshold` below its running peak,
+    "bull" otherwise.
+    """
+    close = df[price]
+    drawdown = (close / close.cummax() - 1).shift(1)
+    labels = np.where(drawdown < -threshold, "bear", "bull")
+    out = pd.Series(labels, index=df.index, dtype=object)
+    return out.where(drawdown.notna())
+
+
+# Built-in regime dimensions, usable by name
+REGIMES: Dict[str, Callable[[pd.DataFrame], pd.Series]] = {
+    "Vol": vol_regime,
+    "MA200": ma_regime,
+    "Bull": bull_regime,
+}
+
+
+def _labels(df: pd.DataFrame, name: str, spec: DimSpec) -> pd.Series:
+    if callable(spec):
+        values = spec(df)
+    elif spec == "Year":
+        if not isinstance(df.index, pd.DatetimeIndex):
+            raise ValueError("The 'Year' dimension needs a DatetimeIndex.")
+        values = df.index.year
+    elif spec in df.columns:
+        values = df[spec]
+    elif spec in REGIMES:
+        values = REGIMES[spec](df)
+    else:
+        raise ValueError(
+            f"Unknown dimension '{spec}': not a column, 'Year' or one of {', '.join(REGIMES)}."
+        )
+    values = pd.Series(np.asarray(values, dtype=object), index=df.index)
+    if len(values) != len(df):
+        raise ValueError(f"Dimension '{name}' has {len(values)} labels for {len(df)} rows.")
+    return values
+
+
+def _factorize(values: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    present = values.dropna().unique()
+    if set(present) <= set(_WEEKDAY_ORDER):
+        levels = [d for d in _WEEKDAY_ORDER if d in set(present)]
+    else:
+        try:
+            levels = sorted(present)
+        except TypeError:
+            levels = sorted(present, key=str)
+    index = pd.Index(levels)
+    return index.get_indexer(values), index
+
+
+class MomentCube:
+    """
+    Sums, sums of squares and counts of return columns over the product of several
+    categorical dimensions (calendar keys, years, regimes), built in one pass over the
+    rows. Any conditional view or regime contrast is then a sum over the cube's axes,
+    without going back to the rows.
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        dims: Union[Sequence[DimSpec], Dict[str, DimSpec]],
+        cols: Union[str, List[str]] = "Change",
+    ) -> None:
+        """
+        Args:
+            df (pd.DataFrame): Rows with a DatetimeIndex and the return columns.
+            dims (list or dict): Dimensions: column names (e.g. "Weekday", a precomputed
+                regime label column), "Year", built-in regimes from REGIMES ("Vol",
+                "MA200", "Bull") or callables df -> labels; a dict names them. Rows with
+                a missing label in any dimension are left out.
+            cols (str or list): Return columns to accumulate.
+        """
+        if not isinstance(dims, dict):
+            dims = {
+                d if isinstance(d, str) else getattr(d, "__name__", f"dim{i}"): d
+                for i, d in enumerate(dims)
+            }
+        if not dims:
+            raise ValueError("MomentCube needs at least one dimension.")
+        self.cols = [cols] if isinstance(cols, str) else list(cols)
+        missing = [c for c in self.cols if c not in df.columns]
+        if missing:
+            raise ValueError(f"Column(s) not found: {', '.join(missing)}.")
+        codes, self.levels = [], {}
+        for name, spec in dims.items():
+            c, levels = _factorize(_labels(df, name, spec))
+            codes.append(c)
+            self.levels[name] = levels
+        self.dims: List[str] = list(dims)
+        shape = tuple(len(self.levels[d]) for d in self.dims)
+        codes = np.stack(codes)
+        keep = (codes >= 0).all(axis=0)
+        flat = np.ravel_multi_index(codes[:, keep], shape)
+        values = df[self.cols].to_numpy(dtype=np.float64)[keep]
+        sums, sumsq, counts = cell_moments(values, flat, int(np.prod(shape)))
+        full = shape + (len(self.cols),)
+        self.sums = sums.reshape(full)
+        self.sumsq = sumsq.reshape(full)
+        self.counts = counts.reshape(full)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.sums.shape
+
+    def __repr__(self) -> str:
+        dims = ", ".join(f"{d}={len(self.levels[d])}" for d in self.dims)
+        return f"MomentCube({dims}; cols={self.cols})"
+
+    def _reduce(
+        self, by: Sequence[str], where: Optional[Dict[str, Any]], col: Optional[str]
+    ) -> Tuple[Tuple[np.ndarray, np.ndarray, np.ndarray], pd.Index]:
+        unknown = [d for d in list(by) + list(where or {}) if d not in self.levels]
+        if unknown:
+            raise ValueError(
+                f"Unknown dimension(s) {unknown}. Dimensions: {', '.join(self.dims)}"
+            )
+        col = col or self.cols[0]
+        if col not in self.cols:
+            raise ValueError(f"Column '{col}' is not in the cube.")
+        k = self.cols.index(col)
+        arrays = [self.sums[..., k], self.sumsq[..., k], self.counts[..., k]]
+        index = [slice(None)] * len(self.dims)
+        levels = dict(self.levels)
+        for dim, value in (where or {}).items():
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            pos = self.levels[dim].get_indexer(list(values))
+            if (pos < 0).any():
+                raise ValueError(f"Unknown level(s) of '{dim}': {value}.")
+            index[self.dims.index(dim)] = pos
+            levels[dim] = self.levels[dim][pos]
+        for axis, ix in enumerate(index):
+            if not isinstance(ix, slice):
+                arrays = [a.take(ix, axis=axis) for a in arrays]
+        # Sum out the dimensions not asked for, then order the axes as `by`
+        other = tuple(i for i, d in enumerate(self.dims) if d not in by)
+        arrays = [a.sum(axis=other) for a in arrays]
+        kept = [d for d in self.dims if d in by]
+        perm = [kept.index(d) for d in by]
+        if len(by) == 1:
+            cells = pd.Index(levels[by[0]], name=by[0])
+        else:
+            cells = pd.MultiIndex.from_product([levels[d] for d in by], names=list(by))
+        return tuple(a.transpose(perm) for a in arrays), cells
+
+    def stats(
+        self,
+        by: Union[str, Sequence[str]],
+        where: Optional[Dict[str, Any]] = None,
+        col: Optional[str] = None,
+        min_count: int = 1,
+    ) -> pd.DataFrame:
+        """
+        Mean, std, count and t-stat of a return by some dimensions, optionally within
+        chosen levels of others.
+
+        Args:
+            by (str or list): Dimensions to keep, e.g. ["Vol", "Weekday"].
+            where (dict, optional): Levels to condition on, e.g. {"MA200": "above"} or
+                {"Month": [11, 12, 1]}.
+            col (str, optional): Return column. Defaults to the first one.
+            min_count (int): Cells with fewer observations are dropped.
+
+        Returns:
+            pd.DataFrame: Indexed by the `by` levels with mean, std, count and t_stat.
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        (s, ss, n), cells = self._reduce(by, where, col)
+        s, ss, n = s.ravel(), ss.ravel(), n.ravel()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = s / n
+            std = np.sqrt(np.maximum(ss - n * mean * mean, 0) / (n - 1))
+            t_stat = mean / (std / np.sqrt(n))
+        out = pd.DataFrame(
+            {"mean": mean, "std": std, "count": n.astype(np.int64), "t_stat": t_stat},
+            index=cells,
+        )
+        return out[out["count"] >= max(min_count, 1)]
+
+    def view(
+        self,
+        rows: Union[str, Sequence[str]],
+        columns: Union[str, Sequence[str]],
+        where: Optional[Dict[str, Any]] = None,
+        col: Optional[str] = None,
+        stat: str = "mean",
+    ) -> pd.DataFrame:
+        """
+        A pivoted view, e.g. view("Month", "Weekday", where={"Vol": "high"}) is the DWM-style
+        Month x Weekday table restricted to high-volatility days.
+
+        Returns:
+            pd.DataFrame: `stat` ("mean", "std", "count" or "t_stat") with `rows` levels as
+                the index and `columns` levels as the columns.
+        """
+        rows = [rows] if isinstance(rows, str) else list(rows)
+        columns = [columns] if isinstance(columns, str) else list(columns)
+        table = self.stats(rows + columns, where, col)[stat]
+        # unstack sorts the labels; put them back in level order (Monday first)
+        return table.unstack(columns).reindex(
+            index=table.index.droplevel(columns).unique(),
+            columns=table.index.droplevel(rows).unique(),
+        )
+
+    def contrast(
+        self,
+        dim: str,
+        a: Any,
+        b: Any,
+        by: Union[str, Sequence[str]] = "Weekday",
+        where: Optional[Dict[str, Any]] = None,
+        col: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Difference of means between two levels of a dimension, per cell of `by`, with a
+        Welch t-test, e.g. contrast("Vol", "high", "low", by="Weekday").
+
+        Returns:
+            pd.DataFrame: Indexed by the `by` levels with mean_a, mean_b, diff, t_stat,
+                count_a and count_b.
+        """
+        if dim in ([by] if isinstance(by, str) else list(by)):
+            raise ValueError("The contrasted dimension cannot also be in `by`.")
+        sa = self.stats(by, {**(where or {}), dim: a}, col, min_count=0)
+        sb = self.stats(by, {**(where or {}), dim: b}, col, min_count=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            se = np.sqrt(sa["std"] ** 2 / sa["count"] + sb["std"] ** 2 / sb["count"])
+            diff = sa["mean"] - sb["mean"]
+            return pd.DataFrame(
+                {
+                    "mean_a": sa["mean"],
+                    "mean_b": sb["mean"],
+                    "diff": diff,
+                    "t_stat": diff / se,
+                    "count_a": sa["count"],
+                    "count_b": sb["count"],
+                }
+            )
@@ -0,0 +1,196 @@
+import warnings
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.stats import norm
+from typing import Dict, Optional, Sequence, Union
+
+Events = Union[Sequence, pd.DatetimeIndex, Dict[str, Sequence]]
+
+
+def event_positions(index: pd.DatetimeIndex, dates: Sequence) -> np.ndarray:
+    """
+    Row positions of event dates, rolled forward to the next available row.
+    Events outside the index range are dropped.
+
+    Args:
+        index (pd.DatetimeIndex): Sorted row index.
+        dates (list): Event dates.
+
+    Returns:
+        np.ndarray: Integer positions, one per kept event.
+    """
+    dates = pd.DatetimeIndex(pd.to_datetime(list(dates)))
+    if index.tz is not None and dates.tz is None:
+        dates = dates.tz_localize(index.tz)
+    if len(index) == 0:
+        return np.empty(0, dtype=np.intp)
+    pos = index.searchsorted(dates, side="left")
+    return pos[(pos < len(index)) & (dates >= index[0])]
+
+
+def event_windows(
+    values: np.ndarray,
+    positions: np.ndarray,
+    before: int,
+    after: int,
+    columns: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Extract [pos - before, pos + after] windows for all events at once.
+
+    Works on a NaN-padded strided view, so rows outside the data come back as NaN.
+
+    Args:
+        values (np.ndarray): (n_rows,) or (n_rows, n_series) array.
+        positions (np.ndarray): Event row positions.
+        before (int): Rows before each event.
+        after (int): Rows after each event.
+        columns (np.ndarray, optional): Series of every event in a 2-D `values`; only
+            those windows are gathered.
+
+    Returns:
+        np.ndarray: (n_events, before + after + 1), or (n_events, n_series,
+            before + after + 1) for 2-D `values` without `columns`.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    pad = [(before, after)] + [(0, 0)] * (values.ndim - 1)
+    padded = np.pad(values, pad, constant_values=np.nan)
+    windows = sliding_window_view(padded, before + after + 1, axis=0)
+    positions = np.asarray(positions, dtype=np.intp)
+    if columns is not None:
+        return windows[positions, np.asarray(columns, dtype=np.intp)]
+    return windows[positions]
+
+
+def _abnormal(
+    win: np.ndarray, bench: Optional[np.ndarray], model: str, estimation: int
+) -> np.ndarray:
+    """
+    Abnormal returns of (n, estimation + 2k + 1) windows; the first `estimation`
+    columns are the estimation period.
+    """
+    est, evt = win[:, :estimation], win[:, estimation:]
+    if model == "raw":
+        return evt
+    if model == "mean":
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # no estimation data
+            mu = np.nanmean(est, axis=1, keepdims=True)
+        return evt - mu
+    if model == "market":
+        if bench is None:
+            raise ValueError("model='market' requires a benchmark.")
+        b_est, b_evt = bench[:, :estimation], bench[:, estimation:]
+        mask = ~(np.isnan(est) | np.isnan(b_est))
+        n = mask.sum(axis=1, keepdims=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            x_mean = np.where(mask, b_est, 0).sum(axis=1, keepdims=True) / n
+            y_mean = np.where(mask, est, 0).sum(axis=1, keepdims=True) / n
+            dx = np.where(mask, b_est - x_mean, 0)
+            dy = np.where(mask, est - y_mean, 0)
+            beta = (dx * dy).sum(axis=1, keepdims=True) / (dx * dx).sum(
+                axis=1, keepdims=True
+            )
+        alpha = y_mean - beta * x_mean
+        return evt - (alpha + beta * b_evt)
+    raise ValueError(f"Unknown model '{model}'. Use 'raw', 'mean' or 'market'.")
+
+
+def event_study(
+    returns: Union[pd.Series, pd.DataFrame],
+    events: Events,
+    window: int = 5,
+    model: str = "mean",
+    estimation: int = 60,
+    benchmark: Optional[pd.Series] = None,
+    confidence: float = 0.95,
+) -> pd.DataFrame:
+    """
+    Average and cumulative abnormal returns around event dates, for one or many tickers.
+
+    All [-window, +window] windows (plus the estimation period before them) are
+    pulled out at once through index arithmetic on a strided view of the return
+    matrix, so cost does not grow with per-event slicing.
+
+    Args:
+        returns (pd.Series or pd.DataFrame): Returns with a sorted DatetimeIndex;
+            a DataFrame holds one column per ticker.
+        events (list or dict): Event dates shared by every ticker, or ticker -> dates.
+        window (int): Rows on each side of the event.
+        model (str): Expected-return model: "raw" (zero), "mean" (estimation-period
+            mean) or "market" (estimation-period regression on benchmark).
+        estimation (int): Rows before the window used to fit the model.
+        benchmark (pd.Series, optional): Market returns for model="market".
+        confidence (float): Confidence level of the bands.
+
+    Returns:
+        pd.DataFrame: Indexed by offset (-window..window) with AAR, AAR_lo, AAR_hi,
+            AAR_t, CAAR, CAAR_lo, CAAR_hi and N (events contributing at each offset).
+    """
+    if isinstance(returns, pd.Series):
+        returns = returns.to_frame(returns.name or "returns")
+    if not isinstance(returns.index, pd.DatetimeIndex):
+        raise ValueError("Event study needs a DatetimeIndex.")
+    returns = returns.sort_index()
+    index = returns.index
+    values = returns.to_numpy(dtype=np.float64)
+    bench = None
+    if benchmark is not None:
+        bench = benchmark.reindex(index).to_numpy(dtype=np.float64)
+    before = window + (estimation if model != "raw" else 0)
+    est = before - window
+
+    if isinstance(events, dict):
+        # Per-ticker events: gather (row, column) pairs directly
+        cols = {c: i for i, c in enumerate(returns.columns)}
+        pos, col_idx = [], []
+        for ticker, dates in events.items():
+            if ticker in cols:
+                p = event_positions(index, dates)
+                pos.append(p)
+                col_idx.append(np.full(len(p), cols[ticker]))
+        pos = np.concatenate(pos) if pos else np.empty(0, dtype=np.intp)
+        col_idx = np.concatenate(col_idx) if col_idx else np.empty(0, dtype=np.intp)
+        win = event_windows(values, pos, before, window, col_idx)
+        bwin = event_windows(bench, pos, before, window) if bench is not None else None
+    else:
+        pos = event_positions(index, events)
+        win = event_windows(values, pos, before, window)  # (E, T, L)
+        win = win.reshape(-1, win.shape[-1])
+        bwin = None
+        if bench is not None:
+            bwin = np.repeat(
+                event_windows(bench, pos, before, window), values.shape[1], axis=0
+            )
+
+    ar = _abnormal(win, bwin, model, est)
+    missing = np.isnan(ar)
+    car = np.where(missing, np.nan, np.nancumsum(ar, axis=1))
+    z = norm.ppf(0.5 + confidence / 2)
+
+    def band(x: np.ndarray):
+        n = (~np.isnan(x)).sum(axis=0)
+        with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN offsets
+            mean = np.nanmean(x, axis=0)
+            se = np.nanstd(x, axis=0, ddof=1) / np.sqrt(n)
+        return mean, se, n
+
+    aar, aar_se, n = band(ar)
+    caar, caar_se, _ = band(car)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = aar / aar_se
+    return pd.DataFrame(
+        {
+            "AAR": aar,
+            "AAR_lo": aar - z * aar_se,
+            "AAR_hi": aar + z * aar_se,
+            "AAR_t": t,
+            "CAAR": caar,
+            "CAAR_lo": caar - z * caar_se,
+            "CAAR_hi": caar + z * caar_se,
+            "N": n,
+        },
+        index=pd.RangeIndex(-window, window + 1, name="Offset"),
+    )
@@ -0,0 +1,455 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+
+def _ema(x: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Exponential moving average down axis 0, seeded with the first row:
+    y_0 = x_0, y_t = alpha * x_t + (1 - alpha) * y_{t-1} (pandas ewm adjust=False).
+    """
+    y = np.empty_like(x)
+    if len(x) == 0:
+        return y
+    y[0] = x[0]
+    if len(x) > 1:
+        y[1:], _ = lfilter(
+            [alpha], [1.0, alpha - 1.0], x[1:], axis=0, zi=((1.0 - alpha) * x[:1])
+        )
+    return y
+
+
+def _blend(first: np.ndarray, x: np.ndarray, prev: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    One EMA step: x where `first`, otherwise alpha * x + (1 - alpha) * prev.
+    """
+    return np.where(first, x, alpha * x + (1.0 - alpha) * prev)
+
+
+def _rsi(gain: np.ndarray, loss: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return 100.0 * gain / (gain + loss)
+
+
+class Indicator(ABC):
+    """
+    Base class for an indicator computed over a block of tickers.
+
+    Subclasses implement batch() for a (rows, tickers) block without gaps, returning
+    the output columns and the recursive state after the last row, and step() for
+    one new bar per ticker, which advances that state in O(1).
+    """
+
+    inputs: Tuple[str, ...] = ("Close",)
+
+    def __init__(self) -> None:
+        self.columns: List[str] = []
+        # Observations a ticker needs before each column is defined
+        self.warmup: Dict[str, int] = {}
+
+    @abstractmethod
+    def init_state(self, n: int) -> Dict[str, np.ndarray]:
+        pass
+
+    @abstractmethod
+    def batch(self, *x: np.ndarray) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        pass
+
+    @abstractmethod
+    def step(self, state: Dict[str, np.ndarray], count: np.ndarray, *x: np.ndarray) -> Dict[str, np.ndarray]:
+        pass
+
+
+class EMA(Indicator):
+    def __init__(self, period: int = 20) -> None:
+        super().__init__()
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.columns = [f"EMA_{period}"]
+        self.warmup = {self.columns[0]: period}
+
+    def init_state(self, n):
+        return {"ema": np.full(n, np.nan)}
+
+    def batch(self, close):
+        ema = _ema(close, self.alpha)
+        return {self.columns[0]: ema}, {"ema": ema[-1]}
+
+    def step(self, state, count, close):
+        state["ema"] = _blend(count == 0, close, state["ema"], self.alpha)
+        return {self.columns[0]: state["ema"]}
+
+
+class SMA(Indicator):
+    """
+    Rolling mean (and population standard deviation) over the last `period` bars.
+    Updates keep a ring buffer plus a sliding Welford mean/M2, so each bar is O(1).
+    """
+
+    def __init__(self, period: int = 20) -> None:
+        super().__init__()
+        self.period = period
+        self.columns = [f"SMA_{period}"]
+        self.warmup = {self.columns[0]: period}
+
+    def init_state(self, n):
+        return {
+            "buf": np.full((self.period, n), np.nan),
+            "pos": np.zeros(n, dtype=np.int64),
+            "mean": np.full(n, np.nan),
+            "m2": np.zeros(n),
+        }
+
+    def _rolling(self, close):
+        n = self.period
+        mean = np.full_like(close, np.nan)
+        std = np.full_like(close, np.nan)
+        if len(close) >= n:
+            # Centre each column first so the windowed sum of squares keeps its precision
+            mu = close.mean(axis=0)
+            c = close - mu
+            zero = np.zeros((1,) + c.shape[1:])
+            s1 = np.concatenate([zero, np.cumsum(c, axis=0)])
+            s2 = np.concatenate([zero, np.cumsum(c * c, axis=0)])
+            m = (s1[n:] - s1[:-n]) / n
+            var = (s2[n:] - s2[:-n]) / n - m * m
+            mean[n - 1 :] = m + mu
+            std[n - 1 :] = np.sqrt(np.maximum(var, 0.0))
+        last = close[-n:]
+        buf = np.full((n,) + close.shape[1:], np.nan)
+        buf[: len(last)] = last
+        mu = last.mean(axis=0)
+        state = {
+            "buf": buf,
+            "pos": np.full(close.shape[1:], len(last) % n, dtype=np.int64),
+            "mean": mu,
+            "m2": ((last - mu) ** 2).sum(axis=0),
+        }
+        return mean, std, state
+
+    def _advance(self, state, count, close):
+        n = self.period
+        cols = np.arange(len(close))
+        full = count >= n
+        old = state["buf"][state["pos"], cols]
+        prev = np.where(count == 0, close, state["mean"])
+        # Growing window: Welford add; full window: replace the oldest value
+        k = np.where(full, n, count + 1)
+        delta = np.where(full, close - old, close - prev)
+        mean = prev + delta / k
+        m2 = state["m2"] + np.where(
+            full, delta * (close - mean + old - prev), delta * (close - mean)
+        )
+        state["buf"][state["pos"], cols] = close
+        state["pos"] = (state["pos"] + 1) % n
+        state["mean"] = mean
+        state["m2"] = np.maximum(m2, 0.0)
+        return mean, np.sqrt(state["m2"] / n)
+
+    def batch(self, close):
+        mean, _, state = self._rolling(close)
+        return {self.columns[0]: mean}, state
+
+    def step(self, state, count, close):
+        mean, _ = self._advance(state, count, close)
+        return {self.columns[0]: mean}
+
+
+class Bollinger(SMA):
+    def __init__(self, period: int = 20, width: float = 2.0) -> None:
+        super().__init__(period)
+        self.width = width
+        tag = f"{period}_{width:g}"
+        self.columns = [f"BBL_{tag}", f"BBM_{tag}", f"BBU_{tag}"]
+        self.warmup = {c: period for c in self.columns}
+
+    def _bands(self, mean, std):
+        lower, mid, upper = self.columns
+        return {lower: mean - self.width * std, mid: mean, upper: mean + self.width * std}
+
+    def batch(self, close):
+        mean, std, state = self._rolling(close)
+        return self._bands(mean, std), state
+
+    def step(self, state, count, close):
+        return self._bands(*self._advance(state, count, close))
+
+
+class RSI(Indicator):
+    """
+    Relative strength index with Wilder smoothing (alpha = 1 / period).
+    """
+
+    def __init__(self, period: int = 14) -> None:
+        super().__init__()
+        self.period = period
+        self.alpha = 1.0 / period
+        self.columns = [f"RSI_{period}"]
+        self.warmup = {self.columns[0]: period + 1}
+
+    def init_state(self, n):
+        return {"prev": np.full(n, np.nan), "gain": np.full(n, np.nan), "loss": np.full(n, np.nan)}
+
+    def batch(self, close):
+        delta = np.diff(close, axis=0)
+        gain = _ema(np.maximum(delta, 0.0), self.alpha)
+        loss = _ema(np.maximum(-delta, 0.0), self.alpha)
+        rsi = np.full_like(close, np.nan)
+        rsi[1:] = _rsi(gain, loss)
+        state = {"prev": close[-1]}
+        nan = np.full(close.shape[1:], np.nan)
+        state["gain"] = gain[-1] if len(gain) else nan
+        state["loss"] = loss[-1] if len(loss) else nan
+        return {self.columns[0]: rsi}, state
+
+    def step(self, state, count, close):
+        delta = close - state["prev"]
+        first = count == 1
+        gain = _blend(first, np.maximum(delta, 0.0), state["gain"], self.alpha)
+        loss = _blend(first, np.maximum(-delta, 0.0), state["loss"], self.alpha)
+        state["gain"] = np.where(count == 0, np.nan, gain)
+        state["loss"] = np.where(count == 0, np.nan, loss)
+        state["prev"] = close
+        return {self.columns[0]: _rsi(state["gain"], state["loss"])}
+
+
+class ATR(Indicator):
+    """
+    Average true range with Wilder smoothing; the first bar's true range is high - low.
+    """
+
+    inputs = ("High", "Low", "Close")
+
+    def __init__(self, period: int = 14) -> None:
+        super().__init__()
+        self.period = period
+        self.alpha = 1.0 / period
+        self.columns = [f"ATR_{period}"]
+        self.warmup = {self.columns[0]: period}
+
+    def init_state(self, n):
+        return {"prev": np.full(n, np.nan), "atr": np.full(n, np.nan)}
+
+    def batch(self, high, low, close):
+        tr = high - low
+        pc = close[:-1]
+        tr[1:] = np.maximum.reduce([tr[1:], np.abs(high[1:] - pc), np.abs(low[1:] - pc)])
+        atr = _ema(tr, self.alpha)
+        return {self.columns[0]: atr}, {"prev": close[-1], "atr": atr[-1]}
+
+    def step(self, state, count, high, low, close):
+        pc = state["prev"]
+        first = count == 0
+        tr = high - low
+        tr = np.where(first, tr, np.maximum.reduce([tr, np.abs(high - pc), np.abs(low - pc)]))
+        state["atr"] = _blend(first, tr, state["atr"], self.alpha)
+        state["prev"] = close
+        return {self.columns[0]: state["atr"]}
+
+
+class MACD(Indicator):
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9) -> None:
+        super().__init__()
+        self.alphas = (2.0 / (fast + 1), 2.0 / (slow + 1), 2.0 / (signal + 1))
+        tag = f"{fast}_{slow}_{signal}"
+        self.columns = [f"MACD_{tag}", f"MACDs_{tag}", f"MACDh_{tag}"]
+        self.warmup = dict(zip(self.columns, (slow, slow + signal - 1, slow + signal - 1)))
+
+    def init_state(self, n):
+        return {k: np.full(n, np.nan) for k in ("fast", "slow", "signal")}
+
+    def _outputs(self, macd, signal):
+        return dict(zip(self.columns, (macd, signal, macd - signal)))
+
+    def batch(self, close):
+        af, aslow, asig = self.alphas
+        fast, slow = _ema(close, af), _ema(close, aslow)
+        macd = fast - slow
+        signal = _ema(macd, asig)
+        state = {"fast": fast[-1], "slow": slow[-1], "signal": signal[-1]}
+        return self._outputs(macd, signal), state
+
+    def step(self, state, count, close):
+        af, aslow, asig = self.alphas
+        first = count == 0
+        state["fast"] = _blend(first, close, state["fast"], af)
+        state["slow"] = _blend(first, close, state["slow"], aslow)
+        macd = state["fast"] - state["slow"]
+        state["signal"] = _blend(first, macd, state["signal"], asig)
+        return self._outputs(macd, state["signal"])
+
+
+# Supported indicators: name -> (class, default parameters)
+INDICATORS: Dict[str, tuple] = {
+    "SMA": (SMA, (20,)),
+    "EMA": (EMA, (20,)),
+    "BB": (Bollinger, (20, 2.0)),
+    "RSI": (RSI, (14,)),
+    "ATR": (ATR, (14,)),
+    "MACD": (MACD, (12, 26, 9)),
+}
+
+
+def parse_indicator(spec: str) -> Indicator:
+    """
+    Build an indicator from a spec such as "EMA_50", "RSI", "BB_20_2" or "MACD_12_26_9".
+    Omitted trailing parameters take their defaults.
+
+    Raises:
+        ValueError: For unknown names or invalid parameters.
+    """
+    name, *params = spec.split("_")
+    if name.upper() not in INDICATORS:
+        raise ValueError(
+            f"Unknown indicator '{spec}'. Available indicators: {', '.join(INDICATORS)}"
+        )
+    cls, defaults = INDICATORS[name.upper()]
+    if len(params) > len(defaults):
+        raise ValueError(f"Too many parameters for indicator '{spec}'.")
+    try:
+        values = [type(d)(float(p)) for p, d in zip(params, defaults)]
+    except ValueError:
+        raise ValueError(f"Invalid parameters for indicator '{spec}'.") from None
+    values += list(defaults[len(values) :])
+    if any(v <= 0 for v in values):
+        raise ValueError(f"Indicator parameters must be positive: '{spec}'.")
+    return cls(*values)
+
+
+class IndicatorSet:
+    """
+    Many indicators over many tickers, with incremental updates.
+
+    compute() evaluates every indicator over date x ticker blocks in batched NumPy
+    (tickers sharing the same missing-bar pattern are processed together) and keeps
+    each indicator's recursive state; update() then advances all tickers by one bar
+    in O(1) per indicator instead of recomputing the history.
+
+    Missing bars (NaN in an input) are skipped: the ticker's state is not advanced
+    and its outputs are NaN for that bar.
+    """
+
+    def __init__(self, specs: Union[str, Sequence[str]]) -> None:
+        """
+        Args:
+            specs (str or list): Indicator specs, e.g. ["EMA_20", "RSI_14", "MACD", "ATR"].
+        """
+        if isinstance(specs, str):
+            specs = [specs]
+        self.specs: List[str] = list(dict.fromkeys(specs))
+        self.indicators: List[Indicator] = [parse_indicator(s) for s in self.specs]
+        self.columns: List[str] = [c for ind in self.indicators for c in ind.columns]
+        if len(set(self.columns)) != len(self.columns):
+            raise ValueError("Indicator specs produce duplicate columns.")
+        self.inputs: List[str] = sorted({f for ind in self.indicators for f in ind.inputs})
+        self.tickers: Optional[List[str]] = None
+        self._states: Optional[List[Dict[str, np.ndarray]]] = None
+
+    def compute(self, data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """
+        Compute every indicator over full histories and reset the incremental state.
+
+        Args:
+            data (dict): Price field ("Close", and "High"/"Low" for ATR) -> date x ticker
+                DataFrame (see vibequant.analysis.matrix.to_matrix). Frames are aligned to
+                the index and columns of the first required field.
+
+        Returns:
+            Dict[str, pd.DataFrame]: Indicator column -> date x ticker DataFrame.
+        """
+        missing = [f for f in self.inputs if f not in data]
+        if missing:
+            raise ValueError(f"Missing price field(s): {', '.join(missing)}.")
+        base = data[self.inputs[0]]
+        index, tickers = base.index, base.columns
+        arrays = {
+            f: data[f].reindex(index=index, columns=tickers).to_numpy(dtype=np.float64)
+            for f in self.inputs
+        }
+        n = len(tickers)
+        self.tickers = list(tickers)
+        self._states = []
+        out: Dict[str, pd.DataFrame] = {}
+        for ind in self.indicators:
+            xs = [arrays[f] for f in ind.inputs]
+            valid = np.logical_and.reduce([np.isfinite(x) for x in xs])
+            state = ind.init_state(n)
+            state["count"] = valid.sum(axis=0)
+            result = {c: np.full((len(index), n), np.nan) for c in ind.columns}
+            groups: Dict[bytes, List[int]] = {}
+            for j in range(n):
+                groups.setdefault(np.packbits(valid[:, j]).tobytes(), []).append(j)
+            for cols in groups.values():
+                rows = np.flatnonzero(valid[:, cols[0]])
+                if not len(rows):
+                    continue
+                if len(rows) == len(index) and len(cols) == n:
+                    block = (slice(None), slice(None))  # no gaps: avoid fancy-index copies
+                else:
+                    block = np.ix_(rows, cols)
+                values, last = ind.batch(*(x[block] for x in xs))
+                for k, v in last.items():
+                    state[k][..., cols] = v
+                for c, v in values.items():
+                    v[: ind.warmup[c] - 1] = np.nan
+                    result[c][block] = v
+            self._states.append(state)
+            for c in ind.columns:
+                out[c] = pd.DataFrame(result[c], index=index, columns=tickers)
+        return out
+
+    def update(self, bar: Dict[str, Union[pd.Series, float]]) -> pd.DataFrame:
+        """
+        Advance every indicator by one bar.
+
+        Args:
+            bar (dict): Price field -> Series indexed by ticker (tickers missing from it
+                are skipped), or a scalar when computing a single ticker.
+
+        Returns:
+            pd.DataFrame: One row per ticker with the new value of every indicator column.
+        """
+        if self._states is None:
+            raise ValueError("Call compute() before update().")
+        n = len(self.tickers)
+        x: Dict[str, np.ndarray] = {}
+        for f in self.inputs:
+            if f not in bar:
+                raise ValueError(f"Missing price field '{f}' in bar.")
+            v = bar[f]
+            if isinstance(v, pd.Series):
+                x[f] = v.reindex(self.tickers).to_numpy(dtype=np.float64)
+            else:
+                x[f] = np.broadcast_to(np.asarray(v, dtype=np.float64), (n,))
+        out: Dict[str, np.ndarray] = {}
+        for ind, state in zip(self.indicators, self._states):
+            xs = [x[f] for f in ind.inputs]
+            idx = np.flatnonzero(np.logical_and.reduce([np.isfinite(v) for v in xs]))
+            sub = {k: v[..., idx] for k, v in state.items()}
+            count = sub.pop("count")
+            values = ind.step(sub, count, *(v[idx] for v in xs))
+            count = count + 1
+            for k, v in sub.items():
+                state[k][..., idx] = v
+            state["count"][idx] = count
+            for c, v in values.items():
+                col = np.full(n, np.nan)
+                col[idx] = np.where(count >= ind.warmup[c], v, np.nan)
+                out[c] = col
+        return pd.DataFrame(out, index=pd.Index(self.tickers, name="Ticker"))[self.columns]
+
+    def compute_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compute the indicators for a single ticker's OHLC DataFrame.
+
+        Returns:
+            pd.DataFrame: Indicator columns on df's index.
+        """
+        missing = [f for f in self.inputs if f not in df.columns]
+        if missing:
+            raise ValueError(f"Missing price column(s): {', '.join(missing)}.")
+        result = self.compute({f: df[f].to_frame("value") for f in self.inputs})
+        return pd.DataFrame({c: result[c]["value"] for c in self.columns}, index=df.index)
@@ -0,0 +1,179 @@
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import fft, stats
+
+
+def _pair_indices(
+    tickers: List[str],
+    leaders: Optional[Sequence[str]],
+    followers: Optional[Sequence[str]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (I, J) column positions of the pairs to test: leaders x followers, or every
+    unordered pair when neither is given (negative lags cover the other direction).
+    """
+    pos = {t: i for i, t in enumerate(tickers)}
+    missing = [t for t in list(leaders or []) + list(followers or []) if t not in pos]
+    if missing:
+        raise ValueError(f"Unknown ticker(s): {', '.join(missing)}.")
+    if leaders is None and followers is None:
+        return np.triu_indices(len(tickers), k=1)
+    lead = [pos[t] for t in (leaders if leaders is not None else tickers)]
+    follow = [pos[t] for t in (followers if followers is not None else tickers)]
+    pairs = [(i, j) for i in lead for j in follow if i != j]
+    if not pairs:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    I, J = np.array(pairs).T
+    return I, J
+
+
+def cross_correlation(
+    returns: pd.DataFrame,
+    max_lag: int = 10,
+    leaders: Optional[Sequence[str]] = None,
+    followers: Optional[Sequence[str]] = None,
+    min_obs: int = 30,
+    chunk_size: int = 256,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Masked cross-correlations corr(x_t, y_{t+lag}) for every pair and every lag in
+    [-max_lag, max_lag], all lags at once by FFT.
+
+    Missing values are masked: each lag's correlation is the Pearson correlation over
+    the dates where both series are present (the same as pandas' shifted corr()),
+    built from six FFT cross-correlations of the values, squares and masks.
+
+    Args:
+        returns (pd.DataFrame): Date x ticker returns (see vibequant.analysis.matrix.to_matrix).
+        max_lag (int): Largest lag in rows.
+        leaders (list, optional): Tickers tested as x (the candidate leaders).
+        followers (list, optional): Tickers tested as y.
+        min_obs (int): Overlapping observations needed; fewer gives NaN.
+        chunk_size (int): Pairs transformed at once (bounds memory).
+
+    Returns:
+        Tuple: (I, J, lags, corr, nobs) with I/J the column positions of x and y,
+            lags of shape (2 * max_lag + 1,), and corr/nobs of shape (pairs, lags).
+    """
+    tickers = list(returns.columns)
+    values = returns.to_numpy(dtype=np.float64)
+    n = len(values)
+    if max_lag < 0 or max_lag >= n:
+        raise ValueError("max_lag must be between 0 and the number of rows - 1.")
+    I, J = _pair_indices(tickers, leaders, followers)
+    mask = np.isfinite(values)
+    x = np.where(mask, values, 0.0)
+    # Length >= n + max_lag keeps the circular correlation free of wrap-around at these lags
+    nfft = fft.next_fast_len(n + max_lag, real=True)
+    spectra = {
+        name: fft.rfft(a.T, nfft, axis=1)
+        for name, a in (("x", x), ("x2", x * x), ("m", mask.astype(np.float64)))
+    }
+    lags = np.arange(-max_lag, max_lag + 1)
+    cols = lags % nfft
+    corr = np.full((len(I), len(lags)), np.nan)
+    nobs = np.zeros((len(I), len(lags)), dtype=np.int64)
+
+    def xcorr(a: str, b: str, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        # sum_t a_i(t) * b_j(t + lag) for all lags
+        return fft.irfft(np.conj(spectra[a][i]) * spectra[b][j], nfft, axis=1)[:, cols]
+
+    for s in range(0, len(I), chunk_size):
+        i, j = I[s : s + chunk_size], J[s : s + chunk_size]
+        N = np.rint(xcorr("m", "m", i, j))
+        sx, sy = xcorr("x", "m", i, j), xcorr("m", "x", i, j)
+        qx, qy = xcorr("x2", "m", i, j), xcorr("m", "x2", i, j)
+        sxy = xcorr("x", "x", i, j)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cov = sxy - sx * sy / N
+            var = (qx - sx * sx / N) * (qy - sy * sy / N)
+            r = cov / np.sqrt(np.maximum(var, 0.0))
+        r[(N < max(min_obs, 3)) | ~(var > 0)] = np.nan
+        corr[s : s + len(i)] = np.clip(r, -1.0, 1.0)
+        nobs[s : s + len(i)] = N.astype(np.int64)
+    return I, J, lags, corr, nobs
+
+
+def lead_lag(
+    returns: pd.DataFrame,
+    max_lag: int = 10,
+    leaders: Optional[Sequence[str]] = None,
+    followers: Optional[Sequence[str]] = None,
+    min_obs: int = 30,
+    alpha: float = 0.05,
+    exclude_zero: bool = False,
+    chunk_size: int = 256,
+) -> pd.DataFrame:
+    """
+    Peak lead-lag relationship of every ticker pair.
+
+    A positive lag means x leads y: x's return at t correlates with y's return at
+    t + lag. Significance uses the t-test of a Pearson correlation on the overlapping
+    observations, Bonferroni-adjusted for the number of lags searched.
+
+    Args:
+        returns (pd.DataFrame): Date x ticker returns.
+        max_lag (int): Largest lag in rows.
+        leaders (list, optional): Tickers tested as x (e.g. crypto majors, sector ETFs).
+        followers (list, optional): Tickers tested as y.
+        min_obs (int): Overlapping observations needed per lag.
+        alpha (float): Level for the `significant` flag (on the adjusted p-value).
+        exclude_zero (bool): Search the peak among non-zero lags only.
+        chunk_size (int): Pairs transformed at once.
+
+    Returns:
+        pd.DataFrame: One row per pair with x, y, lag (of the peak |corr|), corr, corr0
+            (contemporaneous), nobs, t_stat, p_value, p_adj and significant, sorted by
+            p_adj then |corr|.
+    """
+    I, J, lags, corr, nobs = cross_correlation(
+        returns, max_lag, leaders, followers, min_obs, chunk_size
+    )
+    tickers = np.asarray(returns.columns)
+    search = np.abs(corr)
+    if exclude_zero:
+        search[:, lags == 0] = np.nan
+    n_lags = len(lags) - int(exclude_zero)
+    valid = ~np.all(np.isnan(search), axis=1)
+    peak = np.zeros(len(I), dtype=np.intp)
+    peak[valid] = np.nanargmax(search[valid], axis=1)
+    rows = np.arange(len(I))
+    r = np.where(valid, corr[rows, peak], np.nan)
+    n = nobs[rows, peak].astype(np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t_stat = r * np.sqrt((n - 2) / (1 - r * r))
+        p_value = 2 * stats.t.sf(np.abs(t_stat), n - 2)
+    p_adj = np.minimum(p_value * n_lags, 1.0)
+    out = pd.DataFrame(
+        {
+            "x": tickers[I],
+            "y": tickers[J],
+            "lag": np.where(valid, lags[peak], 0),
+            "corr": r,
+            "corr0": corr[:, lags == 0][:, 0],
+            "nobs": nobs[rows, peak],
+            "t_stat": t_stat,
+            "p_value": p_value,
+            "p_adj": p_adj,
+            "significant": p_adj < alpha,
+        }
+    )
+    order = np.lexsort(
+        (-np.abs(out["corr"].fillna(0).to_numpy()), out["p_adj"].fillna(1.0).to_numpy())
+    )
+    return out.iloc[order].reset_index(drop=True)
+
+
+def lead_lag_profile(returns: pd.DataFrame, x: str, y: str, max_lag: int = 10, min_obs: int = 30) -> pd.DataFrame:
+    """
+    Cross-correlation of one pair at every lag.
+
+    Returns:
+        pd.DataFrame: Indexed by lag with corr and nobs.
+    """
+    _, _, lags, corr, nobs = cross_correlation(
+        returns[[x, y]], max_lag, leaders=[x], followers=[y], min_obs=min_obs
+    )
+    return pd.DataFrame({"corr": corr[0], "nobs": nobs[0]}, index=pd.Index(lags, name="lag"))
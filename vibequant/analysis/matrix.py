@@ -0,0 +1,26 @@
+import pandas as pd
+from typing import Any, Dict
+
+
+def to_matrix(frames: Dict[str, Any], col: str = "Close", how: str = "outer") -> pd.DataFrame:
+    """
+    Build a date x ticker matrix from one column of several frames.
+
+    Args:
+        frames (dict): Ticker -> VibeFrame or DataFrame (DatetimeIndex rows).
+        col (str): Column to take from each frame (e.g. "Close", "CloseChange").
+        how (str): "outer" keeps every date (missing values are NaN), "inner" only shared dates.
+
+    Returns:
+        pd.DataFrame: Sorted DatetimeIndex rows, one column per ticker.
+    """
+    columns = {}
+    for ticker, frame in frames.items():
+        df = getattr(frame, "original_df", frame)
+        if col not in df.columns:
+            raise ValueError(f"Column '{col}' not found for '{ticker}'.")
+        columns[ticker] = df[col]
+    matrix = pd.concat(columns, axis=1, join=how).sort_index()
+    matrix.columns.name = "Ticker"
+    return matrix
+
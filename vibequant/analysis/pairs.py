@@ -0,0 +1,177 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from vibequant.utils.shared import SharedArray, SharedStore
+
+# MacKinnon (2010) response surface for the Engle-Granger test, two variables with
+# a constant: crit(T) = b_inf + b1 / T + b2 / T**2
+_EG_CRIT = {
+    "1%": (-3.89644, -10.9519, -22.527),
+    "5%": (-3.33613, -6.1101, -6.823),
+    "10%": (-3.04445, -4.2412, -2.720),
+}
+
+
+def eg_critical_values(nobs: int) -> Dict[str, float]:
+    """
+    Engle-Granger critical values (two series, constant) for a sample size.
+
+    Args:
+        nobs (int): Number of observations.
+
+    Returns:
+        Dict[str, float]: Critical values keyed by "1%", "5%", "10%".
+    """
+    return {k: b0 + b1 / nobs + b2 / nobs**2 for k, (b0, b1, b2) in _EG_CRIT.items()}
+
+
+def adf_tstat(e: np.ndarray, lags: int = 1) -> np.ndarray:
+    """
+    Augmented Dickey-Fuller t-statistics (with constant) for many series at once.
+
+    Each column is regressed as de_t = a + g * e_{t-1} + sum(c_k * de_{t-k}); all
+    regressions are solved together through batched normal equations.
+
+    Args:
+        e (np.ndarray): (n_rows, n_series) array without NaNs.
+        lags (int): Number of lagged differences.
+
+    Returns:
+        np.ndarray: t-statistic of g per series.
+    """
+    e = np.ascontiguousarray(np.asarray(e, dtype=np.float64).T)  # (series, rows)
+    de = np.diff(e, axis=1)
+    y = de[:, lags:]
+    cols = [np.ones_like(y), e[:, lags:-1]]
+    cols += [de[:, lags - k : -k] for k in range(1, lags + 1)]
+    X = np.stack(cols, axis=-1)  # (series, n, k): batched matmuls below hit BLAS
+    Xt = X.transpose(0, 2, 1)
+    inv = np.linalg.inv(Xt @ X)
+    beta = (inv @ (Xt @ y[..., None]))[..., 0]
+    resid = y - (X @ beta[..., None])[..., 0]
+    s2 = (resid**2).sum(axis=1) / (y.shape[1] - X.shape[-1])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return beta[:, 1] / np.sqrt(s2 * inv[:, 1, 1])
+
+
+def half_life(e: np.ndarray) -> np.ndarray:
+    """
+    Mean-reversion half-life (in rows) of each column from de_t = a + l * e_{t-1}.
+    Infinite where the series does not mean-revert (l >= 0).
+    """
+    x = e[:-1] - e[:-1].mean(axis=0)
+    dy = np.diff(e, axis=0)
+    dy = dy - dy.mean(axis=0)
+    lam = (x * dy).sum(axis=0) / (x * x).sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(lam < 0, -np.log(2) / lam, np.inf)
+
+
+def _scan_chunk(Y: np.ndarray, I: np.ndarray, J: np.ndarray, lags: int) -> Dict[str, np.ndarray]:
+    """
+    Hedge ratio, ADF statistic and half-life for pairs (Y[:, I] on Y[:, J]).
+    """
+    yi, yj = Y[:, I], Y[:, J]
+    mi, mj = yi.mean(axis=0), yj.mean(axis=0)
+    ci, cj = yi - mi, yj - mj
+    beta = (ci * cj).sum(axis=0) / (cj * cj).sum(axis=0)
+    resid = ci - cj * beta
+    return {
+        "hedge_ratio": beta,
+        "intercept": mi - beta * mj,
+        "adf_t": adf_tstat(resid, lags),
+        "half_life": half_life(resid),
+    }
+
+
+_WORKER_Y: Optional[np.ndarray] = None
+
+
+def _init_worker(Y: SharedArray) -> None:
+    global _WORKER_Y
+    _WORKER_Y = Y.attach()
+
+
+def _scan_chunk_worker(I: np.ndarray, J: np.ndarray, lags: int) -> Dict[str, np.ndarray]:
+    return _scan_chunk(_WORKER_Y, I, J, lags)
+
+
+def pairs_scan(
+    prices: pd.DataFrame,
+    min_corr: Optional[float] = 0.7,
+    lags: int = 1,
+    log: bool = True,
+    min_obs: int = 250,
+    min_coverage: float = 0.9,
+    chunk_size: int = 1000,
+    workers: int = 1,
+    top: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Engle-Granger cointegration scan over every ticker pair of a price matrix.
+
+    Pairs are optionally prefiltered by return correlation (one matrix product),
+    then hedge ratios, ADF statistics on the spread and half-lives are computed
+    for chunks of pairs with batched linear algebra, optionally in a process pool.
+
+    Args:
+        prices (pd.DataFrame): Date x ticker prices (see vibequant.analysis.matrix.to_matrix).
+        min_corr (float, optional): Keep pairs whose return correlation is at least this.
+            None scans all pairs.
+        lags (int): Lagged differences in the ADF regression.
+        log (bool): Use log prices.
+        min_obs (int): Drop tickers with fewer observations.
+        min_coverage (float): Drop tickers priced on less than this share of the dates,
+            so a recent listing does not cut every pair down to its short history.
+            Remaining rows with any missing price are dropped.
+        chunk_size (int): Pairs per batch (bounds memory at ~rows * chunk_size * (lags + 2)).
+        workers (int): Process pool size; 1 runs in-process.
+        top (int, optional): Return only the best `top` pairs.
+
+    Returns:
+        pd.DataFrame: One row per pair (y regressed on x), sorted by adf_t ascending, with
+            corr, hedge_ratio, intercept, adf_t, half_life and coint_5pct.
+    """
+    prices = prices.dropna(how="all")
+    counts = prices.count()
+    prices = prices.loc[:, (counts >= min_obs) & (counts >= min_coverage * len(prices))].dropna()
+    if prices.shape[1] < 2 or len(prices) < lags + 10:
+        raise ValueError("Need at least two tickers with enough overlapping prices.")
+    Y = prices.to_numpy(dtype=np.float64)
+    if log:
+        Y = np.log(Y)
+    tickers = np.asarray(prices.columns)
+
+    R = np.diff(Y, axis=0)
+    R = (R - R.mean(axis=0)) / R.std(axis=0)
+    corr = (R.T @ R) / len(R)
+    I, J = np.triu_indices(len(tickers), k=1)
+    if min_corr is not None:
+        keep = corr[I, J] >= min_corr
+        I, J = I[keep], J[keep]
+
+    chunks = [(I[s : s + chunk_size], J[s : s + chunk_size]) for s in range(0, len(I), chunk_size)]
+    if workers > 1 and len(chunks) > 1:
+        # Workers map the price matrix from shared memory instead of unpickling a copy
+        with SharedStore() as store, ProcessPoolExecutor(
+            workers, initializer=_init_worker, initargs=(store.share_array(Y),)
+        ) as pool:
+            results = list(
+                pool.map(_scan_chunk_worker, *zip(*chunks), [lags] * len(chunks))
+            )
+    else:
+        results = [_scan_chunk(Y, ci, cj, lags) for ci, cj in chunks]
+
+    columns = ["hedge_ratio", "intercept", "adf_t", "half_life"]
+    data = {
+        c: np.concatenate([r[c] for r in results]) if results else np.empty(0)
+        for c in columns
+    }
+    out = pd.DataFrame({"y": tickers[I], "x": tickers[J], "corr": corr[I, J], **data})
+    crit = eg_critical_values(len(Y) - 1 - lags)["5%"]
+    out["coint_5pct"] = out["adf_t"] < crit
+    out = out.sort_values("adf_t", kind="stable").reset_index(drop=True)
+    return out.head(top) if top is not None else out
@@ -0,0 +1,229 @@
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from vibequant.analysis.stability import cell_moments
+
+_WEEKDAY_ORDER = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# Axes of the stratification: every (Month, DayOfMonth, Weekday) cell is a stratum
+STRATA = {
+    "Month": pd.Index(range(1, 13), name="Month"),
+    "DayOfMonth": pd.Index(range(1, 32), name="DayOfMonth"),
+    "Weekday": pd.Index(_WEEKDAY_ORDER, name="Weekday"),
+}
+
+
+def stratum_codes(df: pd.DataFrame) -> np.ndarray:
+    """
+    Flat (Month, DayOfMonth, Weekday) cell of every row, -1 where a key is missing.
+    """
+    weekday = df["Weekday"]
+    if isinstance(weekday.dtype, pd.CategoricalDtype):
+        # Remap the category codes instead of hashing every string
+        lookup = pd.Index(_WEEKDAY_ORDER).get_indexer(weekday.cat.categories.astype(str))
+        w = np.where(weekday.cat.codes.to_numpy() >= 0, lookup[weekday.cat.codes.to_numpy()], -1)
+    else:
+        w = pd.Categorical(weekday, categories=_WEEKDAY_ORDER).codes.astype(np.int64)
+    m = pd.to_numeric(df["Month"], errors="coerce").to_numpy(dtype=np.float64) - 1
+    d = pd.to_numeric(df["DayOfMonth"], errors="coerce").to_numpy(dtype=np.float64) - 1
+    valid = (w >= 0) & (m >= 0) & (m < 12) & (d >= 0) & (d < 31)
+    # Missing keys make NaN codes, which the mask replaces
+    with np.errstate(invalid="ignore"):
+        codes = (m * 31 + d) * 7 + w
+    return np.where(valid, codes, -1).astype(np.int64)
+
+
+class StratifiedPreview:
+    """
+    Approximate calendar views from a sample stratified by (Month, DayOfMonth, Weekday)
+    cell, with standard errors, refined in place toward the exact answer.
+
+    Every row draws one uniform priority; the sample at fraction f is, in every cell of
+    R_c rows, the k_c = ceil(max(f * R_c, min_per_cell)) rows of lowest priority (all of
+    them in smaller cells), a simple random sample of fixed size. It is kept as a
+    priority cut-off per cell, the k_c-th smallest priority, found by sorting only the
+    rows just above k_c / R_c rather than ranking every row. Refining only adds the rows
+    between the old and the new cut-offs to the cell moments, so the work across
+    refinements adds up to one pass over the data, and at fraction 1 every row is in
+    and the estimates equal the exact means.
+
+    A group of cells (a weekday, a month, ...) is estimated by expanding each cell's
+    sample to its row count: mean = sum(R_c / r_c * s_c) / sum(R_c / r_c * n_c), with
+    R_c rows in the cell, r_c of them sampled, s_c and n_c the sum and count of valid
+    values. Its standard error combines the cell variances (shrunk toward the overall
+    variance in sparsely sampled cells) with the finite population correction
+    (1 - r_c / R_c), so it shrinks to 0 as the sample becomes the data.
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        cols: Union[str, List[str]] = "Change",
+        fraction: float = 0.05,
+        min_per_cell: int = 5,
+        seed: Optional[int] = 0,
+    ) -> None:
+        """
+        Args:
+            df (pd.DataFrame): Rows with Month, DayOfMonth, Weekday and the return columns.
+            cols (str or list): Return columns to estimate.
+            fraction (float): Initial sampling fraction in (0, 1].
+            min_per_cell (int): Rows every cell gets at least (small cells are taken whole).
+            seed (int, optional): Seed of the row priorities.
+        """
+        self.cols = [cols] if isinstance(cols, str) else list(cols)
+        missing = [c for c in self.cols if c not in df.columns]
+        if missing:
+            raise ValueError(f"Column(s) not found: {', '.join(missing)}.")
+        self.min_per_cell = min_per_cell
+        self.seed = seed
+        self._shape = tuple(len(v) for v in STRATA.values())
+        n_cells = int(np.prod(self._shape))
+        codes = stratum_codes(df)
+        keep = np.flatnonzero(codes >= 0)
+        self._codes = codes[keep]
+        self._values = [df[c].to_numpy(dtype=np.float64)[keep] for c in self.cols]
+        self._priority = np.random.default_rng(seed).random(len(keep))
+        self.rows = np.bincount(self._codes, minlength=n_cells).astype(np.float64)
+        self.sampled = np.zeros(n_cells)
+        self.sums = np.zeros((n_cells, len(self.cols)))
+        self.sumsq = np.zeros_like(self.sums)
+        self.counts = np.zeros_like(self.sums)
+        # A cell's sample is its rows with priority <= cut (priorities are in [0, 1))
+        self._cut = np.full(n_cells, -1.0)
+        self.fraction = 0.0
+        self.refine(fraction)
+
+    def __repr__(self) -> str:
+        return (
+            f"StratifiedPreview(fraction={self.fraction:g}, "
+            f"rows={int(self.sampled.sum())}/{len(self._codes)}; cols={self.cols})"
+        )
+
+    @property
+    def is_exact(self) -> bool:
+        return self.fraction >= 1.0
+
+    def refine(self, fraction: Optional[float] = None) -> "StratifiedPreview":
+        """
+        Grow the sample to `fraction` of every cell (default: double it).
+
+        Args:
+            fraction (float, optional): New sampling fraction, at least the current one.
+
+        Returns:
+            StratifiedPreview: self.
+        """
+        if fraction is None:
+            fraction = min(1.0, 2 * self.fraction)
+        if not 0 < fraction <= 1:
+            raise ValueError("fraction must be in (0, 1].")
+        fraction = max(fraction, self.fraction)
+        if fraction >= 1.0:
+            size = self.rows.astype(np.int64)
+        else:
+            size = np.ceil(np.maximum(fraction * self.rows, self.min_per_cell))
+            size = np.minimum(size, self.rows).astype(np.int64)
+        cut = self._cuts(size)
+        priority = self._priority
+        rows = np.flatnonzero(
+            (priority > self._cut[self._codes]) & (priority <= cut[self._codes])
+        )
+        if len(rows):
+            codes = self._codes[rows]
+            values = np.column_stack([v[rows] for v in self._values])
+            s, ss, n = cell_moments(values, codes, len(self.rows))
+            self.sums += s
+            self.sumsq += ss
+            self.counts += n
+            self.sampled += np.bincount(codes, minlength=len(self.rows))
+        self._cut = cut
+        self.fraction = fraction
+        return self
+
+    def _cuts(self, size: np.ndarray) -> np.ndarray:
+        """
+        Priority cut-off of every cell: the size[c]-th smallest priority of its rows.
+        """
+        cut = np.where(size >= self.rows, np.inf, -1.0)
+        partial = (size > 0) & (size < self.rows)
+        if not partial.any():
+            return cut
+        # The k-th smallest of R uniforms is about k / R, give or take sqrt(k) / R: only
+        # rows below a bound several deviations above that can hold it
+        with np.errstate(invalid="ignore", divide="ignore"):
+            bound = np.where(partial, (size + 6 * np.sqrt(size) + 6) / self.rows, -1.0)
+        candidates = np.flatnonzero(self._priority < bound[self._codes])
+        short = partial & (np.bincount(self._codes[candidates], minlength=len(size)) < size)
+        if short.any():
+            # Unlucky cells: take all of their rows
+            bound[short] = 1.0
+            candidates = np.flatnonzero(self._priority < bound[self._codes])
+        codes, priority = self._codes[candidates], self._priority[candidates]
+        order = np.lexsort((priority, codes))
+        per_cell = np.bincount(codes, minlength=len(size))
+        starts = np.cumsum(per_cell) - per_cell
+        cells = np.flatnonzero(partial)
+        cut[cells] = priority[order[starts[cells] + size[cells] - 1]]
+        return cut
+
+    def estimate(
+        self, keys: Sequence[str]
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """
+        Estimated means of every return column by calendar keys.
+
+        Args:
+            keys (list): Calendar keys, e.g. ["Weekday"] or ["Month", "DayOfMonth", "Weekday"].
+
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: Means, standard errors and
+                sampled value counts, indexed by the keys present in the data (like
+                df.groupby(keys)[cols].mean()), one column per return.
+        """
+        keys = list(keys)
+        unknown = [k for k in keys if k not in STRATA]
+        if unknown:
+            raise ValueError(f"Unknown key(s) {unknown}. Keys: {', '.join(STRATA)}")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            expand = np.where(self.sampled > 0, self.rows / self.sampled, 0.0)[:, None]
+            fpc = np.where(self.rows > 0, 1 - self.sampled / self.rows, 0.0)[:, None]
+            mean_c = self.sums / self.counts
+            var_c = (self.sumsq - self.counts * mean_c * mean_c) / (self.counts - 1)
+            n = self.counts.sum(axis=0)
+            pooled = (self.sumsq.sum(axis=0) - self.sums.sum(axis=0) ** 2 / n) / (n - 1)
+        # A few sampled values make a noisy variance, and a near-zero one an
+        # overconfident error: shrink toward the overall sample variance, worth
+        # min_per_cell values (cells with a single value take it whole)
+        dof = np.maximum(self.counts - 1, 0)
+        prior = max(self.min_per_cell, 1)
+        var_c = (dof * np.nan_to_num(np.maximum(var_c, 0)) + prior * pooled) / (dof + prior)
+        weight = expand * self.counts  # estimated valid values in the cell
+        with np.errstate(invalid="ignore", divide="ignore"):
+            spread = np.where(self.counts > 0, weight**2 * fpc * var_c / self.counts, 0.0)
+        full = self._shape + (len(self.cols),)
+        other = tuple(i for i, k in enumerate(STRATA) if k not in keys)
+        kept = [k for k in STRATA if k in keys]
+        perm = [kept.index(k) for k in keys] + [len(keys)]
+
+        def reduce(a: np.ndarray) -> np.ndarray:
+            return a.reshape(full).sum(axis=other).transpose(perm).reshape(-1, len(self.cols))
+
+        total = reduce(weight)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = reduce(expand * self.sums) / total
+            se = np.sqrt(reduce(spread)) / total
+        counts = reduce(self.counts)
+        present = reduce(np.repeat(self.rows[:, None], len(self.cols), axis=1))[:, 0] > 0
+        if len(keys) == 1:
+            index = STRATA[keys[0]]
+        else:
+            index = pd.MultiIndex.from_product([STRATA[k] for k in keys], names=keys)
+        index = index[present]
+        frames = [
+            pd.DataFrame(a[present], index=index, columns=self.cols) for a in (mean, se, counts)
+        ]
+        frames[2] = frames[2].astype(np.int64)
+        return frames[0], frames[1], frames[2]
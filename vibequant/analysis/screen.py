@@ -0,0 +1,611 @@
+import os
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from vibequant.utils.storage import read_table, write_table
+
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+def compute_metrics(vf: Any, col: Optional[str] = None, window: int = 252) -> Dict[str, float]:
+    """
+    Screening metrics of one ticker from a VibeFrame.
+
+    - last_close, ret_1y (% change over the last `window` rows), vol_1y (annualized
+      % volatility of close-to-close returns over the window), avg_volume (last 63
+      rows) and n_days.
+    - avg_<Weekday> / t_<Weekday> (e.g. t_Monday) and avg_<Mon> / t_<Mon> (e.g. t_Jan):
+      mean and t-statistic of the return column by weekday and month, as in t_sorted().
+
+    Args:
+        vf (VibeFrame): Source frame.
+        col (str, optional): Return column for the seasonal metrics. Defaults to the
+            first selected return.
+        window (int): Rows in the trailing one-year window.
+
+    Returns:
+        Dict[str, float]: Metric name -> value (NaN when not computable).
+    """
+    df = vf.original_df
+    col = col or vf.returns[0]
+    close = df["Close"].to_numpy(dtype=np.float64)
+    recent = close[-(window + 1) :]
+    change = np.diff(recent) / recent[:-1] * 100.0
+    metrics: Dict[str, float] = {
+        "last_close": float(close[-1]) if len(close) else np.nan,
+        "ret_1y": float((recent[-1] / recent[0] - 1) * 100.0) if len(recent) > 1 else np.nan,
+        "vol_1y": float(np.nanstd(change, ddof=1) * np.sqrt(252 if vf.is_stock else 365))
+        if len(change) > 1
+        else np.nan,
+        "avg_volume": float(df["Volume"].iloc[-63:].mean()) if "Volume" in df else np.nan,
+        "n_days": float(len(df)),
+    }
+    for by, labels, names in (
+        ("Weekday", vf.WEEK_DAYS, vf.WEEK_DAYS),
+        ("Month", list(range(1, 13)), MONTH_NAMES),
+    ):
+        stats = df.groupby(by)[col].agg(["mean", "std", "count"]).reindex(labels)
+        t = stats["mean"] / (stats["std"] / np.sqrt(stats["count"]))
+        for name, mean, t_stat in zip(names, stats["mean"], t):
+            metrics[f"avg_{name}"] = float(mean)
+            metrics[f"t_{name}"] = float(t_stat)
+    return metrics
+
+
+# --- Screening expressions ---
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?[kKmMbB%]?)
+      | (?P<str>"[^"]*"|'[^']*')
+      | (?P<op><=|>=|==|!=|<|>|=|\(|\)|,|\+|-|\*|/)
+      | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+    )""",
+    re.VERBOSE,
+)
+
+_SUFFIX = {"k": 1e3, "m": 1e6, "b": 1e9, "%": 1.0}
+
+_KEYWORDS = {"and", "or", "not", "in", "abs"}
+
+_COMPARE: Dict[str, Callable] = {
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "==": np.equal,
+    "=": np.equal,
+    "!=": np.not_equal,
+}
+
+_FLIP = {"<": ">", "<=": ">=", ">": "<", ">=": "<=", "==": "==", "=": "=", "!=": "!="}
+
+
+def _tokenize(expr: str) -> List[Tuple[str, Any, int]]:
+    tokens, pos = [], 0
+    expr = expr.rstrip()
+    while pos < len(expr):
+        m = _TOKEN.match(expr, pos)
+        if not m or m.end() == pos:
+            pos += len(expr[pos:]) - len(expr[pos:].lstrip())
+            raise ValueError(f"Unexpected character at {pos} in screen: {expr[pos:pos + 10]!r}")
+        kind = m.lastgroup
+        text = m.group(kind)
+        if kind == "num":
+            scale = _SUFFIX.get(text[-1].lower(), None)
+            value = float(text[:-1]) * scale if scale is not None else float(text)
+            tokens.append(("num", value, m.start(kind)))
+        elif kind == "str":
+            tokens.append(("str", text[1:-1], m.start(kind)))
+        elif kind == "name" and text.lower() in _KEYWORDS:
+            tokens.append(("op", text.lower(), m.start(kind)))
+        else:
+            tokens.append((kind, text, m.start(kind)))
+        pos = m.end()
+    return tokens
+
+
+class Screen:
+    """
+    A parsed screening expression, evaluated vectorized over metric columns.
+
+    Grammar: comparisons (<, <=, >, >=, ==, !=) of arithmetic expressions (+ - * /,
+    abs()) over metric names and numbers, combined with and / or / not and
+    parentheses; `name in (...)` tests membership. Numbers accept K/M/B suffixes
+    (1.5M = 1500000) and a % suffix, which is cosmetic because returns and
+    volatilities are stored in percent. Strings are quoted.
+
+    Missing metrics (NaN) never match: a comparison with NaN is unknown, `not` keeps
+    it unknown, and / or follow three-valued logic (false and unknown is false, true
+    or unknown is true). So `t_Monday != 2` and `not t_Monday > 2` both skip tickers
+    without t_Monday.
+
+    Example: t_Monday > 2 and vol_1y < 30% and avg_volume > 1M
+    """
+
+    def __init__(self, expr: str) -> None:
+        self.expr = expr
+        self._tokens = _tokenize(expr)
+        self._pos = 0
+        if not self._tokens:
+            raise ValueError("Empty screen expression.")
+        self.tree = self._or()
+        if self._pos != len(self._tokens):
+            self._error("Unexpected token")
+        self.columns: Set[str] = set()
+        self._collect(self.tree)
+
+    # Recursive-descent parser producing a tuple tree
+
+    def _peek(self) -> Optional[Tuple[str, Any, int]]:
+        return self._tokens[self._pos] if self._pos < len(self._tokens) else None
+
+    def _accept(self, *ops: str) -> Optional[str]:
+        tok = self._peek()
+        if tok is not None and tok[0] == "op" and tok[1] in ops:
+            self._pos += 1
+            return tok[1]
+        return None
+
+    def _expect(self, op: str) -> None:
+        if not self._accept(op):
+            self._error(f"Expected '{op}'")
+
+    def _error(self, message: str) -> None:
+        tok = self._peek()
+        where = f"at {tok[2]} ({tok[1]!r})" if tok else "at end"
+        raise ValueError(f"{message} {where} in screen: {self.expr!r}")
+
+    def _or(self):
+        node = self._and()
+        while self._accept("or"):
+            node = ("or", node, self._and())
+        return node
+
+    def _and(self):
+        node = self._not()
+        while self._accept("and"):
+            node = ("and", node, self._not())
+        return node
+
+    def _not(self):
+        if self._accept("not"):
+            return ("not", self._not())
+        return self._compare()
+
+    def _compare(self):
+        left = self._sum()
+        op = self._accept(*_COMPARE)
+        if op:
+            return ("cmp", op, left, self._sum())
+        if self._accept("in"):
+            self._expect("(")
+            values = [self._literal()]
+            while self._accept(","):
+                values.append(self._literal())
+            self._expect(")")
+            return ("in", left, values)
+        return left
+
+    def _literal(self):
+        tok = self._peek()
+        if tok is None or tok[0] not in ("num", "str"):
+            self._error("Expected a number or string")
+        self._pos += 1
+        return tok[1]
+
+    def _sum(self):
+        node = self._term()
+        while True:
+            op = self._accept("+", "-")
+            if not op:
+                return node
+            node = ("arith", op, node, self._term())
+
+    def _term(self):
+        node = self._unary()
+        while True:
+            op = self._accept("*", "/")
+            if not op:
+                return node
+            node = ("arith", op, node, self._unary())
+
+    def _unary(self):
+        if self._accept("-"):
+            return ("neg", self._unary())
+        if self._accept("abs"):
+            self._expect("(")
+            node = self._or()
+            self._expect(")")
+            return ("abs", node)
+        if self._accept("("):
+            node = self._or()
+            self._expect(")")
+            return node
+        tok = self._peek()
+        if tok is None:
+            self._error("Unexpected end")
+        self._pos += 1
+        if tok[0] == "num":
+            return ("num", tok[1])
+        if tok[0] == "str":
+            return ("str", tok[1])
+        if tok[0] == "name":
+            return ("col", tok[1])
+        self._pos -= 1
+        self._error("Unexpected token")
+
+    def _collect(self, node) -> None:
+        if node[0] == "col":
+            self.columns.add(node[1])
+        for child in node[1:]:
+            if isinstance(child, tuple):
+                self._collect(child)
+
+    # Evaluation
+
+    def evaluate(
+        self,
+        column: Callable[[str], np.ndarray],
+        n_rows: int,
+        index: Optional[Callable[[str], Optional[np.ndarray]]] = None,
+    ) -> np.ndarray:
+        """
+        Evaluate the screen to a boolean row mask.
+
+        Args:
+            column (callable): Name -> column values.
+            n_rows (int): Number of rows.
+            index (callable, optional): Name -> row order sorting that column (NaNs last),
+                or None; used to answer `name <op> number` by binary search.
+
+        Returns:
+            np.ndarray: Boolean mask of matching rows.
+        """
+        truth = self._truth(self.tree, column, n_rows, index)
+        return np.broadcast_to(np.asarray(truth) == _TRUE, (n_rows,))
+
+    def _truth(self, node, column, n_rows, index):
+        """
+        Three-valued truth of a node: _TRUE, _FALSE or _UNKNOWN (where a value is NaN),
+        so that and = min, or = max and not = 1 - x.
+        """
+        kind = node[0]
+        if kind == "and":
+            return np.minimum(
+                self._truth(node[1], column, n_rows, index), self._truth(node[2], column, n_rows, index)
+            )
+        if kind == "or":
+            return np.maximum(
+                self._truth(node[1], column, n_rows, index), self._truth(node[2], column, n_rows, index)
+            )
+        if kind == "not":
+            return _TRUE - self._truth(node[1], column, n_rows, index)
+        if kind == "in":
+            left = self._eval(node[1], column, n_rows, index)
+            return _known(np.isin(left, node[2]), pd.isna(left))
+        if kind == "cmp":
+            # Comparison: use the column's sorted index for `col op number`
+            op, left, right = node[1], node[2], node[3]
+            if left[0] == "num" and right[0] == "col":
+                op, left, right = _FLIP[op], right, left
+            if index is not None and left[0] == "col" and right[0] == "num" and op not in ("!=",):
+                order = index(left[1])
+                if order is not None:
+                    values = column(left[1])
+                    hit = _index_range(values, order, op, right[1], n_rows)
+                    return _known(hit, pd.isna(values))
+            a = self._eval(left, column, n_rows, index)
+            b = self._eval(right, column, n_rows, index)
+            with np.errstate(invalid="ignore"):
+                return _known(_COMPARE[op](a, b), pd.isna(a) | pd.isna(b))
+        # A bare value counts as true when non-zero
+        value = self._eval(node, column, n_rows, index)
+        return _known(np.not_equal(value, 0), pd.isna(value))
+
+    def _eval(self, node, column, n_rows, index):
+        kind = node[0]
+        if kind in ("and", "or", "not", "in", "cmp"):
+            # A condition used as a number: 1, 0 or NaN when unknown
+            truth = self._truth(node, column, n_rows, index)
+            return np.where(truth == _UNKNOWN, np.nan, truth)
+        if kind == "num" or kind == "str":
+            return node[1]
+        if kind == "col":
+            return column(node[1])
+        if kind == "neg":
+            return -self._eval(node[1], column, n_rows, index)
+        if kind == "abs":
+            return np.abs(self._eval(node[1], column, n_rows, index))
+        left = self._eval(node[2], column, n_rows, index)
+        right = self._eval(node[3], column, n_rows, index)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return {"+": np.add, "-": np.subtract, "*": np.multiply, "/": np.divide}[node[1]](left, right)
+
+
+_FALSE, _UNKNOWN, _TRUE = 0.0, 0.5, 1.0
+
+
+def _known(hit: Any, missing: Any) -> np.ndarray:
+    return np.where(missing, _UNKNOWN, np.where(hit, _TRUE, _FALSE))
+
+
+def _index_range(values: np.ndarray, order: np.ndarray, op: str, bound: float, n_rows: int) -> np.ndarray:
+    """
+    Rows satisfying `values <op> bound`, found by binary search on the sorted order.
+    """
+    sorted_values = values[order]
+    n_valid = len(sorted_values) - int(np.isnan(sorted_values).sum())
+    sorted_values = sorted_values[:n_valid]
+    if op in (">", ">="):
+        lo = np.searchsorted(sorted_values, bound, side="right" if op == ">" else "left")
+        hit = order[lo:n_valid]
+    elif op in ("<", "<="):
+        hi = np.searchsorted(sorted_values, bound, side="left" if op == "<" else "right")
+        hit = order[:hi]
+    else:
+        lo = np.searchsorted(sorted_values, bound, side="left")
+        hi = np.searchsorted(sorted_values, bound, side="right")
+        hit = order[lo:hi]
+    mask = np.zeros(n_rows, dtype=bool)
+    mask[hit] = True
+    return mask
+
+
+# --- Metric store ---
+
+
+class MetricStore:
+    """
+    Persisted columnar store of per-ticker metrics, one row per ticker per as-of date.
+
+    Each as-of date is one Arrow IPC file (<root>/asof=YYYY-MM-DD.arrow) with rows
+    sorted by ticker and, for every indexed metric, a precomputed sort order. Screens
+    memory-map only the columns they reference, cache them, and answer simple
+    comparisons by binary search on those orders. Requires pyarrow.
+    """
+
+    _ORDER_PREFIX = "_order_"
+
+    def __init__(self, root: str, indexed: Optional[Sequence[str]] = None) -> None:
+        """
+        Args:
+            root (str): Store directory (created on first flush).
+            indexed (list, optional): Metrics to keep sorted indexes for. Defaults to
+                every numeric metric.
+        """
+        self.root = root
+        self.indexed = list(indexed) if indexed is not None else None
+        self._pending: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self._columns: Dict[Tuple[str, str], np.ndarray] = {}
+        self._schemas: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _asof_key(asof: Any) -> str:
+        return pd.Timestamp(asof).strftime("%Y-%m-%d")
+
+    def _path(self, asof: str) -> str:
+        return os.path.join(self.root, f"asof={asof}.arrow")
+
+    def asofs(self) -> List[str]:
+        """
+        Stored as-of dates, oldest first.
+        """
+        if not os.path.isdir(self.root):
+            return []
+        found = [
+            name[len("asof=") : -len(".arrow")]
+            for name in os.listdir(self.root)
+            if name.startswith("asof=") and name.endswith(".arrow")
+        ]
+        return sorted(found)
+
+    def add(self, ticker: str, metrics: Dict[str, float], asof: Any) -> None:
+        """
+        Stage one ticker's metrics for an as-of date (written by flush()).
+        """
+        with self._lock:
+            self._pending.setdefault(self._asof_key(asof), {})[ticker] = dict(metrics)
+
+    def add_frame(self, ticker: str, vf: Any, asof: Any = None, **kwargs) -> Dict[str, float]:
+        """
+        Compute and stage the metrics of a VibeFrame (see compute_metrics).
+
+        Args:
+            ticker (str): Ticker symbol.
+            vf (VibeFrame): Source frame.
+            asof (date, optional): As-of date. Defaults to the frame's last date.
+            **kwargs: compute_metrics options.
+
+        Returns:
+            Dict[str, float]: The metrics.
+        """
+        metrics = compute_metrics(vf, **kwargs)
+        self.add(ticker, metrics, asof if asof is not None else vf.original_df.index[-1])
+        return metrics
+
+    def flush(self) -> List[str]:
+        """
+        Write staged rows, merging them into existing as-of files (staged rows replace
+        stored rows of the same ticker).
+
+        Returns:
+            List[str]: As-of dates written.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            os.makedirs(self.root, exist_ok=True)
+            for asof, rows in pending.items():
+                new = pd.DataFrame.from_dict(rows, orient="index")
+                path = self._path(asof)
+                if os.path.exists(path):
+                    old = self._read(asof).set_index("ticker")
+                    new = pd.concat([old[~old.index.isin(new.index)], new])
+                new = new.sort_index().rename_axis("ticker").reset_index()
+                metrics = [c for c in new.columns if c != "ticker"]
+                new[metrics] = new[metrics].astype(np.float64)
+                for c in self.indexed if self.indexed is not None else metrics:
+                    if c in new.columns:
+                        # NaNs sort last, so valid values form a prefix of the order
+                        new[self._ORDER_PREFIX + c] = np.argsort(new[c].to_numpy(), kind="stable").astype(np.int32)
+                tmp = path + ".tmp"
+                write_table(new, tmp, compact=False)
+                os.replace(tmp, path)
+                self._columns = {k: v for k, v in self._columns.items() if k[0] != asof}
+                self._schemas.pop(asof, None)
+            return sorted(pending)
+
+    def _read(self, asof: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        df = read_table(self._path(asof), columns=columns)
+        return df[[c for c in df.columns if not c.startswith(self._ORDER_PREFIX)]] if columns is None else df
+
+    def _schema(self, asof: str) -> List[str]:
+        if asof not in self._schemas:
+            import pyarrow as pa
+
+            with pa.memory_map(self._path(asof), "r") as source:
+                self._schemas[asof] = pa.ipc.open_file(source).schema.names
+        return self._schemas[asof]
+
+    def metrics(self, asof: Any = None) -> List[str]:
+        """
+        Metric names stored for an as-of date (default: the latest).
+        """
+        asof = self._resolve(asof)
+        return [c for c in self._schema(asof) if c != "ticker" and not c.startswith(self._ORDER_PREFIX)]
+
+    def _resolve(self, asof: Any) -> str:
+        """
+        Latest stored as-of date on or before `asof` (default: the latest overall).
+        """
+        dates = self.asofs()
+        if not dates:
+            raise ValueError(f"Metric store '{self.root}' is empty.")
+        if asof is None:
+            return dates[-1]
+        key = self._asof_key(asof)
+        earlier = [d for d in dates if d <= key]
+        if not earlier:
+            raise ValueError(f"No metrics on or before {key}. Available: {', '.join(dates)}")
+        return earlier[-1]
+
+    def _fallback_rows(
+        self, asof: str, names: Sequence[str], max_age: Optional[int]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Latest earlier rows of the tickers missing from `asof` (data ending a day or
+        more earlier: halts, exchange holidays, stale fetches), within max_age days.
+        """
+        oldest = pd.Timestamp(asof) - pd.Timedelta(days=max_age) if max_age is not None else None
+        earlier = [d for d in self.asofs() if d < asof and (oldest is None or pd.Timestamp(d) >= oldest)]
+        seen = set(self._columns[(asof, "ticker")])
+        parts: Dict[str, List[np.ndarray]] = {n: [] for n in ["ticker", "asof_date", *names]}
+        for date in reversed(earlier):
+            schema = self._schema(date)
+            self._load(date, ["ticker"] + list(names))
+            tickers = self._columns[(date, "ticker")]
+            rows = np.flatnonzero(~np.isin(tickers, list(seen)))
+            if len(rows) == 0:
+                continue
+            seen.update(tickers[rows])
+            parts["ticker"].append(tickers[rows])
+            parts["asof_date"].append(np.full(len(rows), date, dtype=object))
+            for n in names:
+                values = self._columns[(date, n)][rows] if n in schema else np.full(len(rows), np.nan)
+                parts[n].append(values)
+        return {n: np.concatenate(v) for n, v in parts.items() if v}
+
+    def _load(self, asof: str, names: Sequence[str]) -> None:
+        schema = self._schema(asof)
+        missing = [n for n in dict.fromkeys(names) if (asof, n) not in self._columns and n in schema]
+        if missing:
+            df = read_table(self._path(asof), columns=missing)
+            for n in missing:
+                self._columns[(asof, n)] = df[n].to_numpy()
+
+    def screen(
+        self,
+        expr: Union[str, Screen],
+        asof: Any = None,
+        sort: Optional[str] = None,
+        ascending: bool = False,
+        limit: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+        max_age: Optional[int] = 7,
+    ) -> pd.DataFrame:
+        """
+        Tickers matching a screening expression (see Screen), e.g.
+        "t_Monday > 2 and vol_1y < 30% and avg_volume > 1M".
+
+        Every ticker is screened on its latest metrics on or before the as-of date, so
+        tickers whose data ends a little earlier do not drop out of the universe.
+
+        Args:
+            expr (str or Screen): Screening expression.
+            asof (date, optional): As-of date. Defaults to the latest stored one.
+            sort (str, optional): Metric to sort the matches by.
+            ascending (bool): Sort order.
+            limit (int, optional): Maximum rows returned.
+            columns (list, optional): Extra metrics to include in the result.
+            max_age (int, optional): Days an older row may lag the as-of date and still
+                stand in for a missing ticker (None: no limit, 0: that date only).
+
+        Returns:
+            pd.DataFrame: Matching tickers (index) with the as-of date of their row
+                (asof_date) and the referenced metrics.
+        """
+        screen = expr if isinstance(expr, Screen) else Screen(expr)
+        asof = self._resolve(asof)
+        schema = self._schema(asof)
+        wanted = sorted(screen.columns) + [c for c in [sort, *(columns or [])] if c]
+        unknown = [c for c in wanted if c not in schema or c.startswith(self._ORDER_PREFIX)]
+        if unknown:
+            raise ValueError(
+                f"Unknown metric(s) {', '.join(sorted(set(unknown)))}. "
+                f"Available: {', '.join(self.metrics(asof))}"
+            )
+        orders = [self._ORDER_PREFIX + c for c in screen.columns if self._ORDER_PREFIX + c in schema]
+        self._load(asof, ["ticker"] + wanted + orders)
+        names = [c for c in dict.fromkeys(wanted) if c != "ticker"]
+        data = {n: self._columns[(asof, n)] for n in ["ticker"] + names}
+        data["asof_date"] = np.full(len(data["ticker"]), asof, dtype=object)
+        index = lambda c: self._columns.get((asof, self._ORDER_PREFIX + c))  # noqa: E731
+        extra = self._fallback_rows(asof, names, max_age) if max_age != 0 else {}
+        if extra:
+            data = {n: np.concatenate([v, extra[n]]) for n, v in data.items()}
+            index = None  # the stored sort orders only cover the as-of file
+        mask = screen.evaluate(lambda c: data[c], len(data["ticker"]), index)
+        rows = np.flatnonzero(mask)
+        out = pd.DataFrame(
+            {c: data[c][rows] for c in ["asof_date"] + names},
+            index=pd.Index(data["ticker"][rows], name="ticker"),
+        )
+        if extra:
+            out = out.sort_index()
+        if sort:
+            out = out.sort_values(sort, ascending=ascending, kind="stable")
+        return out.head(limit) if limit is not None else out
+
+    def history(self, ticker: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        A ticker's metrics across every as-of date.
+
+        Returns:
+            pd.DataFrame: One row per as-of date (DatetimeIndex).
+        """
+        rows = {}
+        for asof in self.asofs():
+            names = list(columns) if columns is not None else self.metrics(asof)
+            self._load(asof, ["ticker"] + names)
+            tickers = self._columns[(asof, "ticker")]
+            i = np.searchsorted(tickers, ticker)  # rows are sorted by ticker
+            if i < len(tickers) and tickers[i] == ticker:
+                rows[pd.Timestamp(asof)] = {
+                    n: self._columns[(asof, n)][i] for n in names if (asof, n) in self._columns
+                }
+        return pd.DataFrame.from_dict(rows, orient="index").rename_axis("asof")
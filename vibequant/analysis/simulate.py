@@ -0,0 +1,290 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Calendar keys of each VibeFrame view, outermost first
+VIEW_KEYS: Dict[str, List[str]] = {
+    "W": ["Weekday"],
+    "M": ["Month"],
+    "D": ["DayOfMonth"],
+    "WM": ["DayOfMonth", "Weekday"],
+    "DWM": ["Month", "DayOfMonth", "Weekday"],
+}
+
+METHODS = ("gbm", "block", "calendar")
+
+_WEEKDAY_ORDER = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+def calendar_codes(df: pd.DataFrame, keys: Sequence[str]) -> Tuple[np.ndarray, pd.Index]:
+    """
+    Integer group code of every row for a set of calendar keys.
+
+    Args:
+        df (pd.DataFrame): Rows with the calendar columns (Weekday, Month, DayOfMonth).
+        keys (list): Calendar columns, e.g. ["Month", "Weekday"].
+
+    Returns:
+        Tuple[np.ndarray, pd.Index]: Codes in [0, n_groups) and the group labels, in
+            calendar order (weekdays Monday first).
+    """
+    frame = df[list(keys)].copy()
+    if "Weekday" in frame:
+        present = set(frame["Weekday"].astype(str))
+        order = [d for d in _WEEKDAY_ORDER if d in present]
+        frame["Weekday"] = pd.Categorical(frame["Weekday"].astype(str), categories=order, ordered=True)
+    grouped = frame.groupby(list(keys), sort=True, observed=True)
+    codes = grouped.ngroup().to_numpy()
+    labels = frame.drop_duplicates().sort_values(list(keys))
+    if len(keys) == 1:
+        index = pd.Index(labels[keys[0]].astype(object), name=keys[0])
+    else:
+        index = pd.MultiIndex.from_frame(labels.astype(object))
+    return codes, index
+
+
+def stationary_bootstrap_indices(
+    rng: np.random.Generator, n_paths: int, n_days: int, n_obs: int, block: float
+) -> np.ndarray:
+    """
+    Politis-Romano stationary bootstrap: blocks with geometric lengths (mean `block`)
+    starting at uniform random rows, wrapping around the sample.
+
+    Returns:
+        np.ndarray: (n_paths, n_days) row indices into the sample.
+    """
+    t = np.arange(n_days)
+    new = rng.random((n_paths, n_days)) < 1.0 / block
+    new[:, 0] = True
+    block_start = np.maximum.accumulate(np.where(new, t, 0), axis=1)
+    origin = np.take_along_axis(rng.integers(0, n_obs, (n_paths, n_days)), block_start, axis=1)
+    return (origin + t - block_start) % n_obs
+
+
+def calendar_bootstrap_indices(
+    rng: np.random.Generator, n_paths: int, cells: np.ndarray
+) -> np.ndarray:
+    """
+    Bootstrap that keeps the calendar: each day is drawn from the sample days in
+    the same calendar cell (e.g. same weekday and month).
+
+    Returns:
+        np.ndarray: (n_paths, n_days) row indices into the sample.
+    """
+    idx = np.empty((n_paths, len(cells)), dtype=np.intp)
+    for cell in np.unique(cells):
+        members = np.flatnonzero(cells == cell)
+        idx[:, members] = members[rng.integers(0, len(members), (n_paths, len(members)))]
+    return idx
+
+
+def simulate_paths(
+    returns: np.ndarray,
+    n_paths: int,
+    method: str = "block",
+    block: float = 20.0,
+    cells: Optional[np.ndarray] = None,
+    seed=None,
+) -> np.ndarray:
+    """
+    Synthetic return histories with the same length (and calendar) as the sample.
+
+    Args:
+        returns (np.ndarray): Observed returns in percent, without NaNs.
+        n_paths (int): Number of paths.
+        method (str): "gbm" (i.i.d. lognormal fitted to the sample), "block"
+            (stationary block bootstrap) or "calendar" (bootstrap within calendar cells).
+        block (float): Mean block length for "block".
+        cells (np.ndarray, optional): Calendar cell code per day, required for "calendar".
+        seed: Seed or np.random.Generator.
+
+    Returns:
+        np.ndarray: (n_paths, n_days) simulated returns in percent.
+    """
+    rng = np.random.default_rng(seed)
+    returns = np.asarray(returns, dtype=np.float64)
+    n = len(returns)
+    if method == "gbm":
+        log_r = np.log1p(returns / 100.0)
+        z = rng.standard_normal((n_paths, n))
+        return np.expm1(log_r.mean() + log_r.std(ddof=1) * z) * 100.0
+    if method == "block":
+        return returns[stationary_bootstrap_indices(rng, n_paths, n, n, block)]
+    if method == "calendar":
+        if cells is None:
+            raise ValueError("method='calendar' requires calendar cells.")
+        return returns[calendar_bootstrap_indices(rng, n_paths, cells)]
+    raise ValueError(f"Unknown method '{method}'. Available methods: {', '.join(METHODS)}")
+
+
+def to_prices(paths: np.ndarray, start: float = 100.0) -> np.ndarray:
+    """
+    Price paths from percent-return paths.
+    """
+    return start * np.cumprod(1.0 + paths / 100.0, axis=-1)
+
+
+def group_means(paths: np.ndarray, codes: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    Mean of every path by calendar group, for all paths in one bincount.
+
+    Args:
+        paths (np.ndarray): (n_paths, n_days) returns.
+        codes (np.ndarray): (n_days,) group codes shared by all paths.
+        n_groups (int): Number of groups.
+
+    Returns:
+        np.ndarray: (n_paths, n_groups) group means.
+    """
+    n_paths = len(paths)
+    flat = (np.arange(n_paths)[:, None] * n_groups + codes).ravel()
+    sums = np.bincount(flat, weights=paths.ravel(), minlength=n_paths * n_groups)
+    counts = np.bincount(codes, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sums.reshape(n_paths, n_groups) / counts
+
+
+def _simulate_chunk(
+    returns: np.ndarray,
+    n_paths: int,
+    method: str,
+    block: float,
+    cells: Optional[np.ndarray],
+    views: Dict[str, Tuple[np.ndarray, int]],
+    seed: np.random.SeedSequence,
+) -> Dict[str, np.ndarray]:
+    paths = simulate_paths(returns, n_paths, method, block, cells, seed)
+    return {v: group_means(paths, codes, n) for v, (codes, n) in views.items()}
+
+
+def simulate_views(
+    df: pd.DataFrame,
+    col: str = "Change",
+    views: Sequence[str] = ("W", "M"),
+    method: str = "block",
+    n_paths: int = 1000,
+    block: float = 20.0,
+    keep: Sequence[str] = ("Weekday", "Month"),
+    chunk_size: int = 250,
+    workers: int = 1,
+    seed: int = 0,
+) -> Tuple[Dict[str, np.ndarray], Dict[str, pd.Index], Dict[str, np.ndarray]]:
+    """
+    Seasonal views of simulated histories.
+
+    Paths are generated and reduced in chunks of `chunk_size` (memory stays at about
+    chunk_size x n_days per array), optionally across a process pool. Every chunk has
+    its own spawned seed, so results do not depend on `workers`.
+
+    Args:
+        df (pd.DataFrame): Rows with `col` and the calendar columns.
+        col (str): Return column to simulate.
+        views (list): View types from VIEW_KEYS.
+        method (str): "gbm", "block" or "calendar" (see simulate_paths).
+        n_paths (int): Number of paths.
+        block (float): Mean block length for "block".
+        keep (list): Calendar columns whose cells the "calendar" bootstrap preserves.
+        chunk_size (int): Paths generated at once.
+        workers (int): Process pool size; 1 runs in-process.
+        seed (int): Base seed.
+
+    Returns:
+        Tuple: (simulated, labels, observed) dicts keyed by view: (n_paths, n_groups)
+            simulated group means, the group labels and the (n_groups,) observed means.
+    """
+    unknown = [v for v in views if v not in VIEW_KEYS]
+    if unknown:
+        raise ValueError(f"Unknown view(s) {unknown}. Available views: {', '.join(VIEW_KEYS)}")
+    df = df[np.isfinite(df[col].to_numpy(dtype=np.float64))]
+    if len(df) < 2:
+        raise ValueError(f"Not enough '{col}' observations to simulate.")
+    returns = df[col].to_numpy(dtype=np.float64)
+    codes, labels = {}, {}
+    for v in views:
+        codes[v], labels[v] = calendar_codes(df, VIEW_KEYS[v])
+    cells = calendar_codes(df, list(keep))[0] if method == "calendar" else None
+    spec = {v: (codes[v], len(labels[v])) for v in views}
+    sizes = [min(chunk_size, n_paths - s) for s in range(0, n_paths, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [(returns, n, method, block, cells, spec, s) for n, s in zip(sizes, seeds)]
+    if workers > 1 and len(args) > 1:
+        with ProcessPoolExecutor(workers) as pool:
+            chunks = list(pool.map(_simulate_chunk, *zip(*args)))
+    else:
+        chunks = [_simulate_chunk(*a) for a in args]
+    simulated = {v: np.concatenate([c[v] for c in chunks]) for v in views}
+    observed = {v: group_means(returns[None, :], codes[v], len(labels[v]))[0] for v in views}
+    return simulated, labels, observed
+
+
+def _weights(df: pd.DataFrame, col: str, view: str, labels: pd.Index) -> np.ndarray:
+    """
+    Share of the (non-NaN) days falling in each group of a view.
+    """
+    df = df[np.isfinite(df[col].to_numpy(dtype=np.float64))]
+    codes, _ = calendar_codes(df, VIEW_KEYS[view])
+    counts = np.bincount(codes, minlength=len(labels))
+    return counts / counts.sum()
+
+
+def stress_test(
+    df: pd.DataFrame,
+    col: str = "Change",
+    views: Sequence[str] = ("W", "M"),
+    method: str = "block",
+    n_paths: int = 1000,
+    confidence: float = 0.95,
+    **kwargs,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Judge the seasonal edges of a return column against simulated histories.
+
+    The edge of a group is its mean minus the overall mean. With "gbm" and "block"
+    the paths have no calendar effect, so p_value is the share of paths with an edge
+    at least as large in magnitude (a null test). With "calendar" the paths keep the
+    calendar, so sim_lo/sim_hi bound the edge and p_value is the two-sided bootstrap
+    probability that its sign is wrong.
+
+    Args:
+        df (pd.DataFrame): Rows with `col` and the calendar columns.
+        col (str): Return column.
+        views (list): View types ("W", "M", "D", "WM", "DWM").
+        method (str): "gbm", "block" or "calendar".
+        n_paths (int): Number of simulated paths.
+        confidence (float): Coverage of the sim_lo/sim_hi quantile band.
+        **kwargs: simulate_views options (block, keep, chunk_size, workers, seed).
+
+    Returns:
+        Dict[str, pd.DataFrame]: Per view, indexed by calendar group, with observed (mean),
+            edge, sim_mean, sim_lo, sim_hi (of the simulated edge) and p_value.
+    """
+    simulated, labels, observed = simulate_views(df, col, views, method, n_paths, **kwargs)
+    overall = np.nanmean(df[col].to_numpy(dtype=np.float64))
+    alpha = (1 - confidence) / 2
+    out = {}
+    for v in views:
+        sims = simulated[v]
+        # Path-wise overall mean, weighting each group by its day count
+        sim_edge = sims - (sims * _weights(df, col, v, labels[v])).sum(axis=1, keepdims=True)
+        edge = observed[v] - overall
+        if method == "calendar":
+            tail = np.minimum((sim_edge <= 0).mean(axis=0), (sim_edge >= 0).mean(axis=0))
+            p_value = np.minimum(1.0, 2 * tail)
+        else:
+            extreme = (np.abs(sim_edge) >= np.abs(edge)).sum(axis=0)
+            p_value = (1 + extreme) / (1 + len(sims))
+        out[v] = pd.DataFrame(
+            {
+                "observed": observed[v],
+                "edge": edge,
+                "sim_mean": sim_edge.mean(axis=0),
+                "sim_lo": np.quantile(sim_edge, alpha, axis=0),
+                "sim_hi": np.quantile(sim_edge, 1 - alpha, axis=0),
+                "p_value": p_value,
+            },
+            index=labels[v],
+        )
+    return out
+
@@ -0,0 +1,284 @@
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from scipy import fft
+from scipy.special import gammaln
+
+METHODS = ("lombscargle", "fft")
+
+
+def _as_matrix(data: Union[pd.Series, pd.DataFrame]) -> pd.DataFrame:
+    if isinstance(data, pd.Series):
+        return data.to_frame(data.name if data.name is not None else 0)
+    return data
+
+
+def time_axis(index: pd.Index, time: str = "calendar") -> np.ndarray:
+    """
+    Sample times of the rows.
+
+    Args:
+        index (pd.Index): Row index (a DatetimeIndex for time="calendar").
+        time (str): "calendar" for days since the first row (fractional for intraday
+            bars, weekends and holidays leave gaps), "trading" for the row number.
+
+    Returns:
+        np.ndarray: Float times, in days or rows.
+    """
+    if time == "trading":
+        return np.arange(len(index), dtype=np.float64)
+    if time == "calendar":
+        if not isinstance(index, pd.DatetimeIndex):
+            raise ValueError("time='calendar' needs a DatetimeIndex.")
+        ns = index.asi8
+        return (ns - ns[0]) / 86_400e9
+    raise ValueError("time must be 'calendar' or 'trading'.")
+
+
+def frequency_grid(
+    baseline: float, min_period: float = 2.0, max_period: Optional[float] = None, oversample: int = 5
+) -> np.ndarray:
+    """
+    Evenly spaced frequencies (cycles per time unit) between 1 / max_period and
+    1 / min_period, `oversample` points per 1 / baseline resolution element.
+    """
+    max_period = max_period or baseline / 2
+    if not 0 < min_period < max_period:
+        raise ValueError("Need 0 < min_period < max_period.")
+    step = 1.0 / (oversample * baseline)
+    return np.arange(1.0 / max_period, 1.0 / min_period + step / 2, step)
+
+
+def lomb_scargle(
+    t: np.ndarray, values: np.ndarray, freqs: np.ndarray, chunk_size: int = 512
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lomb-Scargle periodogram of many series sampled at (a subset of) the same times.
+
+    Every series uses only its own non-NaN rows. All sums over time are matrix products
+    with the shared cos/sin tables, so the whole universe is done in a few BLAS calls
+    per chunk of frequencies.
+
+    Args:
+        t (np.ndarray): (T,) sample times.
+        values (np.ndarray): (T, N) series, NaN where missing.
+        freqs (np.ndarray): (F,) frequencies in cycles per time unit.
+        chunk_size (int): Frequencies evaluated at once (memory is about T x chunk_size).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (N, F) power with standard normalization (share of
+            the variance explained by a sinusoid, in [0, 1]) and (N,) observation counts.
+    """
+    mask = np.isfinite(values)
+    n = mask.sum(axis=0).astype(np.float64)
+    m = mask.astype(np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(mask, values, 0.0).sum(axis=0) / n
+    y = np.where(mask, values - mean, 0.0)
+    yy = (y * y).sum(axis=0)
+    power = np.empty((values.shape[1], len(freqs)))
+    step = np.diff(freqs)
+    uniform = len(freqs) > 1 and np.allclose(step, step[0], rtol=1e-9, atol=0)
+    for s in range(0, len(freqs), chunk_size):
+        f = freqs[s : s + chunk_size]
+        if uniform:
+            # exp(i w t) along an even grid by recurrence: one complex multiply per
+            # entry instead of a cos and a sin
+            e = np.empty((len(t), len(f)), dtype=np.complex128)
+            e[:, 0] = np.exp(2j * np.pi * f[0] * t)
+            e[:, 1:] = np.exp(2j * np.pi * step[0] * t)[:, None]
+            e = np.cumprod(e, axis=1)
+        else:
+            e = np.exp(2j * np.pi * np.outer(t, f))
+        # Real matmuls on the interleaved (re, im) view of the complex tables
+        ye = y.T @ e.view(np.float64)
+        me2 = m.T @ (e * e).view(np.float64)
+        yc, ys = ye[:, 0::2], ye[:, 1::2]
+        cc = 0.5 * (n[:, None] + me2[:, 0::2])
+        cs = 0.5 * me2[:, 1::2]
+        ss = n[:, None] - cc
+        # Time offset tau that decouples the sine and cosine terms
+        wtau = 0.5 * np.arctan2(2 * cs, cc - ss)
+        ct, st = np.cos(wtau), np.sin(wtau)
+        a = yc * ct + ys * st
+        b = ys * ct - yc * st
+        cct = cc * ct * ct + 2 * cs * ct * st + ss * st * st
+        sst = ss * ct * ct - 2 * cs * ct * st + cc * st * st
+        with np.errstate(invalid="ignore", divide="ignore"):
+            power[:, s : s + chunk_size] = (a * a / cct + b * b / sst) / yy[:, None]
+    return np.clip(power, 0.0, 1.0), n
+
+
+def fft_periodogram(
+    values: np.ndarray, oversample: int = 5
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Classical periodogram on the row grid, batched with one rfft over all series.
+
+    Missing rows are treated as zeros after removing the mean, which is exact for
+    complete series and an approximation otherwise (use lomb_scargle for gappy data).
+
+    Args:
+        values (np.ndarray): (T, N) series, NaN where missing.
+        oversample (int): Zero-padding factor of the frequency grid.
+
+    Returns:
+        Tuple: (F,) frequencies in cycles per row (zero excluded), (N, F) power with
+            standard normalization and (N,) observation counts.
+    """
+    mask = np.isfinite(values)
+    n = mask.sum(axis=0).astype(np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(mask, values, 0.0).sum(axis=0) / n
+    y = np.where(mask, values - mean, 0.0)
+    yy = (y * y).sum(axis=0)
+    nfft = fft.next_fast_len(oversample * len(values), real=True)
+    spec = fft.rfft(y.T, nfft, axis=1)[:, 1:]
+    freqs = np.arange(1, nfft // 2 + 1) / nfft
+    with np.errstate(invalid="ignore", divide="ignore"):
+        power = 2 * np.abs(spec) ** 2 / (n * yy)[:, None]
+    return freqs, np.clip(power, 0.0, 1.0), n
+
+
+def false_alarm_probability(
+    power: np.ndarray, n: np.ndarray, fmax: float, t_var: np.ndarray
+) -> np.ndarray:
+    """
+    Baluev (2008) false-alarm probability of a periodogram peak: the chance that pure
+    noise gives a peak at least this high anywhere up to `fmax`.
+
+    Args:
+        power (np.ndarray): Standard-normalized peak powers, (N, K).
+        n (np.ndarray): Observations per series, (N,).
+        fmax (float): Highest frequency searched.
+        t_var (np.ndarray): Variance of each series' sample times, (N,).
+
+    Returns:
+        np.ndarray: Probabilities with the shape of `power`.
+    """
+    z = np.clip(power, 0.0, 1.0)
+    n = np.asarray(n, dtype=np.float64)[:, None]
+    nh, nk = n - 1, n - 3
+    gamma = np.sqrt(2 / nh) * np.exp(gammaln(nh / 2) - gammaln((nh - 1) / 2))
+    w = fmax * np.sqrt(4 * np.pi * np.asarray(t_var, dtype=np.float64))[:, None]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        single = (1 - z) ** (0.5 * nk)
+        tau = w * gamma * (1 - z) ** (0.5 * (nk - 1)) * np.sqrt(0.5 * nh * z)
+        fap = 1 - (1 - single) * np.exp(-tau)
+    return np.clip(fap, 0.0, 1.0)
+
+
+def _spectrum(
+    data: pd.DataFrame,
+    time: str,
+    method: str,
+    min_period: float,
+    max_period: Optional[float],
+    oversample: int,
+    chunk_size: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    values = data.to_numpy(dtype=np.float64)
+    if len(values) < 4:
+        raise ValueError("Need at least 4 rows for a periodogram.")
+    if method == "lombscargle":
+        t = time_axis(data.index, time)
+        freqs = frequency_grid(t[-1] - t[0], min_period, max_period, oversample)
+        power, n = lomb_scargle(t, values, freqs, chunk_size)
+    elif method == "fft":
+        if time != "trading":
+            raise ValueError("method='fft' needs a regular grid: use time='trading'.")
+        t = time_axis(data.index, time)
+        freqs, power, n = fft_periodogram(values, oversample)
+        max_period = max_period or len(values) / 2
+        keep = (freqs >= 1.0 / max_period) & (freqs <= 1.0 / min_period)
+        freqs, power = freqs[keep], power[:, keep]
+    else:
+        raise ValueError(f"Unknown method '{method}'. Available methods: {', '.join(METHODS)}")
+    mask = np.isfinite(values)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t_mean = (mask * t[:, None]).sum(axis=0) / n
+        t_var = (mask * (t[:, None] - t_mean) ** 2).sum(axis=0) / n
+    return freqs, power, n, t_var
+
+
+def periodogram(
+    data: Union[pd.Series, pd.DataFrame],
+    time: str = "calendar",
+    method: str = "lombscargle",
+    min_period: float = 2.0,
+    max_period: Optional[float] = None,
+    oversample: int = 5,
+    chunk_size: int = 512,
+) -> pd.DataFrame:
+    """
+    Periodogram of one series or of every column of a date x ticker matrix.
+
+    Args:
+        data (pd.Series or pd.DataFrame): Returns or volumes, NaN where missing.
+        time (str): "calendar" (periods in days, irregular sampling) or "trading"
+            (periods in rows).
+        method (str): "lombscargle" (any sampling, per-column gaps) or "fft"
+            (time="trading" only; fastest on complete series).
+        min_period (float): Shortest cycle searched.
+        max_period (float, optional): Longest cycle searched. Defaults to half the span.
+        oversample (int): Frequency grid points per resolution element.
+        chunk_size (int): Frequencies evaluated at once (Lomb-Scargle).
+
+    Returns:
+        pd.DataFrame: Standard-normalized power indexed by Period, one column per series.
+    """
+    data = _as_matrix(data)
+    freqs, power, _, _ = _spectrum(data, time, method, min_period, max_period, oversample, chunk_size)
+    return pd.DataFrame(power.T, index=pd.Index(1.0 / freqs, name="Period"), columns=data.columns)
+
+
+def find_cycles(
+    data: Union[pd.Series, pd.DataFrame],
+    top: int = 5,
+    time: str = "calendar",
+    method: str = "lombscargle",
+    min_period: float = 2.0,
+    max_period: Optional[float] = None,
+    oversample: int = 5,
+    chunk_size: int = 512,
+) -> pd.DataFrame:
+    """
+    Dominant cycles of one series or of every column of a date x ticker matrix.
+
+    Peaks are the local maxima of the periodogram, ranked by power; the false-alarm
+    probability accounts for the whole frequency range searched.
+
+    Args:
+        data (pd.Series or pd.DataFrame): Returns or volumes, NaN where missing.
+        top (int): Peaks kept per series.
+        time, method, min_period, max_period, oversample, chunk_size: See periodogram().
+
+    Returns:
+        pd.DataFrame: One row per (ticker, rank) with period, frequency, power and fap.
+    """
+    data = _as_matrix(data)
+    freqs, power, n, t_var = _spectrum(
+        data, time, method, min_period, max_period, oversample, chunk_size
+    )
+    filled = np.nan_to_num(power, nan=-1.0)
+    peaks = np.zeros(power.shape, dtype=bool)
+    peaks[:, 1:-1] = (filled[:, 1:-1] > filled[:, :-2]) & (filled[:, 1:-1] >= filled[:, 2:])
+    ranked = np.where(peaks, filled, -np.inf)
+    top = min(top, power.shape[1])
+    idx = np.argsort(-ranked, axis=1, kind="stable")[:, :top]
+    best = np.take_along_axis(ranked, idx, axis=1)
+    fap = false_alarm_probability(np.maximum(best, 0.0), n, freqs.max(), t_var)
+    rows = np.isfinite(best) & (best >= 0)
+    tick, rank = np.nonzero(rows)
+    f = freqs[idx[tick, rank]]
+    return pd.DataFrame(
+        {
+            "ticker": np.asarray(data.columns)[tick],
+            "rank": rank + 1,
+            "period": 1.0 / f,
+            "frequency": f,
+            "power": best[tick, rank],
+            "fap": fap[tick, rank],
+        }
+    )
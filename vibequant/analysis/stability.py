@@ -0,0 +1,224 @@
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from vibequant.analysis.simulate import VIEW_KEYS, calendar_codes
+
+
+def calendar_frame(index: pd.DatetimeIndex) -> pd.DataFrame:
+    """
+    Weekday, Month and DayOfMonth columns for a date index.
+    """
+    return pd.DataFrame(
+        {"Weekday": index.day_name(), "Month": index.month, "DayOfMonth": index.day},
+        index=index,
+    )
+
+
+def cell_moments(
+    values: np.ndarray, codes: np.ndarray, n_cells: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-cell sums, sums of squares and counts of every column, NaN skipped, in three
+    bincounts over all columns at once.
+
+    Args:
+        values (np.ndarray): (T, N) values.
+        codes (np.ndarray): (T,) cell of every row, shared by the columns.
+        n_cells (int): Number of cells.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (n_cells, N) sums, sums of squares, counts.
+    """
+    n = values.shape[1]
+    valid = np.isfinite(values)
+    x = np.where(valid, values, 0.0)
+    flat = (codes[:, None] * n + np.arange(n)).ravel()
+    size = n_cells * n
+    sums = np.bincount(flat, weights=x.ravel(), minlength=size)
+    sumsq = np.bincount(flat, weights=(x * x).ravel(), minlength=size)
+    counts = np.bincount(flat, weights=valid.ravel(), minlength=size)
+    shape = (n_cells, n)
+    return sums.reshape(shape), sumsq.reshape(shape), counts.reshape(shape)
+
+
+def _group_year_codes(
+    df: pd.DataFrame, view: str
+) -> Tuple[np.ndarray, pd.Index, np.ndarray, pd.Index]:
+    if view not in VIEW_KEYS:
+        raise ValueError(f"Unknown view '{view}'. Available views: {', '.join(VIEW_KEYS)}")
+    if not isinstance(df.index, pd.DatetimeIndex):
+        raise ValueError("Year breakdown needs a DatetimeIndex.")
+    codes, labels = calendar_codes(df, VIEW_KEYS[view])
+    year_codes, years = pd.factorize(df.index.year, sort=True)
+    return codes, labels, year_codes, pd.Index(years, name="Year")
+
+
+def yearly_moments(
+    df: pd.DataFrame, values: np.ndarray, view: str = "W"
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, pd.Index, pd.Index]:
+    """
+    Sums, sums of squares and counts by (calendar group, year) in one pass.
+
+    Args:
+        df (pd.DataFrame): Rows with a DatetimeIndex and the calendar columns of the view.
+        values (np.ndarray): (T, N) values aligned with the rows of df.
+        view (str): View type from VIEW_KEYS ("W", "M", "D", "WM", "DWM").
+
+    Returns:
+        Tuple: (G, Y, N) sums, sums of squares and counts, then the group labels and years.
+    """
+    codes, labels, year_codes, years = _group_year_codes(df, view)
+    g, y = len(labels), len(years)
+    sums, sumsq, counts = cell_moments(values, codes * y + year_codes, g * y)
+    shape = (g, y, values.shape[1])
+    return sums.reshape(shape), sumsq.reshape(shape), counts.reshape(shape), labels, years
+
+
+def consistency_scores(
+    sums: np.ndarray, sumsq: np.ndarray, counts: np.ndarray, min_obs: int = 1
+) -> pd.DataFrame:
+    """
+    Stability of every calendar group's edge across years.
+
+    Args:
+        sums, sumsq, counts (np.ndarray): (G, Y, N) moments from yearly_moments.
+        min_obs (int): Days a (group, year) cell needs to count as a year.
+
+    Returns:
+        pd.DataFrame: (G * N) rows, group-major, with:
+            mean, t_stat: pooled over all days.
+            n_years: years with at least `min_obs` days.
+            sign_share: share of those years whose mean has the pooled mean's sign.
+            sign_p: two-sided binomial p-value of the year signs.
+            year_mean, year_median, year_std: mean, median and dispersion of yearly means.
+            year_t: t-stat of the yearly means (each year weighs the same).
+            top_year_share: share of the yearly sums in the pooled direction coming from
+                the single largest one, in [0, 1] (1 = one year is the whole edge).
+    """
+    n = counts.sum(axis=1)
+    total = sums.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / n
+        var = (sumsq.sum(axis=1) - n * mean * mean) / (n - 1)
+        t_stat = mean / np.sqrt(np.maximum(var, 0) / n)
+        yearly = np.where(counts >= max(min_obs, 1), sums / counts, np.nan)
+    valid = np.isfinite(yearly)
+    n_years = valid.sum(axis=1)
+    sign = np.sign(mean)[:, None, :]
+    agree = (np.sign(yearly) == sign) & valid
+    positive = ((yearly > 0) & valid).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sign_share = agree.sum(axis=1) / n_years
+        tail = np.minimum(
+            stats.binom.cdf(positive, n_years, 0.5), stats.binom.sf(positive - 1, n_years, 0.5)
+        )
+        sign_p = np.minimum(1.0, 2 * tail)
+        year_mean = np.nansum(yearly, axis=1) / n_years
+        spread = np.nansum((yearly - year_mean[:, None, :]) ** 2, axis=1)
+        year_std = np.sqrt(spread / (n_years - 1))
+        year_t = year_mean / (year_std / np.sqrt(n_years))
+        directed = sums * sign
+        top_year_share = directed.max(axis=1) / np.maximum(directed, 0).sum(axis=1)
+    year_median = np.full(mean.shape, np.nan)
+    some = n_years > 0
+    if some.any():
+        year_median[some] = np.nanmedian(yearly.transpose(0, 2, 1)[some], axis=1)
+    out = {
+        "mean": mean,
+        "t_stat": t_stat,
+        "n_years": n_years,
+        "sign_share": sign_share,
+        "sign_p": np.where(n_years > 0, sign_p, np.nan),
+        "year_mean": year_mean,
+        "year_median": year_median,
+        "year_std": year_std,
+        "year_t": year_t,
+        "top_year_share": top_year_share,
+    }
+    return pd.DataFrame({k: np.asarray(v).ravel() for k, v in out.items()})
+
+
+def yearly_view(df: pd.DataFrame, col: str = "Change", view: str = "W") -> pd.DataFrame:
+    """
+    Mean of a column by calendar group and year.
+
+    Args:
+        df (pd.DataFrame): Rows with a DatetimeIndex, `col` and the calendar columns.
+        col (str): Return column.
+        view (str): View type ("W", "M", "D", "WM", "DWM").
+
+    Returns:
+        pd.DataFrame: Calendar groups as rows, years as columns.
+    """
+    values = df[col].to_numpy(dtype=np.float64)[:, None]
+    sums, _, counts, labels, years = yearly_moments(df, values, view)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums[:, :, 0] / counts[:, :, 0]
+    return pd.DataFrame(means, index=labels, columns=years)
+
+
+def stability(
+    df: pd.DataFrame, col: str = "Change", view: str = "W", min_obs: int = 1
+) -> pd.DataFrame:
+    """
+    Consistency scores of every calendar group of a view (see consistency_scores).
+
+    Returns:
+        pd.DataFrame: Indexed by calendar group.
+    """
+    values = df[col].to_numpy(dtype=np.float64)[:, None]
+    sums, sumsq, counts, labels, _ = yearly_moments(df, values, view)
+    scores = consistency_scores(sums, sumsq, counts, min_obs)
+    scores.index = labels
+    return scores
+
+
+def stability_scan(
+    returns: pd.DataFrame,
+    view: str = "W",
+    min_obs: int = 1,
+    min_years: int = 5,
+    chunk_size: int = 512,
+) -> pd.DataFrame:
+    """
+    Consistency scores of every (ticker, calendar group) of a universe, ranked by
+    stability rather than pooled t-stat.
+
+    The calendar and year codes come from the shared date index once, and each chunk
+    of tickers is reduced with three bincounts.
+
+    Args:
+        returns (pd.DataFrame): Date x ticker returns (see vibequant.analysis.matrix.to_matrix).
+        view (str): View type ("W", "M", "D", "WM", "DWM").
+        min_obs (int): Days a (group, year) cell needs to count as a year.
+        min_years (int): Drop rows with fewer qualifying years.
+        chunk_size (int): Tickers reduced at once (bounds the (G, Y, chunk) arrays).
+
+    Returns:
+        pd.DataFrame: One row per (ticker, group) with the view's calendar keys and the
+            consistency_scores columns, sorted by sign_share then |year_t|.
+    """
+    calendar = calendar_frame(pd.DatetimeIndex(returns.index))
+    values = returns.to_numpy(dtype=np.float64)
+    tickers = np.asarray(returns.columns)
+    parts = []
+    for s in range(0, len(tickers), chunk_size):
+        sums, sumsq, counts, labels, _ = yearly_moments(
+            calendar, values[:, s : s + chunk_size], view
+        )
+        scores = consistency_scores(sums, sumsq, counts, min_obs)
+        chunk = tickers[s : s + chunk_size]
+        keys = labels.to_frame(index=False).loc[np.repeat(np.arange(len(labels)), len(chunk))]
+        scores.insert(0, "ticker", np.tile(chunk, len(labels)))
+        for i, name in enumerate(keys.columns):
+            scores.insert(1 + i, name, keys[name].to_numpy())
+        parts.append(scores)
+    out = pd.concat(parts, ignore_index=True)
+    out = out[out["n_years"] >= min_years]
+    order = np.lexsort(
+        (-out["year_t"].abs().fillna(0).to_numpy(), -out["sign_share"].fillna(0).to_numpy())
+    )
+    return out.iloc[order].reset_index(drop=True)
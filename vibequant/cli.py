@@ -0,0 +1,396 @@
+"""
+Command-line batch runner: ``vibequant {fetch,stats,plot,screen,serve} ...``.
+
+Each ticker is one job. Finished jobs are appended to a JSONL manifest in the
+output directory, so an interrupted run picks up where it stopped.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Set
+
+import pandas as pd
+
+MANIFEST_NAME = "manifest.jsonl"
+DEFAULT_VIEWS = ["W", "M", "D", "WM", "DWM"]
+
+
+def _safe_name(ticker: str) -> str:
+    return ticker.replace("/", "_").replace(" ", "_")
+
+
+def _interface(crypto: bool):
+    from vibequant import vcrypto, vstock
+
+    return vcrypto if crypto else vstock
+
+
+def _data_path(ticker: str, opts: Dict[str, Any]) -> str:
+    """
+    Cache file of a ticker's raw data, keyed on the source, asset class and fetch window
+    so runs with another --source, --crypto or --start/--end do not reuse it.
+    """
+    name = _safe_name(ticker)
+    if opts.get("start") or opts.get("end"):
+        name += f"_{opts.get('start') or 'first'}_{opts.get('end') or 'last'}"
+    kind = "crypto" if opts.get("crypto") else "stock"
+    source = _safe_name(str(opts.get("source")))
+    return os.path.join(opts["out"], "data", source, kind, f"{name}.parquet")
+
+
+def _job_key(command: str, opts: Dict[str, Any]) -> str:
+    """
+    Short hash of the options that change a command's outputs, so the manifest only
+    skips tickers finished with the same options.
+    """
+    options = {
+        k: opts.get(k)
+        for k in ("start", "end", "source", "crypto", "returns", "views", "by")
+    }
+    blob = json.dumps([command, options], sort_keys=True, default=str)
+    return hashlib.sha1(blob.encode()).hexdigest()[:12]
+
+
+def _load_or_fetch(ticker: str, opts: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Read the ticker's raw data from <out>/data/<SOURCE>/<stock|crypto>, fetching and
+    writing it if missing.
+    """
+    path = _data_path(ticker, opts)
+    if os.path.exists(path) and not opts["refresh"]:
+        return pd.read_parquet(path)
+    interface = _interface(opts["crypto"])
+    df = interface._get_source(opts["source"]).fetch(ticker, opts["start"], opts["end"])
+    if df is None or len(df) == 0:
+        raise ValueError(f"No data returned for '{ticker}'.")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    df.to_parquet(path)
+    return df
+
+
+def _run_ticker(command: str, ticker: str, opts: Dict[str, Any]) -> List[str]:
+    """
+    Run one command for one ticker and return the files written.
+    Module-level so it can be shipped to worker processes.
+    """
+    from vibequant.analysis.screen import compute_metrics
+    from vibequant.wrappers.vibes import VibeFrame
+
+    df = _load_or_fetch(ticker, opts)
+    name = _safe_name(ticker)
+    outputs = [_data_path(ticker, opts)]
+    if command == "fetch":
+        return outputs
+
+    vf = VibeFrame(df, is_stock=not opts["crypto"], returns=opts["returns"])
+    if command == "stats":
+        os.makedirs(os.path.join(opts["out"], "views"), exist_ok=True)
+        os.makedirs(os.path.join(opts["out"], "stats"), exist_ok=True)
+        for view in opts["views"]:
+            vf.transform_view(view)
+            path = os.path.join(opts["out"], "views", f"{name}_{view}.parquet")
+            vf.df.to_parquet(path)
+            outputs.append(path)
+        for by in opts["by"]:
+            path = os.path.join(opts["out"], "stats", f"{name}_{by}.parquet")
+            stats = vf.grouped_stats(by=by)
+            if isinstance(stats.columns, pd.MultiIndex):
+                stats.columns = ["_".join(c) for c in stats.columns]
+            stats.to_parquet(path)
+            outputs.append(path)
+        # Screening metrics, gathered into <out>/store by build_store()
+        os.makedirs(os.path.join(opts["out"], "metrics"), exist_ok=True)
+        path = os.path.join(opts["out"], "metrics", f"{name}.json")
+        record = {
+            "ticker": ticker,
+            "asof": str(vf.original_df.index[-1].date()),
+            "metrics": compute_metrics(vf),
+        }
+        with open(path, "w") as f:
+            json.dump(record, f)
+        outputs.append(path)
+    elif command == "plot":
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        os.makedirs(os.path.join(opts["out"], "plots"), exist_ok=True)
+        for view in opts["views"]:
+            vf.transform_view(view)
+            path = os.path.join(opts["out"], "plots", f"{name}_{view}.png")
+            vf.vibe_plot().savefig(path)
+            plt.close("all")
+            outputs.append(path)
+    else:
+        raise ValueError(f"Unknown command '{command}'.")
+    return outputs
+
+
+def read_manifest(out: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Read the checkpoint manifest of an output directory.
+
+    Args:
+        out (str): Output directory.
+
+    Returns:
+        Dict[str, Dict]: Latest record per "<command>:<job>:<ticker>" key.
+    """
+    records: Dict[str, Dict[str, Any]] = {}
+    path = os.path.join(out, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return records
+    with open(path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn last line from a killed run
+            key = f"{record['command']}:{record.get('job', '')}:{record['ticker']}"
+            records[key] = record
+    return records
+
+
+def _completed(out: str, command: str, job: str) -> Set[str]:
+    return {
+        r["ticker"]
+        for r in read_manifest(out).values()
+        if r["command"] == command and r.get("job") == job and r["status"] == "done"
+    }
+
+
+def run_batch(
+    command: str,
+    tickers: List[str],
+    opts: Dict[str, Any],
+    workers: int = 1,
+    resume: bool = True,
+) -> Dict[str, int]:
+    """
+    Run a command over many tickers, checkpointing each finished ticker.
+
+    Args:
+        command (str): "fetch", "stats" or "plot".
+        tickers (list): Tickers to process.
+        opts (dict): Job options (out, start, end, source, crypto, refresh, returns, views, by).
+        workers (int): Size of the process pool; 1 runs in-process.
+        resume (bool): Skip tickers already marked done in the manifest with the same
+            options (window, source, returns, views, by).
+
+    Returns:
+        Dict[str, int]: Counts of "done", "error" and "skipped" tickers.
+    """
+    os.makedirs(opts["out"], exist_ok=True)
+    job = _job_key(command, opts)
+    done = _completed(opts["out"], command, job) if resume else set()
+    unique = list(dict.fromkeys(tickers))
+    todo = [t for t in unique if t not in done]
+    counts = {"done": 0, "error": 0, "skipped": len(unique) - len(todo)}
+
+    manifest = open(os.path.join(opts["out"], MANIFEST_NAME), "a")
+
+    def record(ticker: str, outputs: Optional[List[str]], error: Optional[str]):
+        status = "error" if error else "done"
+        counts[status] += 1
+        entry = {"command": command, "job": job, "ticker": ticker, "status": status}
+        entry.update({"error": error} if error else {"outputs": outputs})
+        manifest.write(json.dumps(entry) + "\n")
+        manifest.flush()
+        os.fsync(manifest.fileno())
+        n = counts["done"] + counts["error"]
+        print(f"[{n}/{len(todo)}] {ticker}: {error or status}", flush=True)
+
+    try:
+        if workers <= 1:
+            for ticker in todo:
+                try:
+                    record(ticker, _run_ticker(command, ticker, opts), None)
+                except Exception as e:
+                    record(ticker, None, f"{type(e).__name__}: {e}")
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(_run_ticker, command, t, opts): t for t in todo
+                }
+                for future in as_completed(futures):
+                    try:
+                        record(futures[future], future.result(), None)
+                    except Exception as e:
+                        record(futures[future], None, f"{type(e).__name__}: {e}")
+    finally:
+        manifest.close()
+    return counts
+
+
+def build_store(out: str):
+    """
+    Load the per-ticker metrics written by `stats` into the metric store <out>/store.
+
+    Returns:
+        MetricStore: The refreshed store.
+    """
+    from vibequant.analysis.screen import MetricStore
+
+    store = MetricStore(os.path.join(out, "store"))
+    folder = os.path.join(out, "metrics")
+    for name in sorted(os.listdir(folder)) if os.path.isdir(folder) else []:
+        if name.endswith(".json"):
+            with open(os.path.join(folder, name)) as f:
+                record = json.load(f)
+            store.add(record["ticker"], record["metrics"], record["asof"])
+    store.flush()
+    return store
+
+
+def screen(args: argparse.Namespace) -> int:
+    from vibequant.analysis.screen import MetricStore
+
+    store = MetricStore(os.path.join(args.out, "store"))
+    try:
+        result = store.screen(
+            args.expr,
+            asof=args.asof,
+            sort=args.sort,
+            ascending=args.ascending,
+            limit=args.limit,
+            columns=args.columns,
+            max_age=args.max_age,
+        )
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    print(result.to_string() if len(result) else "No matches.")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="vibequant", description="Batch fetch, stats and plots for many tickers."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    helps = {
+        "fetch": "download raw data to <out>/data/<SOURCE>/<stock|crypto>/<TICKER>[_<START>_<END>].parquet",
+        "stats": "write views, grouped stats and screening metrics under <out>",
+        "plot": "render view plots to <out>/plots/<TICKER>_<VIEW>.png",
+    }
+    for name, help in helps.items():
+        p = sub.add_parser(name, help=help)
+        p.add_argument("tickers", nargs="*", help="ticker symbols")
+        p.add_argument("--all", action="store_true", help="use every listed ticker")
+        p.add_argument("--crypto", action="store_true", help="use the crypto interface")
+        p.add_argument("--start", default=None, help="start date (YYYY-MM-DD)")
+        p.add_argument("--end", default=None, help="end date (YYYY-MM-DD)")
+        p.add_argument("--source", default="yfinance", help="data source name")
+        p.add_argument("--out", default="vibequant_out", help="output directory")
+        p.add_argument("--workers", type=int, default=1, help="worker processes")
+        p.add_argument("--no-resume", action="store_true", help="ignore the manifest")
+        p.add_argument("--refresh", action="store_true", help="re-download cached data")
+        p.add_argument("--returns", nargs="+", default=None, help="return definitions")
+        if name != "fetch":
+            p.add_argument("--views", nargs="+", default=DEFAULT_VIEWS, help="view types")
+        if name == "stats":
+            p.add_argument("--by", nargs="+", default=["Weekday", "Month", "DayOfMonth"])
+
+    p = sub.add_parser("screen", help="filter the metric store written by `stats`")
+    p.add_argument("expr", help='e.g. "t_Monday > 2 and vol_1y < 30%% and avg_volume > 1M"')
+    p.add_argument("--out", default="vibequant_out", help="output directory")
+    p.add_argument("--asof", default=None, help="as-of date (default: latest)")
+    p.add_argument(
+        "--max-age", type=int, default=7, help="days a ticker's last metrics may lag --asof"
+    )
+    p.add_argument("--sort", default=None, help="metric to sort by")
+    p.add_argument("--ascending", action="store_true", help="sort ascending")
+    p.add_argument("--limit", type=int, default=None, help="maximum rows")
+    p.add_argument("--columns", nargs="+", default=None, help="extra metrics to show")
+
+    p = sub.add_parser("serve", help="serve seasonal views and plots over HTTP")
+    p.add_argument("tickers", nargs="*", help="tickers to precompute at startup")
+    p.add_argument("--crypto", action="store_true", help="use the crypto interface")
+    p.add_argument("--start", default=None, help="start date (YYYY-MM-DD)")
+    p.add_argument("--end", default=None, help="end date (YYYY-MM-DD)")
+    p.add_argument("--source", default="yfinance", help="data source name")
+    p.add_argument("--out", default="vibequant_out", help="data directory")
+    p.add_argument("--returns", nargs="+", default=None, help="return definitions")
+    p.add_argument("--host", default="127.0.0.1", help="interface to bind")
+    p.add_argument("--port", type=int, default=8000, help="port to bind")
+    p.add_argument("--cache-size", type=int, default=256, help="cached responses")
+    return parser
+
+
+def serve(args: argparse.Namespace) -> int:
+    import matplotlib
+
+    matplotlib.use("Agg")
+    from vibequant.service import SeasonalityService, make_server
+    from vibequant.wrappers.vibes import VibeFrame
+
+    opts = {
+        "out": args.out,
+        "start": args.start,
+        "end": args.end,
+        "source": args.source,
+        "crypto": args.crypto,
+        "refresh": False,
+    }
+
+    def loader(ticker: str) -> VibeFrame:
+        try:
+            df = _load_or_fetch(ticker, opts)
+        except ValueError as e:
+            raise KeyError(str(e)) from e
+        return VibeFrame(df, is_stock=not args.crypto, returns=args.returns)
+
+    service = SeasonalityService(loader=loader, cache_size=args.cache_size)
+    service.precompute(args.tickers)
+    server = make_server(service, args.host, args.port)
+    print(f"Serving on http://{args.host}:{server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "serve":
+        return serve(args)
+    if args.command == "screen":
+        return screen(args)
+    tickers = list(args.tickers)
+    if args.all:
+        tickers += _interface(args.crypto).list_tickers(args.source)
+    if not tickers:
+        print("No tickers given (pass symbols or --all).", file=sys.stderr)
+        return 2
+    opts = {
+        "out": args.out,
+        "start": args.start,
+        "end": args.end,
+        "source": args.source,
+        "crypto": args.crypto,
+        "refresh": args.refresh,
+        "returns": args.returns,
+        "views": getattr(args, "views", []),
+        "by": getattr(args, "by", []),
+    }
+    counts = run_batch(
+        args.command, tickers, opts, workers=args.workers, resume=not args.no_resume
+    )
+    if args.command == "stats":
+        build_store(args.out)
+    print(
+        f"done={counts['done']} error={counts['error']} skipped={counts['skipped']}"
+    )
+    return 1 if counts["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
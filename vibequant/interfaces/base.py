@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 
+from vibequant.sources.prefetch import PrefetchScheduler
+from vibequant.sources.router import SourceRouter
 from vibequant.sources.yfinance_source import YFinanceSource
 from vibequant.wrappers.vibes import VibeFrame
 
@@ -46,6 +48,26 @@ class BaseInterface(ABC):
             )
         return self.sources[source]
 
+    def add_router(
+        self, name: str = "hedged", sources: Optional[List[str]] = None, **kwargs
+    ) -> SourceRouter:
+        """
+        Register a SourceRouter over several registered sources, so that
+        fetch(..., source=name) hedges slow requests and fails over between them.
+
+        Args:
+            name (str): Name to register the router under.
+            sources (list, optional): Source names in order of preference. Defaults to all.
+            **kwargs: SourceRouter options (hedge_after, timeout, failure_threshold, ...).
+
+        Returns:
+            SourceRouter: The registered router; use .stats() for per-source health.
+        """
+        names = sources if sources is not None else list(self.sources)
+        router = SourceRouter({n: self._get_source(n) for n in names}, **kwargs)
+        self.sources[name] = router
+        return router
+
     def list_tickers(self, source: str = "yfinance") -> List[str]:
         """
         List available stock tickers from a data source.
@@ -58,12 +80,47 @@ class BaseInterface(ABC):
         """
         return self._get_source(source).list_stock_tickers()
 
+    def prefetch(
+        self,
+        tickers: Optional[List[str]] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        source: str = "yfinance",
+        background: bool = True,
+        **kwargs,
+    ) -> PrefetchScheduler:
+        """
+        Warm the fetch cache for a watchlist so later fetch() calls return immediately.
+
+        Args:
+            tickers (list, optional): Watchlist in priority order. Defaults to list_tickers().
+            start (str, optional): Start date.
+            end (str, optional): End date.
+            source (str): Data source name.
+            background (bool): Keep refreshing on a schedule in a background thread;
+                otherwise warm once and return.
+            **kwargs: PrefetchScheduler options (max_workers, interval, at, max_age, priority).
+
+        Returns:
+            PrefetchScheduler: The scheduler; use .status() to see warm/stale tickers.
+        """
+        tickers = tickers if tickers is not None else self.list_tickers(source)
+        scheduler = PrefetchScheduler(
+            self._get_source(source), tickers, start=start, end=end, **kwargs
+        )
+        if background:
+            scheduler.start()
+        else:
+            scheduler.run_once()
+        return scheduler
+
     def fetch(
         self,
         ticker: str,
         start: Optional[str] = None,
         end: Optional[str] = None,
         source: str = "yfinance",
+        returns: Optional[Union[str, List[str]]] = None,
     ) -> VibeFrame:
         """
         Fetch data for a given ticker from the specified source.
@@ -73,12 +130,13 @@ class BaseInterface(ABC):
             start (str, optional): Start date.
             end (str, optional): End date.
             source (str): Data source name.
+            returns (str or list, optional): Return definition(s) to compute. Defaults to ["Change"].
 
         Returns:
             VibeFrame: Resulting data wrapped in a VibeFrame.
         """
         df = self._get_source(source).fetch(ticker, start, end)
-        vf = VibeFrame(df, is_stock=self.isStock)
+        vf = VibeFrame(df, is_stock=self.isStock, returns=returns)
         return vf
 
     def avg_by_weekday(
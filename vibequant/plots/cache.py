@@ -0,0 +1,201 @@
+import hashlib
+import io
+import os
+import re
+import threading
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from vibequant.utils.cache import LRUCache
+
+# pyplot keeps global figure state, so renders are serialized
+_RENDER_LOCK = threading.Lock()
+
+# On-disk entries: <40 hex key>.<fmt>, plus <entry>.<pid>.<thread>.tmp while written
+_ENTRY_NAME = re.compile(r"[0-9a-f]{40}\.[A-Za-z0-9]+(\.\d+\.\d+\.tmp)?")
+
+
+def hash_frame(df: pd.DataFrame) -> str:
+    """
+    Fast content hash of a DataFrame: values, index, column labels and dtypes.
+
+    Args:
+        df (pd.DataFrame): DataFrame to hash.
+
+    Returns:
+        str: Hex digest.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr(list(df.columns)).encode())
+    h.update(repr([str(t) for t in df.dtypes]).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _hash_value(value: Any) -> str:
+    """
+    Stable token for a plot keyword argument. Frames and arrays are hashed by content,
+    since their reprs are truncated and would make different data collide.
+    """
+    if isinstance(value, pd.DataFrame):
+        return f"df:{hash_frame(value)}"
+    if isinstance(value, pd.Series):
+        return f"series:{hash_frame(value.to_frame())}"
+    if isinstance(value, pd.Index):
+        return f"index:{hash_frame(value.to_frame(index=False))}"
+    if isinstance(value, np.ndarray):
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{value.dtype}|{value.shape}".encode())
+        if value.dtype == object:
+            h.update(repr(value.tolist()).encode())
+        else:
+            h.update(np.ascontiguousarray(value).tobytes())
+        return f"array:{h.hexdigest()}"
+    if isinstance(value, (list, tuple)):
+        return f"{type(value).__name__}[{','.join(_hash_value(v) for v in value)}]"
+    if isinstance(value, dict):
+        items = sorted((repr(k), _hash_value(v)) for k, v in value.items())
+        return f"dict{items!r}"
+    return repr(value)
+
+
+def render_bytes(draw: Callable[[], Any], fmt: str = "png", **savefig_kwargs) -> bytes:
+    """
+    Run a plot function and return the current figure encoded as bytes.
+
+    Args:
+        draw (callable): Zero-argument callable that draws (e.g. lambda: plot_box(df, cols)).
+        fmt (str): Image format understood by matplotlib ("png", "svg", ...).
+
+    Returns:
+        bytes: The encoded figure.
+    """
+    buf = io.BytesIO()
+    with _RENDER_LOCK:
+        try:
+            draw()
+            plt.gcf().savefig(buf, format=fmt, **savefig_kwargs)
+        finally:
+            plt.close("all")
+    return buf.getvalue()
+
+
+class RenderCache:
+    """
+    Content-addressed cache of rendered plots.
+
+    Keys hash the input data, the plot function, the view type and the keyword
+    arguments, so identical requests return the stored bytes without touching
+    matplotlib. Entries live in an in-memory LRU and optionally on disk.
+    """
+
+    def __init__(self, maxsize: int = 64, disk_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            maxsize (int): Number of rendered images kept in memory.
+            disk_dir (str, optional): Directory for the on-disk tier.
+        """
+        self.memory = LRUCache(maxsize)
+        self.disk_dir = disk_dir
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(
+        name: str,
+        frames: Sequence[pd.DataFrame],
+        fmt: str = "png",
+        view: Optional[str] = None,
+        **kwargs,
+    ) -> str:
+        """
+        Build the cache key for a render request.
+
+        Args:
+            name (str): Plot function name.
+            frames (list): DataFrames the plot reads.
+            fmt (str): Output format.
+            view (str, optional): View type.
+            **kwargs: Plot keyword arguments (frames and arrays are hashed by content,
+                anything else must have a stable repr).
+
+        Returns:
+            str: Hex key.
+        """
+        h = hashlib.blake2b(digest_size=20)
+        options = sorted((k, _hash_value(v)) for k, v in kwargs.items())
+        h.update(f"{name}|{view}|{fmt}|{options!r}".encode())
+        for df in frames:
+            h.update(hash_frame(df).encode())
+        return h.hexdigest()
+
+    def _disk_path(self, key: str, fmt: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.{fmt}")
+
+    def get_or_render(self, key: str, draw: Callable[[], Any], fmt: str = "png") -> bytes:
+        """
+        Return cached bytes for key, rendering with draw() on a miss.
+
+        Args:
+            key (str): Key from RenderCache.key().
+            draw (callable): Zero-argument callable that draws the plot.
+            fmt (str): Image format.
+
+        Returns:
+            bytes: The encoded figure.
+        """
+        data = self.memory.get(key)
+        if data is not None:
+            with self._lock:
+                self.hits += 1
+            return data
+        if self.disk_dir and os.path.exists(self._disk_path(key, fmt)):
+            with open(self._disk_path(key, fmt), "rb") as f:
+                data = f.read()
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            data = render_bytes(draw, fmt)
+            with self._lock:
+                self.misses += 1
+            if self.disk_dir:
+                path = self._disk_path(key, fmt)
+                tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+        self.memory.put(key, data)
+        return data
+
+    def clear(self, disk: bool = False) -> None:
+        """
+        Drop the in-memory entries (and the on-disk tier if disk=True). Only files named
+        like cache entries (<key>.<fmt> and their temporary files) are deleted, so a
+        shared directory keeps everything else.
+        """
+        self.memory.clear()
+        if disk and self.disk_dir:
+            for name in os.listdir(self.disk_dir):
+                if _ENTRY_NAME.fullmatch(name):
+                    os.remove(os.path.join(self.disk_dir, name))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int]: Memory hits, disk hits, misses, evictions and current size.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.memory.evictions,
+                "size": len(self.memory),
+            }
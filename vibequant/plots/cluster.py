@@ -0,0 +1,45 @@
+from typing import Optional
+
+import pandas as pd
+import matplotlib.pyplot as plt
+
+
+def plot_cluster_profiles(
+    centroids: pd.DataFrame, labels: Optional[pd.Series] = None, **kwargs
+):
+    """
+    One panel per view with a line per cluster's average seasonal profile.
+
+    Args:
+        centroids (pd.DataFrame): Centroids from vibequant.analysis.cluster.cluster_profiles
+            (one row per cluster, (view, group) columns).
+        labels (pd.Series, optional): Ticker clusters, to show cluster sizes in the legend.
+        **kwargs: Additional keyword arguments for plotting.
+
+    Returns:
+        matplotlib.pyplot: The plot object.
+    """
+    plt.close("all")
+    views = list(dict.fromkeys(centroids.columns.get_level_values(0)))
+    sizes = labels.value_counts() if labels is not None else None
+    fig, axes = plt.subplots(
+        1, len(views), figsize=kwargs.pop("figsize", (5 * len(views), 4)), squeeze=False
+    )
+    for ax, view in zip(axes[0], views):
+        block = centroids[view]
+        x = list(range(len(block.columns)))
+        for cluster, row in block.iterrows():
+            label = str(cluster) if sizes is None else f"{cluster} (n={sizes.get(cluster, 0)})"
+            ax.plot(x, row.to_numpy(), marker="o", markersize=3, label=label)
+        ax.axhline(0, color="gray", linewidth=0.8)
+        # Long views (WM) get every n-th tick only
+        step = max(1, len(x) // 31)
+        ticks = ["/".join(p[:3] for p in str(c).split("/")) for c in block.columns]
+        ax.set_xticks(x[::step])
+        ax.set_xticklabels(ticks[::step], rotation=90, fontsize=8)
+        ax.set_title(view)
+    axes[0][0].set_ylabel(kwargs.pop("ylabel", "Average % Change vs. Ticker Mean"))
+    axes[0][-1].legend(title="Cluster", fontsize=8, loc="upper left", bbox_to_anchor=(1.02, 1))
+    fig.suptitle(kwargs.pop("title", "Seasonal Profiles by Cluster"))
+    plt.tight_layout()
+    return plt
@@ -0,0 +1,47 @@
+import pandas as pd
+import matplotlib.pyplot as plt
+
+
+def plot_event_study(df: pd.DataFrame, **kwargs):
+    """
+    Plot average (bars) and cumulative (line with confidence band) abnormal returns
+    around events.
+
+    Args:
+        df (pd.DataFrame): Output of vibequant.analysis.events.event_study.
+        **kwargs: Additional keyword arguments for plotting.
+
+    Returns:
+        matplotlib.pyplot: The plot object.
+    """
+    plt.close("all")
+    fig, ax = plt.subplots(figsize=kwargs.pop("figsize", (12, 6)))
+    offsets = df.index.to_numpy()
+    ax.bar(
+        offsets,
+        df["AAR"],
+        color=kwargs.pop("color", "skyblue"),
+        edgecolor=kwargs.pop("edgecolor", "black"),
+        label="AAR",
+    )
+    ax.errorbar(
+        offsets,
+        df["AAR"],
+        yerr=[df["AAR"] - df["AAR_lo"], df["AAR_hi"] - df["AAR"]],
+        fmt="none",
+        ecolor="black",
+        capsize=3,
+    )
+    line_color = kwargs.pop("line_color", "orchid")
+    ax.plot(offsets, df["CAAR"], color=line_color, marker="o", label="CAAR")
+    ax.fill_between(
+        offsets, df["CAAR_lo"], df["CAAR_hi"], color=line_color, alpha=0.2
+    )
+    ax.axhline(0, color="gray", linewidth=0.8)
+    ax.axvline(0, color="gray", linestyle="--", linewidth=0.8)
+    plt.title(kwargs.pop("title", "Abnormal % Change Around Events"))
+    plt.xlabel(kwargs.pop("xlabel", "Days From Event"))
+    plt.ylabel(kwargs.pop("ylabel", "Abnormal % Change"))
+    plt.legend()
+    plt.tight_layout()
+    return plt
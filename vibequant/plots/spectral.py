@@ -0,0 +1,43 @@
+from typing import Optional
+
+import pandas as pd
+import matplotlib.pyplot as plt
+
+
+def plot_periodogram(
+    power: pd.DataFrame, cycles: Optional[pd.DataFrame] = None, **kwargs
+):
+    """
+    Plot periodogram power against cycle length, marking the detected cycles.
+
+    Args:
+        power (pd.DataFrame): Output of vibequant.analysis.spectral.periodogram.
+        cycles (pd.DataFrame, optional): Output of vibequant.analysis.spectral.find_cycles.
+        **kwargs: Additional keyword arguments for plotting.
+
+    Returns:
+        matplotlib.pyplot: The plot object.
+    """
+    plt.close("all")
+    fig, ax = plt.subplots(figsize=kwargs.pop("figsize", (12, 6)))
+    for col in power.columns:
+        ax.plot(power.index, power[col], linewidth=0.8, label=str(col))
+    if cycles is not None and len(cycles):
+        for _, row in cycles[cycles["ticker"].isin(power.columns)].iterrows():
+            ax.plot(row["period"], row["power"], "v", color="black", markersize=6)
+            ax.annotate(
+                f"{row['period']:.1f} (FAP {row['fap']:.2g})",
+                (row["period"], row["power"]),
+                textcoords="offset points",
+                xytext=(0, 8),
+                ha="center",
+                fontsize=8,
+            )
+    ax.set_xscale("log")
+    plt.title(kwargs.pop("title", "Periodogram"))
+    plt.xlabel(kwargs.pop("xlabel", "Period"))
+    plt.ylabel(kwargs.pop("ylabel", "Normalized Power"))
+    if power.shape[1] > 1:
+        plt.legend()
+    plt.tight_layout()
+    return plt
@@ -72,14 +72,14 @@ def plot_calendar_change_bar(df_avg: pd.DataFrame, **kwargs):
     return plt
 
 
-def plot_calendar_change_grid(df_avg: pd.DataFrame, **kwargs):
+def plot_calendar_change_grid(df: pd.DataFrame, **kwargs):
     """
     Heatmap of average percentage change by day of month (rows) and weekday (columns).
     """
     plt.close("all")
     plt.figure(figsize=kwargs.pop("figsize", (14, 8)))
     sns.heatmap(
-        df_avg,
+        df,
         annot=kwargs.pop("annot", True),
         fmt=kwargs.pop("fmt", ".2f"),
         cmap=kwargs.pop("cmap", "coolwarm"),
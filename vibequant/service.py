@@ -0,0 +1,236 @@
+import hashlib
+import io
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import matplotlib.pyplot as plt
+
+from vibequant.plots.cache import hash_frame
+from vibequant.utils.cache import LRUCache, SingleFlight
+from vibequant.wrappers.vibes import VibeFrame
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VIEWS = ["W", "M", "D", "WM", "DWM"]
+
+# (status, headers, body)
+Response = Tuple[int, Dict[str, str], bytes]
+
+
+class SeasonalityService:
+    """
+    In-memory store of VibeFrames per ticker that answers seasonal view and plot
+    queries, with an LRU response cache and ETags derived from the content of each view,
+    so they stay valid across restarts and change whenever the data does.
+    """
+
+    def __init__(
+        self,
+        loader: Optional[Callable[[str], VibeFrame]] = None,
+        views: Optional[List[str]] = None,
+        cache_size: int = 256,
+    ) -> None:
+        """
+        Args:
+            loader (callable, optional): Builds a VibeFrame for a ticker on first request.
+                Without a loader only tickers registered through add() are served.
+            views (list, optional): View types computed up front for each ticker.
+            cache_size (int): Number of rendered responses kept in the LRU cache.
+        """
+        self.loader = loader
+        self.views = list(views or DEFAULT_VIEWS)
+        self.cache = LRUCache(cache_size)
+        self._frames: Dict[str, VibeFrame] = {}
+        self._versions: Dict[str, int] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._plot_lock = threading.Lock()  # pyplot keeps global state
+        self._flight = SingleFlight()  # one render per key, however many requests wait
+
+    def _ticker_lock(self, ticker: str) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(ticker, threading.Lock())
+
+    def add(self, ticker: str, vf: VibeFrame) -> int:
+        """
+        Register (or replace) a ticker's VibeFrame and precompute its views.
+        Replacing bumps the data version, which invalidates the cached responses.
+
+        Returns:
+            int: The new data version.
+        """
+        for view in self.views:
+            vf._view(view)
+        with self._ticker_lock(ticker):
+            self._frames[ticker] = vf
+            version = self._versions[ticker] = self._versions.get(ticker, 0) + 1
+        self.cache.discard_where(lambda key: key[1] == ticker)
+        return version
+
+    def precompute(self, tickers: Iterable[str]) -> None:
+        """
+        Load every ticker through the loader and compute its views.
+        """
+        for ticker in tickers:
+            self.frame(ticker)
+
+    def tickers(self) -> List[str]:
+        return sorted(self._frames)
+
+    def frame(self, ticker: str) -> VibeFrame:
+        """
+        Return the ticker's VibeFrame, loading it on first use.
+
+        Raises:
+            KeyError: If the ticker is unknown and cannot be loaded.
+        """
+        return self._entry(ticker)[0]
+
+    def _entry(self, ticker: str) -> Tuple[VibeFrame, int]:
+        """
+        The ticker's VibeFrame and data version, read together so a concurrent add()
+        cannot pair one frame with the other's version.
+        """
+        with self._ticker_lock(ticker):
+            if ticker not in self._frames:
+                if self.loader is None:
+                    raise KeyError(f"Unknown ticker '{ticker}'.")
+                vf = self.loader(ticker)
+                for view in self.views:
+                    vf._view(view)
+                self._frames[ticker] = vf
+                self._versions[ticker] = self._versions.get(ticker, 0) + 1
+            return self._frames[ticker], self._versions[ticker]
+
+    def _cached(self, kind: str, ticker: str, view: str, render) -> Tuple[str, bytes]:
+        if view not in VibeFrame._get_transform_map():
+            raise ValueError(f"Unknown view '{view}'.")
+        vf, version = self._entry(ticker)
+        key = (kind, ticker, view, version)
+        hit = self.cache.get(key)
+        if hit is not None:
+            return hit
+
+        def build() -> Tuple[str, bytes]:
+            # The view's content, not the in-process version, identifies the body
+            token = f"{kind}|{view}|{','.join(vf.returns)}|{hash_frame(vf._view(view))}"
+            etag = '"' + hashlib.sha1(token.encode()).hexdigest()[:20] + '"'
+            result = (etag, render(vf, view))
+            self.cache.put(key, result)
+            return result
+
+        return self._flight.do(key, build)
+
+    def _render_json(self, vf: VibeFrame, view: str) -> bytes:
+        df = vf._view(view)
+        payload = {
+            "view": view,
+            "returns": vf.returns,
+            "data": json.loads(df.to_json(orient="split")),
+        }
+        return json.dumps(payload).encode()
+
+    def _render_png(self, vf: VibeFrame, view: str) -> bytes:
+        buf = io.BytesIO()
+        with self._plot_lock:
+            vf.vibe_plot(type=view).savefig(buf, format="png")
+            plt.close("all")
+        return buf.getvalue()
+
+    def seasonality(self, ticker: str, view: str = "W") -> Tuple[str, bytes]:
+        """
+        Returns:
+            Tuple[str, bytes]: (ETag, JSON body) of the ticker's view.
+        """
+        return self._cached("json", ticker, view, self._render_json)
+
+    def plot(self, ticker: str, view: str = "W") -> Tuple[str, bytes]:
+        """
+        Returns:
+            Tuple[str, bytes]: (ETag, PNG body) of the ticker's view plot.
+        """
+        return self._cached("png", ticker, view, self._render_png)
+
+    def handle(self, path: str, headers: Optional[Dict[str, str]] = None) -> Response:
+        """
+        Route a GET request. Kept independent of the socket layer for testing.
+
+        Args:
+            path (str): Request path with query string.
+            headers (dict, optional): Request headers (If-None-Match is honoured).
+
+        Returns:
+            Tuple[int, Dict[str, str], bytes]: Status, response headers and body.
+        """
+        url = urlsplit(path)
+        parts = [unquote(p) for p in url.path.strip("/").split("/")]
+        view = parse_qs(url.query).get("view", ["W"])[0]
+        try:
+            if parts == ["tickers"]:
+                return _json(200, {"tickers": self.tickers()})
+            if parts == ["cache"]:
+                return _json(200, self.cache.stats())
+            if len(parts) == 2 and parts[0] == "seasonality":
+                etag, body = self.seasonality(parts[1], view)
+                content_type = "application/json"
+            elif len(parts) == 2 and parts[0] == "plot" and parts[1].endswith(".png"):
+                etag, body = self.plot(parts[1][: -len(".png")], view)
+                content_type = "image/png"
+            else:
+                return _json(404, {"error": f"No route for '{url.path}'."})
+        except KeyError as e:
+            return _json(404, {"error": str(e.args[0])})
+        except ValueError as e:
+            return _json(400, {"error": str(e)})
+        except Exception as e:
+            logger.exception("Request failed: %s", path)
+            return _json(500, {"error": f"{type(e).__name__}: {e}"})
+
+        out_headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if (headers or {}).get("If-None-Match") == etag:
+            return 304, out_headers, b""
+        out_headers["Content-Type"] = content_type
+        return 200, out_headers, body
+
+
+def _json(status: int, payload: dict) -> Response:
+    return status, {"Content-Type": "application/json"}, json.dumps(payload).encode()
+
+
+def make_server(
+    service: SeasonalityService, host: str = "127.0.0.1", port: int = 8000
+) -> ThreadingHTTPServer:
+    """
+    Build a threaded HTTP server for the service (port 0 picks a free port).
+
+    Args:
+        service (SeasonalityService): The service answering requests.
+        host (str): Interface to bind.
+        port (int): Port to bind.
+
+    Returns:
+        ThreadingHTTPServer: Call serve_forever() (or run it in a thread) and shutdown().
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            etag = self.headers.get("If-None-Match")
+            request_headers = {"If-None-Match": etag} if etag else {}
+            status, headers, body = service.handle(self.path, request_headers)
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.info("%s - %s", self.address_string(), format % args)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
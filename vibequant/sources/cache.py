@@ -0,0 +1,103 @@
+import pandas as pd
+from typing import Callable, Dict, Hashable
+
+from vibequant.utils.cache import LRUCache, SingleFlight
+
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+DEFAULT_CACHE_ENTRIES = 128
+
+
+def frame_nbytes(df: pd.DataFrame) -> int:
+    """
+    Memory footprint of a DataFrame, including index and object payloads.
+    """
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+class FetchCache:
+    """
+    Thread-safe cache for DataSource.fetch results.
+
+    - Evicts least-recently-used frames once their total size exceeds max_bytes.
+    - Concurrent requests for the same key share one in-flight download.
+    - Callers always get their own copy, so mutating a result never alters the cache.
+    - Empty results and errors are not cached.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_CACHE_BYTES,
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+    ) -> None:
+        """
+        Args:
+            max_bytes (int): Maximum total size of the cached frames.
+            max_entries (int): Maximum number of cached frames.
+        """
+        self._cache = LRUCache(max_entries, max_bytes=max_bytes, sizeof=frame_nbytes)
+        self._flight = SingleFlight()
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Return a copy of the cached frame for key, calling fetch() on a miss.
+
+        Args:
+            key (Hashable): Request key, e.g. (ticker, start, end).
+            fetch (callable): Zero-argument loader for the frame.
+
+        Returns:
+            pd.DataFrame: A private copy of the frame.
+        """
+        df = self._cache.get(key)
+        if df is None:
+            df = self._flight.do(key, lambda: self._load(key, fetch))
+        return df.copy() if df is not None else None
+
+    def _load(self, key: Hashable, fetch: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        # Another thread may have filled the key while this one queued up
+        df = self._cache.peek(key)
+        if df is not None:
+            return df
+        df = fetch()
+        if df is not None and len(df):
+            self._cache.put(key, df)
+        return df
+
+    def refresh(self, key: Hashable, fetch: Callable[[], pd.DataFrame]) -> bool:
+        """
+        Download key again and replace the cached frame (the old frame keeps serving
+        until the new one arrives). Concurrent readers of a missing key share this download.
+
+        Returns:
+            bool: True if a non-empty frame was cached.
+        """
+
+        def load() -> pd.DataFrame:
+            df = fetch()
+            if df is not None and len(df):
+                self._cache.put(key, df)
+            return df
+
+        df = self._flight.do(key, load)
+        return df is not None and len(df) > 0
+
+    def invalidate(self, key: Hashable) -> None:
+        self._cache.pop(key)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._cache
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int]: Entries, bytes, hits, misses, evictions and coalesced requests.
+        """
+        stats = self._cache.stats()
+        stats["coalesced"] = self._flight.coalesced
+        return stats
@@ -0,0 +1,103 @@
+import random
+import threading
+import time
+import zlib
+from typing import Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .base import DataSource
+
+
+class FakeSource(DataSource):
+    """
+    Deterministic offline data source with injectable latency and failures.
+
+    Prices are a random walk seeded by the ticker, so every FakeSource returns the
+    same prices for a ticker whatever its delay, failure rate or column style. Useful
+    to exercise the router, caches and prefetching without network access.
+    """
+
+    def __init__(
+        self,
+        delay: float = 0.0,
+        jitter: float = 0.0,
+        fail_rate: float = 0.0,
+        empty: bool = False,
+        style: str = "yfinance",
+        tickers: Optional[List[str]] = None,
+        seed: int = 0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Args:
+            delay (float): Seconds every fetch takes.
+            jitter (float): Extra uniform random delay in [0, jitter) seconds.
+            fail_rate (float): Probability that a fetch raises ConnectionError.
+            empty (bool): Return empty frames (like an unknown ticker).
+            style (str): "yfinance" (DatetimeIndex, title-case columns) or "raw"
+                (lower-case columns and epoch-millisecond "timestamp" column).
+            tickers (list, optional): Tickers reported by list_stock_tickers().
+            seed (int): Seed for the delay and failure draws.
+            sleep (callable): Sleep function (inject to fake time).
+        """
+        if style not in ("yfinance", "raw"):
+            raise ValueError("style must be 'yfinance' or 'raw'.")
+        self.delay = delay
+        self.jitter = jitter
+        self.fail_rate = fail_rate
+        self.empty = empty
+        self.style = style
+        self.tickers = tickers or ["AAA", "BBB", "CCC"]
+        self.sleep = sleep
+        self.calls = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def list_stock_tickers(self) -> List[str]:
+        return self.tickers
+
+    def list_crypto_tickers(self) -> List[str]:
+        return self.tickers
+
+    def fetch(self, ticker: str, start: Optional[str] = None, end: Optional[str] = None) -> pd.DataFrame:
+        with self._lock:
+            self.calls += 1
+            wait = self.delay + self._rng.uniform(0, self.jitter)
+            fail = self._rng.random() < self.fail_rate
+        if wait > 0:
+            self.sleep(wait)
+        if fail:
+            raise ConnectionError(f"Injected failure fetching {ticker}.")
+        if self.empty:
+            return pd.DataFrame()
+        return self.prices(ticker, start, end)
+
+    def prices(self, ticker: str, start: Optional[str] = None, end: Optional[str] = None) -> pd.DataFrame:
+        """
+        Synthetic daily OHLCV for a ticker on business days between start and end.
+        """
+        dates = pd.bdate_range(start or "2020-01-01", end or "2022-12-30", name="Date")
+        rng = np.random.default_rng(zlib.crc32(ticker.encode()))
+        # Generate from a fixed origin so overlapping ranges agree
+        offset = max(int(np.busday_count("1990-01-01", dates[0].date())), 0) if len(dates) else 0
+        steps = rng.normal(0.0003, 0.015, offset + len(dates))
+        close = 100 * np.exp(np.cumsum(steps))[offset:]
+        open_ = close * np.exp(rng.normal(0, 0.005, len(steps))[offset:])
+        spread = np.abs(rng.normal(0, 0.01, len(steps)))[offset:]
+        df = pd.DataFrame(
+            {
+                "Open": open_,
+                "High": np.maximum(open_, close) * (1 + spread),
+                "Low": np.minimum(open_, close) * (1 - spread),
+                "Close": close,
+                "Volume": rng.integers(100_000, 10_000_000, len(steps))[offset:].astype(np.int64),
+            },
+            index=dates,
+        )
+        if self.style == "raw":
+            df = df.rename(columns=str.lower)
+            df.insert(0, "timestamp", dates.asi8 // 10**6)
+            df = df.reset_index(drop=True)
+        return df
@@ -0,0 +1,211 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Sequence
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from .base import DataSource
+
+logger = logging.getLogger(__name__)
+
+
+class PrefetchScheduler:
+    """
+    Keeps a watchlist warm in a source's fetch cache.
+
+    Tickers are refreshed in a bounded thread pool, highest priority first, either
+    on demand (run_once), every `interval` seconds, or once a day at `at`
+    (e.g. "16:15" after the US close). All timing goes through `clock`, so the
+    schedule can be driven deterministically with tick().
+    """
+
+    def __init__(
+        self,
+        source: DataSource,
+        tickers: Sequence[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        max_workers: int = 4,
+        interval: Optional[float] = None,
+        at: Optional[str] = None,
+        tz: str = "America/New_York",
+        max_age: Optional[float] = None,
+        priority: Optional[Dict[str, int]] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Args:
+            source (DataSource): Source to warm. Uses source.refresh() when available
+                (replaces cached data), otherwise source.fetch().
+            tickers (list): Watchlist, in priority order unless `priority` is given.
+            start (str, optional): Start date passed to the source.
+            end (str, optional): End date passed to the source.
+            max_workers (int): Maximum concurrent refreshes; the source must be
+                thread-safe.
+            interval (float, optional): Seconds between runs.
+            at (str, optional): Daily run time "HH:MM" in `tz` (used if interval is None).
+            tz (str): Time zone of `at`.
+            max_age (float, optional): Seconds after which a warm ticker counts as stale.
+                Defaults to interval, or one day with `at`.
+            priority (dict, optional): Ticker -> priority (lower runs first).
+            clock (callable): Returns the current time as epoch seconds.
+        """
+        if interval is None and at is None:
+            interval = 24 * 3600.0
+        self.source = source
+        self.tickers = list(dict.fromkeys(tickers))
+        self.start_date = start
+        self.end_date = end
+        self.max_workers = max_workers
+        self.interval = interval
+        self.at = at
+        self.tz = ZoneInfo(tz)
+        self.max_age = max_age or interval or 24 * 3600.0
+        self.priority = priority or {}
+        self.clock = clock
+        self._state: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.next_run: float = self.clock()
+
+    def ordered(self, tickers: Optional[Sequence[str]] = None) -> List[str]:
+        """
+        Tickers sorted by priority (ties keep watchlist order).
+        """
+        tickers = list(tickers) if tickers is not None else self.tickers
+        rank = {t: i for i, t in enumerate(tickers)}
+        return sorted(tickers, key=lambda t: (self.priority.get(t, 0), rank[t]))
+
+    def _refresh(self, ticker: str) -> None:
+        with self._lock:
+            self._state.setdefault(ticker, {})["state"] = "fetching"
+        try:
+            if hasattr(self.source, "refresh"):
+                ok = self.source.refresh(ticker, self.start_date, self.end_date)
+            else:
+                df = self.source.fetch(ticker, self.start_date, self.end_date)
+                ok = df is not None and len(df) > 0
+            error = None if ok else "no data"
+        except Exception as e:
+            logger.warning("Prefetch of %s failed: %s", ticker, e)
+            error = f"{type(e).__name__}: {e}"
+        with self._lock:
+            entry = self._state[ticker]
+            entry["state"] = "error" if error else "warm"
+            entry["error"] = error
+            if not error:
+                entry["fetched_at"] = self.clock()
+
+    def run_once(self, tickers: Optional[Sequence[str]] = None) -> Dict[str, str]:
+        """
+        Refresh tickers now (blocking) and return their resulting states.
+
+        Args:
+            tickers (list, optional): Subset to refresh. Defaults to the watchlist.
+
+        Returns:
+            Dict[str, str]: Ticker -> "warm" or "error".
+        """
+        order = self.ordered(tickers)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            wait([pool.submit(self._refresh, t) for t in order])
+        with self._lock:
+            return {t: self._state[t]["state"] for t in order}
+
+    def _next_after(self, now: float) -> float:
+        if self.interval is not None:
+            return now + self.interval
+        hour, minute = (int(x) for x in self.at.split(":"))
+        local = datetime.fromtimestamp(now, self.tz)
+        target = local.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if target <= local:
+            target += timedelta(days=1)
+        return target.timestamp()
+
+    def tick(self) -> bool:
+        """
+        Run a refresh if one is due according to the clock.
+
+        Returns:
+            bool: True if a refresh ran.
+        """
+        now = self.clock()
+        if now < self.next_run:
+            return False
+        self.run_once()
+        self.next_run = self._next_after(now)
+        return True
+
+    def start(self, run_now: bool = True, poll: float = 1.0) -> None:
+        """
+        Start refreshing in a background daemon thread.
+
+        Args:
+            run_now (bool): Warm the watchlist immediately instead of waiting for the first slot.
+            poll (float): Seconds between schedule checks.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        if not run_now:
+            self.next_run = self._next_after(self.clock())
+        self._stop.clear()
+
+        def loop():
+            while not self._stop.is_set():
+                try:
+                    self.tick()
+                except Exception:
+                    logger.exception("Prefetch run failed")
+                self._stop.wait(poll)
+
+        self._thread = threading.Thread(target=loop, name="vibequant-prefetch", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background thread (an in-progress run finishes first).
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def status(self) -> pd.DataFrame:
+        """
+        Warmth of every watchlist ticker.
+
+        Returns:
+            pd.DataFrame: Indexed by ticker with state ("cold", "fetching", "warm",
+                "stale", "error"), fetched_at (UTC), age in seconds and the last error.
+        """
+        now = self.clock()
+        cache = getattr(self.source, "cache", None)
+        rows = []
+        with self._lock:
+            for ticker in self.ordered():
+                entry = self._state.get(ticker, {})
+                state = entry.get("state", "cold")
+                fetched_at = entry.get("fetched_at")
+                age = now - fetched_at if fetched_at is not None else None
+                if state == "warm":
+                    key = (ticker, self.start_date, self.end_date)
+                    evicted = cache is not None and key not in cache
+                    if evicted or age > self.max_age:
+                        state = "stale"
+                rows.append(
+                    {
+                        "ticker": ticker,
+                        "state": state,
+                        "fetched_at": pd.to_datetime(fetched_at, unit="s", utc=True)
+                        if fetched_at is not None
+                        else pd.NaT,
+                        "age": age,
+                        "error": entry.get("error"),
+                    }
+                )
+        return pd.DataFrame(rows).set_index("ticker")
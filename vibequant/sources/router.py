@@ -0,0 +1,375 @@
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .base import DataSource
+
+logger = logging.getLogger(__name__)
+
+CANONICAL_COLUMNS: List[str] = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+
+_COLUMN_ALIASES: Dict[str, str] = {
+    "open": "Open",
+    "o": "Open",
+    "high": "High",
+    "h": "High",
+    "low": "Low",
+    "l": "Low",
+    "close": "Close",
+    "c": "Close",
+    "price": "Close",
+    "adj close": "Adj Close",
+    "adjclose": "Adj Close",
+    "adjusted close": "Adj Close",
+    "volume": "Volume",
+    "vol": "Volume",
+    "v": "Volume",
+}
+
+_DATE_COLUMNS = ("date", "datetime", "timestamp", "time")
+
+
+def normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Bring a source's price frame into the shape YFinanceSource returns.
+
+    - Column names are mapped to Open/High/Low/Close/Adj Close/Volume (case and
+      common aliases ignored); other columns are dropped.
+    - The index becomes a sorted, de-duplicated, timezone-naive DatetimeIndex
+      named "Date" (taken from a date/timestamp column if needed, epoch seconds
+      or milliseconds accepted).
+    - DayOfMonth, Weekday and Month calendar columns are added.
+
+    Args:
+        df (pd.DataFrame): Frame returned by a source.
+
+    Returns:
+        pd.DataFrame: The normalized frame; empty if df is empty or not a DataFrame.
+
+    Raises:
+        ValueError: If there is no Close column or no usable date information.
+    """
+    if not isinstance(df, pd.DataFrame) or df.empty:
+        return pd.DataFrame()
+    df = df.copy()
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+    key = lambda c: str(c).strip().lower().replace("_", " ")  # noqa: E731
+    if not isinstance(df.index, pd.DatetimeIndex):
+        date_col = next((c for c in df.columns if key(c) in _DATE_COLUMNS), None)
+        if date_col is None:
+            raise ValueError("No datetime index or date column in source data.")
+        values = df.pop(date_col)
+        if pd.api.types.is_numeric_dtype(values):
+            unit = "ms" if values.abs().max() > 1e11 else "s"
+            df.index = pd.to_datetime(values.to_numpy(), unit=unit)
+        else:
+            df.index = pd.DatetimeIndex(pd.to_datetime(values.to_numpy()))
+    if df.index.tz is not None:
+        df.index = df.index.tz_localize(None)
+    df = df.rename(columns=lambda c: _COLUMN_ALIASES.get(key(c), c))
+    if "Close" not in df.columns:
+        raise ValueError("Source data has no Close column.")
+    df = df.loc[:, ~df.columns.duplicated()]
+    df = df[[c for c in CANONICAL_COLUMNS if c in df.columns]].astype(np.float64)
+    df = df[~df.index.duplicated(keep="last")].sort_index()
+    df.index = pd.DatetimeIndex(df.index.to_numpy(), name="Date")  # drops any freq
+    df["DayOfMonth"] = df.index.day
+    df["Weekday"] = df.index.day_name()
+    df["Month"] = df.index.month
+    return df
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests to a failing source.
+
+    Closed: requests flow. After `failure_threshold` consecutive failures the
+    breaker opens and rejects requests for `reset_after` seconds, then goes
+    half-open and lets a single trial request through: success closes it again,
+    failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_after: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self.clock() - self.opened_at >= self.reset_after:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        """
+        Whether a request may be sent now (claims the trial slot when half-open).
+        """
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial:
+                self._trial = True
+                return True
+            return False
+
+    def record(self, ok: bool) -> None:
+        with self._lock:
+            self._trial = False
+            if ok:
+                self.failures = 0
+                self.opened_at = None
+                return
+            self.failures += 1
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = self.clock()
+
+
+class SourceStats:
+    """
+    Rolling latency and outcome window for one source.
+    """
+
+    def __init__(self, window: int = 200) -> None:
+        self.latencies: deque = deque(maxlen=window)
+        self.outcomes: deque = deque(maxlen=window)
+        self.requests = 0
+        self.errors = 0
+        self.wins = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, ok: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            self.errors += not ok
+            self.outcomes.append(ok)
+            if ok:
+                self.latencies.append(latency)
+
+    def quantile(self, q: float) -> Optional[float]:
+        with self._lock:
+            if not self.latencies:
+                return None
+            return float(np.quantile(np.fromiter(self.latencies, float), q))
+
+    def error_rate(self) -> float:
+        with self._lock:
+            if not self.outcomes:
+                return 0.0
+            return 1.0 - sum(self.outcomes) / len(self.outcomes)
+
+
+class SourceRouter(DataSource):
+    """
+    Fetches from several sources with hedged requests and failover.
+
+    The request goes to the first available source in preference order. If no good
+    answer arrives within the hedge delay, the same fetch is fired at the next source
+    (and so on), and the first non-empty answer wins; a source that fails triggers
+    the next one immediately. Per-source latency percentiles and error rates are
+    tracked, circuit breakers skip sources that keep failing, and every answer is
+    normalized with normalize_frame(), so VibeFrame sees the same columns whichever
+    source won.
+    """
+
+    def __init__(
+        self,
+        sources: Dict[str, DataSource],
+        hedge_after: Optional[float] = None,
+        hedge_quantile: float = 0.95,
+        default_hedge: float = 1.0,
+        min_samples: int = 20,
+        timeout: Optional[float] = None,
+        failure_threshold: int = 3,
+        reset_after: float = 30.0,
+        max_workers: int = 8,
+        window: int = 200,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            sources (dict): Name -> DataSource, in order of preference.
+            hedge_after (float, optional): Fixed hedge delay in seconds. If None, the
+                delay adapts to the current source's `hedge_quantile` latency.
+            hedge_quantile (float): Latency quantile used as the adaptive hedge delay.
+            default_hedge (float): Hedge delay until a source has `min_samples` latencies.
+            min_samples (int): Successful requests needed before the adaptive delay is used.
+            timeout (float, optional): Give up after this many seconds overall.
+            failure_threshold (int): Consecutive failures that open a source's breaker.
+            reset_after (float): Seconds an open breaker waits before a trial request.
+            max_workers (int): Threads shared by all in-flight source requests.
+            window (int): Requests kept for the latency and error-rate statistics.
+            clock (callable): Monotonic time for the breakers.
+        """
+        if not sources:
+            raise ValueError("SourceRouter needs at least one source.")
+        self.sources = dict(sources)
+        self.hedge_after = hedge_after
+        self.hedge_quantile = hedge_quantile
+        self.default_hedge = default_hedge
+        self.min_samples = min_samples
+        self.timeout = timeout
+        self.breakers = {
+            n: CircuitBreaker(failure_threshold, reset_after, clock) for n in self.sources
+        }
+        self._stats = {n: SourceStats(window) for n in self.sources}
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix="vibequant-router")
+        self.hedges = 0
+
+    def _first_with(self, method: str) -> DataSource:
+        for source in self.sources.values():
+            if hasattr(source, method):
+                return source
+        raise ValueError(f"No source supports {method}().")
+
+    def list_stock_tickers(self) -> List[str]:
+        return self._first_with("list_stock_tickers").list_stock_tickers()
+
+    def list_crypto_tickers(self) -> List[str]:
+        return self._first_with("list_crypto_tickers").list_crypto_tickers()
+
+    def hedge_delay(self, name: str) -> float:
+        """
+        Seconds to wait on source `name` before hedging to the next source.
+        """
+        if self.hedge_after is not None:
+            return self.hedge_after
+        stats = self._stats[name]
+        if len(stats.latencies) < self.min_samples:
+            return self.default_hedge
+        return stats.quantile(self.hedge_quantile)
+
+    def _call(self, name: str, ticker: str, start, end, results: queue.Queue) -> None:
+        t0 = time.perf_counter()
+        try:
+            df = normalize_frame(self.sources[name].fetch(ticker, start, end))
+            error = None
+        except Exception as e:
+            df, error = None, e
+        # An empty answer (e.g. an unknown symbol) is not the source's fault: it
+        # moves on to the next source but does not count against the breaker
+        self._stats[name].record(time.perf_counter() - t0, error is None)
+        self.breakers[name].record(error is None)
+        if error is None and len(df) == 0:
+            error = ValueError(f"No data for {ticker}.")
+        results.put((name, df, error))
+
+    def fetch(self, ticker: str, start: Optional[str] = None, end: Optional[str] = None) -> pd.DataFrame:
+        """
+        Fetch a ticker from the fastest healthy source.
+
+        Returns:
+            pd.DataFrame: The first good answer, normalized.
+
+        Raises:
+            RuntimeError: If every source failed, is circuit-open or timed out.
+        """
+        order = list(self.sources)
+        results: queue.Queue = queue.Queue()
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        errors: Dict[str, BaseException] = {}
+        tried = 0  # position in `order` of the next source to consider
+        sent: List[str] = []
+        pending = 0
+
+        def launch() -> Optional[float]:
+            # Breakers are asked only when a request is really sent, so a half-open
+            # breaker's trial slot is never claimed by a request that never happens
+            nonlocal tried, pending
+            while tried < len(order):
+                name = order[tried]
+                tried += 1
+                if self.breakers[name].allow():
+                    self._pool.submit(self._call, name, ticker, start, end, results)
+                    sent.append(name)
+                    pending += 1
+                    return time.monotonic() + self.hedge_delay(name)
+            return None
+
+        hedge_at = launch()
+        if hedge_at is None:
+            raise RuntimeError(
+                f"No source available for {ticker}: all circuit breakers are open."
+            )
+        while True:
+            now = time.monotonic()
+            waits = [] if deadline is None else [deadline - now]
+            if hedge_at is not None:
+                waits.append(hedge_at - now)
+            try:
+                name, df, error = results.get(timeout=max(min(waits), 0) if waits else None)
+            except queue.Empty:
+                if hedge_at is not None and time.monotonic() >= hedge_at:
+                    hedge_at = launch()
+                    if hedge_at is not None:
+                        logger.debug("Hedged %s to %s", ticker, sent[-1])
+                        self.hedges += 1
+                    continue
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise RuntimeError(f"Timed out fetching {ticker} from {', '.join(sent)}.")
+                continue
+            pending -= 1
+            if error is None:
+                self._stats[name].wins += 1
+                return df
+            errors[name] = error
+            if hedge_at is not None:
+                hedge_at = launch()
+            if pending == 0 and hedge_at is None:
+                detail = "; ".join(f"{n}: {e}" for n, e in errors.items())
+                raise RuntimeError(f"All sources failed for {ticker} ({detail}).")
+
+    def stats(self) -> pd.DataFrame:
+        """
+        Per-source health.
+
+        Returns:
+            pd.DataFrame: Indexed by source with requests, errors, error_rate (over the
+                rolling window), wins (answers used), p50/p95/p99 latency in seconds and
+                the breaker state.
+        """
+        rows = []
+        for name, s in self._stats.items():
+            rows.append(
+                {
+                    "source": name,
+                    "requests": s.requests,
+                    "errors": s.errors,
+                    "error_rate": s.error_rate(),
+                    "wins": s.wins,
+                    "p50": s.quantile(0.5),
+                    "p95": s.quantile(0.95),
+                    "p99": s.quantile(0.99),
+                    "breaker": self.breakers[name].state,
+                }
+            )
+        return pd.DataFrame(rows).set_index("source")
+
+    def close(self) -> None:
+        """
+        Stop the worker threads (requests in flight are not interrupted).
+        """
+        self._pool.shutdown(wait=False)
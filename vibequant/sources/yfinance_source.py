@@ -1,20 +1,24 @@
-from functools import lru_cache
 import yfinance as yf
 from .base import DataSource
+from .cache import DEFAULT_CACHE_BYTES, DEFAULT_CACHE_ENTRIES, FetchCache
+from .router import normalize_frame
 import pandas as pd
-from typing import List, Optional
+from typing import Dict, List, Optional
 from vibequant.data_loader import load_tickers
 
-_CACHE_SIZE = 128
-
 
 class YFinanceSource(DataSource):
     """
     Data source for fetching stock and crypto data using yfinance.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_bytes: int = DEFAULT_CACHE_BYTES,
+        cache_entries: int = DEFAULT_CACHE_ENTRIES,
+    ):
         super().__init__()
+        self.cache = FetchCache(max_bytes=cache_bytes, max_entries=cache_entries)
         tickers = load_tickers()
         self.stock_tickers: List[str] = tickers.get("sp500", [])
         self.crypto_tickers: List[str] = tickers.get("crypto_yahoo", [])
@@ -31,12 +35,12 @@ class YFinanceSource(DataSource):
         """
         return self.crypto_tickers
 
-    @lru_cache(maxsize=_CACHE_SIZE)
     def fetch(
         self, ticker: str, start: Optional[str] = None, end: Optional[str] = None
     ) -> pd.DataFrame:
         """
         Fetches historical data for a given ticker between start and end dates.
+        Results are cached per (ticker, start, end); each caller gets its own copy.
 
         Args:
             ticker (str): The ticker symbol to fetch data for.
@@ -44,17 +48,40 @@ class YFinanceSource(DataSource):
             end (Optional[str]): The end date (YYYY-MM-DD).
 
         Returns:
-            pd.DataFrame: DataFrame with historical data and additional columns.
+            pd.DataFrame: DataFrame with historical prices and calendar columns.
+                Return columns (e.g. "Change") are derived by VibeFrame.
         """
         if not isinstance(ticker, str) or not ticker:
             raise ValueError("Ticker must be a non-empty string.")
+        return self.cache.get_or_fetch(
+            (ticker, start, end), lambda: self._download(ticker, start, end)
+        )
+
+    def refresh(
+        self, ticker: str, start: Optional[str] = None, end: Optional[str] = None
+    ) -> bool:
+        """
+        Re-download a ticker into the fetch cache, replacing any cached copy.
+
+        Returns:
+            bool: True if data was returned and cached.
+        """
+        return self.cache.refresh(
+            (ticker, start, end), lambda: self._download(ticker, start, end)
+        )
 
-        df = yf.download(ticker, start=start, end=end, multi_level_index=False)
+    def _download(
+        self, ticker: str, start: Optional[str] = None, end: Optional[str] = None
+    ) -> pd.DataFrame:
+        # Ticker.history, unlike yf.download, keeps no module-global results that other
+        # threads reset, so prefetch workers can download in parallel
+        df = yf.Ticker(ticker).history(period="max", start=start, end=end)
         if df.empty:
             return pd.DataFrame()  # Return empty DataFrame if no data
-        df["Change"] = ((df["Close"] - df["Open"]) / df["Open"]) * 100
-        df["DayOfMonth"] = df.index.day
-        df["Weekday"] = df.index.day_name()
-        df["Month"] = df.index.month
-        df = df.copy()
-        return df
+        return normalize_frame(df)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Returns fetch cache statistics (entries, bytes, hits, misses, evictions, coalesced).
+        """
+        return self.cache.stats()
@@ -0,0 +1,350 @@
+from abc import ABC, abstractmethod
+from functools import reduce
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# Aggregations every backend supports, in pandas naming
+STATS = ("mean", "std", "var", "sum", "min", "max", "count", "median")
+
+# Record batch size handed to the Arrow hash aggregation
+_BATCH_ROWS = 1 << 16
+
+
+class ComputeBackend(ABC):
+    """
+    Engine behind the VibeFrame calendar features and grouped aggregations.
+
+    Backends take and return pandas objects, so only the heavy lifting moves.
+    Results match the pandas backend: same index (sorted group keys, missing keys
+    dropped), same column layout and dtypes.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def calendar(self, dates: pd.DatetimeIndex) -> Dict[str, np.ndarray]:
+        """
+        DayOfMonth (int32), Weekday (names) and Month (int32) of every date.
+        """
+        pass
+
+    @abstractmethod
+    def group_agg(
+        self, df: pd.DataFrame, keys: List[str], cols: List[str], stats: Sequence[str]
+    ) -> pd.DataFrame:
+        """
+        Aggregate columns by keys, like df.groupby(keys)[cols].agg(stats).
+
+        Returns:
+            pd.DataFrame: Indexed by the sorted keys with (column, stat) columns.
+        """
+        pass
+
+    def group_mean(self, df: pd.DataFrame, keys: List[str], cols: List[str]) -> pd.DataFrame:
+        """
+        Mean of columns by keys, like df.groupby(keys)[cols].mean().
+        """
+        out = self.group_agg(df, keys, cols, ["mean"])
+        out.columns = out.columns.droplevel(1)
+        return out
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+def _check_stats(stats: Sequence[str]) -> None:
+    unknown = [s for s in stats if s not in STATS]
+    if unknown:
+        raise ValueError(f"Unsupported stat(s) {unknown}. Available stats: {', '.join(STATS)}")
+
+
+def _key_index(frame: pd.DataFrame, keys: List[str]) -> pd.Index:
+    # pandas gives a flat Index for a single key, a MultiIndex otherwise
+    if len(keys) == 1:
+        return pd.Index(frame[keys[0]], name=keys[0])
+    return pd.MultiIndex.from_frame(frame[keys])
+
+
+def _wall_time(dates: pd.DatetimeIndex) -> np.ndarray:
+    # Calendar fields of tz-aware dates are taken in their own timezone, as pandas does
+    if dates.tz is not None:
+        dates = dates.tz_localize(None)
+    return dates.to_numpy()
+
+
+def _grouped_median(values: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Exact median of consecutive groups of values (NaN skipped), as pandas computes it.
+    """
+    out = np.full(len(lengths), np.nan)
+    stops = np.cumsum(lengths)
+    for g, (start, stop) in enumerate(zip(stops - lengths, stops)):
+        v = values[start:stop]
+        v = v[~np.isnan(v)]
+        n = len(v)
+        if n:
+            # Partition around the middle element(s) instead of sorting the group
+            mid = np.partition(v, [(n - 1) // 2, n // 2])
+            out[g] = (mid[(n - 1) // 2] + mid[n // 2]) / 2
+    return out
+
+
+class PandasBackend(ComputeBackend):
+    """
+    The reference implementation on pandas.
+    """
+
+    name = "pandas"
+
+    def calendar(self, dates: pd.DatetimeIndex) -> Dict[str, np.ndarray]:
+        return {
+            "DayOfMonth": dates.day,
+            "Weekday": dates.day_name(),
+            "Month": dates.month,
+        }
+
+    def group_agg(self, df, keys, cols, stats):
+        _check_stats(stats)
+        return df.groupby(keys)[list(cols)].agg(list(stats))
+
+    def group_mean(self, df, keys, cols):
+        return df.groupby(keys)[list(cols)].mean()
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError as e:
+        raise ImportError("The arrow backend requires pyarrow: pip install pyarrow") from e
+    return pa, pc
+
+
+class ArrowBackend(ComputeBackend):
+    """
+    Multithreaded hash aggregation and calendar kernels from pyarrow.compute.
+    Medians are exact (collected per group and sorted once in NumPy).
+
+    Weekday keys are Python strings that Arrow has to copy before hashing, which
+    costs about as much as the pandas group-by itself: below roughly a million rows
+    the Weekday views (W, WM, DWM) are no faster than, and at a few hundred thousand
+    rows slower than, the pandas backend. Larger frames and the integer keys gain.
+    """
+
+    name = "arrow"
+
+    def calendar(self, dates: pd.DatetimeIndex) -> Dict[str, np.ndarray]:
+        pa, pc = _require_pyarrow()
+        arr = pa.array(_wall_time(dates))
+        weekday = pc.day_of_week(arr).to_numpy(zero_copy_only=False)
+        return {
+            "DayOfMonth": pc.day(arr).to_numpy(zero_copy_only=False).astype(np.int32),
+            "Weekday": np.array(WEEKDAY_NAMES, dtype=object)[weekday],
+            "Month": pc.month(arr).to_numpy(zero_copy_only=False).astype(np.int32),
+        }
+
+    def group_agg(self, df, keys, cols, stats):
+        _check_stats(stats)
+        pa, pc = _require_pyarrow()
+        keys, cols = list(keys), list(cols)
+        # NaN becomes null, which the aggregations skip like pandas does
+        arrays = {c: pa.array(df[c], from_pandas=True) for c in dict.fromkeys(keys + cols)}
+        for k in keys:
+            if pa.types.is_dictionary(arrays[k].type):
+                arrays[k] = arrays[k].dictionary_decode()
+        table = pa.table(arrays)
+        if any(arrays[k].null_count for k in keys):
+            table = table.filter(reduce(pc.and_, [pc.is_valid(arrays[k]) for k in keys]))
+        # Zero-copy slices, so the hash aggregation can spread batches over threads
+        table = pa.Table.from_batches(table.to_batches(max_chunksize=_BATCH_ROWS), table.schema)
+        ddof = pc.VarianceOptions(ddof=1)
+        # pandas sums an all-NaN group to 0, Arrow to null by default
+        min_count = pc.ScalarAggregateOptions(min_count=0)
+        kernels = {
+            "mean": ("mean", None),
+            "std": ("stddev", ddof),
+            "var": ("variance", ddof),
+            "sum": ("sum", min_count),
+            "min": ("min", None),
+            "max": ("max", None),
+            "count": ("count", None),
+            "median": ("list", None),
+        }
+        aggs = [(c, *kernels[s]) for c in cols for s in stats]
+        aggs = [a if a[2] is not None else a[:2] for a in aggs]
+        result = table.group_by(keys, use_threads=True).aggregate(aggs)
+        order = pc.sort_indices(result, sort_keys=[(k, "ascending") for k in keys])
+        result = result.take(order)
+        data = {}
+        for c in cols:
+            for s in stats:
+                name, _ = kernels[s]
+                column = result.column(f"{c}_{name}")
+                if s == "median":
+                    lists = column.combine_chunks()
+                    values = lists.flatten().to_numpy(zero_copy_only=False).astype(np.float64)
+                    lengths = pc.list_value_length(lists).to_numpy(zero_copy_only=False)
+                    data[(c, s)] = _grouped_median(values, lengths)
+                elif s == "count":
+                    data[(c, s)] = column.to_numpy(zero_copy_only=False).astype(np.int64)
+                elif s in ("min", "max", "sum"):
+                    data[(c, s)] = column.to_pandas().to_numpy()  # keeps integer dtypes
+                else:
+                    data[(c, s)] = column.to_pandas().to_numpy(dtype=np.float64, na_value=np.nan)
+        index = _key_index(result.select(keys).to_pandas(), keys)
+        out = pd.DataFrame(data, index=index)
+        out.columns = pd.MultiIndex.from_tuples(list(data))
+        return out
+
+
+def _require_polars():
+    try:
+        import polars as pl
+    except ImportError as e:
+        raise ImportError("The polars backend requires polars: pip install polars") from e
+    return pl
+
+
+class PolarsBackend(ComputeBackend):
+    """
+    Multithreaded group-by and temporal expressions from Polars.
+    """
+
+    name = "polars"
+
+    def calendar(self, dates: pd.DatetimeIndex) -> Dict[str, np.ndarray]:
+        pl = _require_polars()
+        s = pl.Series(_wall_time(dates))
+        weekday = s.dt.weekday().to_numpy() - 1  # ISO weekday, Monday = 1
+        return {
+            "DayOfMonth": s.dt.day().to_numpy().astype(np.int32),
+            "Weekday": np.array(WEEKDAY_NAMES, dtype=object)[weekday],
+            "Month": s.dt.month().to_numpy().astype(np.int32),
+        }
+
+    def group_agg(self, df, keys, cols, stats):
+        _check_stats(stats)
+        pl = _require_polars()
+        keys, cols = list(keys), list(cols)
+        frame = pl.from_pandas(df[keys + cols].reset_index(drop=True), nan_to_null=True)
+        frame = frame.drop_nulls(keys)
+        exprs = {
+            "mean": lambda c: pl.col(c).mean(),
+            "std": lambda c: pl.col(c).std(ddof=1),
+            "var": lambda c: pl.col(c).var(ddof=1),
+            "sum": lambda c: pl.col(c).sum(),
+            "min": lambda c: pl.col(c).min(),
+            "max": lambda c: pl.col(c).max(),
+            "count": lambda c: pl.col(c).count(),
+            "median": lambda c: pl.col(c).median(),
+        }
+        # Positional aliases: polars column names cannot hold arbitrary separators
+        pairs = [(c, s) for c in cols for s in stats]
+        result = (
+            frame.group_by(keys)
+            .agg([exprs[s](c).alias(f"_agg{i}") for i, (c, s) in enumerate(pairs)])
+            .sort(keys)
+            .to_pandas()
+        )
+        data = {}
+        for i, (c, s) in enumerate(pairs):
+            values = result[f"_agg{i}"]
+            if s == "count":
+                data[(c, s)] = values.to_numpy().astype(np.int64)
+            elif s in ("min", "max", "sum"):
+                data[(c, s)] = values.to_numpy()
+            else:
+                data[(c, s)] = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        out = pd.DataFrame(data, index=_key_index(result, keys))
+        out.columns = pd.MultiIndex.from_tuples(list(data))
+        return out
+
+
+BACKENDS: Dict[str, type] = {
+    "pandas": PandasBackend,
+    "arrow": ArrowBackend,
+    "polars": PolarsBackend,
+}
+
+_default: ComputeBackend = PandasBackend()
+
+
+def get_backend(backend: Optional[Union[str, ComputeBackend]] = None) -> ComputeBackend:
+    """
+    Resolve a backend name or instance; None gives the global default.
+    """
+    if backend is None:
+        return _default
+    if isinstance(backend, ComputeBackend):
+        return backend
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Available backends: {', '.join(BACKENDS)}")
+    return BACKENDS[backend]()
+
+
+def set_backend(backend: Union[str, ComputeBackend]) -> ComputeBackend:
+    """
+    Set the global default backend used by VibeFrames without their own.
+
+    Returns:
+        ComputeBackend: The previous default.
+    """
+    global _default
+    previous, _default = _default, get_backend(backend)
+    return previous
+
+
+def parity_check(
+    df: pd.DataFrame,
+    backend: Union[str, ComputeBackend],
+    keys: Sequence[Union[str, List[str]]] = (
+        "Weekday",
+        "Month",
+        "DayOfMonth",
+        ["Month", "DayOfMonth", "Weekday"],
+    ),
+    cols: Optional[List[str]] = None,
+    stats: Sequence[str] = STATS,
+    rtol: float = 1e-12,
+) -> None:
+    """
+    Check that a backend reproduces the pandas backend on a frame: calendar features
+    exactly, group keys, counts and dtypes exactly, and float statistics to `rtol`
+    (summation order differs between engines).
+
+    Args:
+        df (pd.DataFrame): Frame with a DatetimeIndex, the calendar columns and `cols`.
+        backend (str or ComputeBackend): Backend under test.
+        keys (list): Groupings to compare.
+        cols (list, optional): Value columns. Defaults to every float column.
+        stats (list): Statistics to compare.
+        rtol (float): Relative tolerance for float statistics.
+
+    Raises:
+        AssertionError: On the first mismatch.
+    """
+    ref, other = PandasBackend(), get_backend(backend)
+    cols = cols or [c for c in df.columns if pd.api.types.is_float_dtype(df[c])]
+    if isinstance(df.index, pd.DatetimeIndex):
+        a, b = ref.calendar(df.index), other.calendar(df.index)
+        for name in a:
+            np.testing.assert_array_equal(np.asarray(a[name]), np.asarray(b[name]), err_msg=name)
+            assert np.asarray(a[name]).dtype == np.asarray(b[name]).dtype, name
+    for key in keys:
+        key = [key] if isinstance(key, str) else list(key)
+        pd.testing.assert_frame_equal(
+            ref.group_agg(df, key, cols, stats),
+            other.group_agg(df, key, cols, stats),
+            check_exact=False,
+            rtol=rtol,
+        )
+        pd.testing.assert_frame_equal(
+            ref.group_mean(df, key, cols),
+            other.group_mean(df, key, cols),
+            check_exact=False,
+            rtol=rtol,
+        )
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence, Union
+
+DEFAULT_RETURNS: List[str] = ["Change"]
+
+# Supported return definitions: column name -> (description, required price columns)
+RETURN_DEFINITIONS: Dict[str, tuple] = {
+    "Change": ("Open-to-close % change", ("Open", "Close")),
+    "CloseChange": ("Close-to-close % change", ("Close",)),
+    "Gap": ("Overnight gap % (previous close to open)", ("Open", "Close")),
+    "Range": ("Intraday range % ((high - low) / open)", ("Open", "High", "Low")),
+    "LogReturn": ("Close-to-close log return, in % points", ("Close",)),
+}
+
+
+def normalize_returns(returns: Optional[Union[str, Sequence[str]]]) -> List[str]:
+    """
+    Validate and normalize a return selection into a list of column names.
+
+    Args:
+        returns (str or list, optional): Return name(s). Defaults to ["Change"] if None.
+
+    Returns:
+        List[str]: Ordered, de-duplicated list of return column names.
+
+    Raises:
+        ValueError: If an unknown return definition is requested.
+    """
+    if returns is None:
+        return list(DEFAULT_RETURNS)
+    if isinstance(returns, str):
+        returns = [returns]
+    out: List[str] = []
+    for name in returns:
+        if name not in RETURN_DEFINITIONS:
+            raise ValueError(
+                f"Unknown return '{name}'. Available returns: {', '.join(RETURN_DEFINITIONS)}"
+            )
+        if name not in out:
+            out.append(name)
+    if not out:
+        raise ValueError("At least one return definition must be selected.")
+    return out
+
+
+def _pct(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    """
+    Percent ratio num / den * 100, with NaN wherever the denominator is zero.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = num / den * 100.0
+    out[den == 0] = np.nan
+    return out
+
+
+def compute_returns(df: pd.DataFrame, returns: Sequence[str]) -> pd.DataFrame:
+    """
+    Compute the requested return columns in one vectorized pass over the price arrays.
+
+    Columns already present in df are left untouched. Rows with a zero (or missing)
+    denominator produce NaN instead of inf.
+
+    Args:
+        df (pd.DataFrame): Price DataFrame with (a subset of) Open/High/Low/Close columns,
+            sorted in time order.
+        returns (list): Return names from RETURN_DEFINITIONS.
+
+    Returns:
+        pd.DataFrame: The same DataFrame with the missing return columns added.
+
+    Raises:
+        ValueError: If a price column needed by a requested return is missing.
+    """
+    missing = [r for r in normalize_returns(returns) if r not in df.columns]
+    if not missing:
+        return df
+    needed = {c for r in missing for c in RETURN_DEFINITIONS[r][1]}
+    absent = sorted(needed - set(df.columns))
+    if absent:
+        raise ValueError(
+            f"Cannot compute {', '.join(missing)}: missing {', '.join(absent)} column(s)."
+        )
+    px = {c: df[c].to_numpy(dtype=np.float64) for c in needed}
+    prev_close = None
+    if "Close" in px:
+        prev_close = np.empty_like(px["Close"])
+        prev_close[:1] = np.nan
+        prev_close[1:] = px["Close"][:-1]
+
+    for name in missing:
+        if name == "Change":
+            values = _pct(px["Close"] - px["Open"], px["Open"])
+        elif name == "CloseChange":
+            values = _pct(px["Close"] - prev_close, prev_close)
+        elif name == "Gap":
+            values = _pct(px["Open"] - prev_close, prev_close)
+        elif name == "Range":
+            values = _pct(px["High"] - px["Low"], px["Open"])
+        else:  # LogReturn
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values = np.log(px["Close"] / prev_close) * 100.0
+            values[~np.isfinite(values)] = np.nan
+        df[name] = values
+    return df
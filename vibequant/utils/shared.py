@@ -0,0 +1,332 @@
+import mmap
+import os
+import secrets
+import tempfile
+import threading
+import weakref
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Column blocks start on cache-line boundaries
+_ALIGN = 64
+
+# Segments created by a SharedStore of this process (reused on attach)
+_OWNED: Dict[str, Any] = {}
+# Segments attached by this process, kept open for the views handed out
+_ATTACHED: Dict[str, Any] = {}
+_LOCK = threading.Lock()
+
+
+class _ReadOnlySegment:
+    """
+    Read-only mapping of an existing POSIX shared-memory segment, opened directly
+    rather than through SharedMemory, which on Python < 3.13 always registers the
+    segment with the resource tracker.
+    """
+
+    def __init__(self, name: str) -> None:
+        import _posixshmem
+
+        fd = _posixshmem.shm_open("/" + name, os.O_RDONLY, mode=0o600)
+        try:
+            self._mmap = mmap.mmap(fd, os.fstat(fd).st_size, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        self.name = name
+        self.buf = memoryview(self._mmap)
+
+    def close(self) -> None:
+        self.buf.release()  # BufferError while views are alive, like SharedMemory.close
+        self._mmap.close()
+
+
+def _open_shm(name: str) -> Any:
+    """
+    Attach to an existing segment without registering it with this process's
+    resource tracker (the publisher owns it and unlinks it).
+    """
+    try:
+        return SharedMemory(name=name, track=False)  # Python >= 3.13
+    except TypeError:
+        pass
+    if os.name == "nt":
+        return SharedMemory(name=name)  # Windows segments are not tracked
+    # Unregistering after a tracked attach is not an option either: child processes
+    # share the publisher's tracker and would drop its registration.
+    return _ReadOnlySegment(name)
+
+
+def _segment_buffer(segment: Tuple[str, str]) -> memoryview:
+    kind, name = segment
+    with _LOCK:
+        handle = _OWNED.get(name)
+        if handle is None:
+            handle = _ATTACHED.get(name)
+        if handle is None:
+            if kind == "shm":
+                handle = _open_shm(name)
+            else:
+                handle = np.memmap(name, dtype=np.uint8, mode="r")
+            _ATTACHED[name] = handle
+    return handle.buf if kind == "shm" else memoryview(handle)
+
+
+def detach(names: Optional[List[str]] = None) -> None:
+    """
+    Drop this process's attachments (all, or the given segment names) so their memory
+    can be released once the publisher unlinks them. Views obtained from them must no
+    longer be used.
+    """
+    with _LOCK:
+        for name in list(_ATTACHED) if names is None else names:
+            handle = _ATTACHED.pop(name, None)
+            if handle is not None and not isinstance(handle, np.memmap):
+                try:
+                    handle.close()
+                except BufferError:
+                    pass  # views still alive; the mapping goes with them
+
+
+class SharedArray:
+    """
+    Picklable handle to a read-only array published by a SharedStore.
+    """
+
+    def __init__(
+        self, segment: Tuple[str, str], shape: Tuple[int, ...], dtype: str, offset: int = 0
+    ) -> None:
+        self.segment = segment
+        self.shape = tuple(shape)
+        self.dtype = dtype
+        self.offset = offset
+
+    @property
+    def nbytes(self) -> int:
+        return int(np.prod(self.shape)) * np.dtype(self.dtype).itemsize
+
+    def attach(self) -> np.ndarray:
+        """
+        Read-only view of the published array (no copy).
+        """
+        buf = _segment_buffer(self.segment)
+        arr = np.ndarray(self.shape, dtype=np.dtype(self.dtype), buffer=buf, offset=self.offset)
+        arr.flags.writeable = False
+        return arr
+
+    def __repr__(self) -> str:
+        return f"SharedArray({self.segment[1]}, shape={self.shape}, dtype={self.dtype})"
+
+
+class SharedFrame:
+    """
+    Picklable handle to a DataFrame published by a SharedStore.
+
+    Numeric, boolean and datetime columns (and a DatetimeIndex) are stored as raw
+    arrays; string and categorical columns as integer codes plus their categories,
+    which travel with the handle.
+    """
+
+    def __init__(
+        self,
+        columns: List[Tuple[Any, SharedArray, Optional[list], Optional[str]]],
+        index: Tuple[str, Any, Any],
+    ) -> None:
+        self.columns = columns
+        self.index = index
+
+    @property
+    def nbytes(self) -> int:
+        return sum(c[1].nbytes for c in self.columns)
+
+    def attach(self) -> pd.DataFrame:
+        """
+        Rebuild the DataFrame on views of the shared memory (no copy of the numeric and
+        categorical data; string columns are rebuilt from their codes with their
+        original dtype).
+        """
+        data = {}
+        for name, arr, categories, dtype in self.columns:
+            values = arr.attach()
+            if categories is not None:
+                values = pd.Categorical.from_codes(values, categories=categories)
+                if dtype is not None:
+                    values = values.astype(dtype)
+            data[name] = values
+        kind, name, payload = self.index
+        if kind == "range":
+            index = pd.RangeIndex(*payload, name=name)
+        elif kind == "array":
+            index = pd.Index(payload.attach(), name=name, copy=False)
+        else:
+            index = pd.Index(payload, name=name)
+        return pd.DataFrame(data, index=index, copy=False)
+
+    def __repr__(self) -> str:
+        return f"SharedFrame({len(self.columns)} columns, {self.nbytes} bytes)"
+
+
+def _release(segments: List[Tuple[str, Any]]) -> None:
+    for kind, handle in segments:
+        if kind == "shm":
+            _OWNED.pop(handle.name, None)
+            try:
+                handle.close()
+            except BufferError:
+                pass  # views still alive in this process; unlink frees it when they go
+            try:
+                handle.unlink()
+            except FileNotFoundError:
+                pass
+        else:
+            _OWNED.pop(handle.filename, None)
+            try:
+                os.remove(handle.filename)
+            except FileNotFoundError:
+                pass
+    segments.clear()
+
+
+class SharedStore:
+    """
+    Publishes arrays and DataFrames for process-pool workers without pickling them.
+
+    Each published object lives in one shared-memory segment (or, with `directory`,
+    one memory-mapped file); the handles returned are small and picklable, and
+    workers call `.attach()` to get read-only NumPy/pandas views of the same pages.
+    The store owns the segments: close() (or leaving the `with` block, or garbage
+    collection) unlinks them.
+
+    Example:
+        with SharedStore() as store:
+            handle = store.share_frame(vf)
+            pool.map(work, [handle] * n)  # work() calls handle.attach()
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        """
+        Args:
+            directory (str, optional): Back segments with memory-mapped files in this
+                directory instead of shared memory (e.g. when /dev/shm is small).
+        """
+        self.directory = directory
+        self._segments: List[Tuple[str, Any]] = []
+        self._finalizer = weakref.finalize(self, _release, self._segments)
+
+    def _allocate(self, nbytes: int) -> Tuple[Tuple[str, str], memoryview]:
+        nbytes = max(nbytes, 1)
+        if self.directory is None:
+            shm = SharedMemory(create=True, size=nbytes)
+            self._segments.append(("shm", shm))
+            _OWNED[shm.name] = shm
+            return ("shm", shm.name), shm.buf
+        os.makedirs(self.directory, exist_ok=True)
+        fd, path = tempfile.mkstemp(
+            prefix=f"vq_{secrets.token_hex(4)}_", suffix=".bin", dir=self.directory
+        )
+        os.close(fd)
+        mm = np.memmap(path, dtype=np.uint8, mode="w+", shape=(nbytes,))
+        self._segments.append(("file", mm))
+        _OWNED[path] = mm
+        return ("file", path), memoryview(mm)
+
+    def _write(self, arrays: List[np.ndarray]) -> List[SharedArray]:
+        offsets, total = [], 0
+        for a in arrays:
+            total = -(-total // _ALIGN) * _ALIGN
+            offsets.append(total)
+            total += a.nbytes
+        segment, buf = self._allocate(total)
+        handles = []
+        for a, offset in zip(arrays, offsets):
+            dst = np.ndarray(a.shape, dtype=a.dtype, buffer=buf, offset=offset)
+            dst[...] = a
+            handles.append(SharedArray(segment, a.shape, a.dtype.str, offset))
+        return handles
+
+    def share_array(self, arr: np.ndarray) -> SharedArray:
+        """
+        Publish a numeric array.
+
+        Returns:
+            SharedArray: Handle whose attach() returns a read-only view.
+        """
+        arr = np.asarray(arr)
+        if arr.dtype.hasobject:
+            raise ValueError("Object arrays cannot be shared; convert them first.")
+        return self._write([arr])[0]
+
+    def share_frame(self, df: Any) -> SharedFrame:
+        """
+        Publish a DataFrame (or a VibeFrame's data) in one segment.
+
+        Args:
+            df (pd.DataFrame or VibeFrame): Data to publish. For a VibeFrame, its
+                original (daily) DataFrame is shared.
+
+        Returns:
+            SharedFrame: Handle whose attach() rebuilds the DataFrame on shared memory.
+        """
+        df = getattr(df, "original_df", df)
+        if not isinstance(df, pd.DataFrame):
+            raise ValueError("share_frame expects a DataFrame or a VibeFrame.")
+        if not df.columns.is_unique:
+            raise ValueError("Cannot share a DataFrame with duplicate column names.")
+        names, arrays, categories, dtypes = [], [], [], []
+        for name in df.columns:
+            col = df[name]
+            if isinstance(col.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(col.dtype):
+                cat = col.astype("category")
+                arrays.append(np.ascontiguousarray(cat.cat.codes.to_numpy()))
+                categories.append(list(cat.cat.categories))
+                # Plain string columns are restored to their dtype on attach
+                dtypes.append(None if isinstance(col.dtype, pd.CategoricalDtype) else str(col.dtype))
+            else:
+                values = col.to_numpy()
+                if values.dtype.hasobject:
+                    raise ValueError(f"Column '{name}' has an unsupported dtype {col.dtype}.")
+                arrays.append(np.ascontiguousarray(values))
+                categories.append(None)
+                dtypes.append(None)
+            names.append(name)
+        index = df.index
+        if isinstance(index, pd.RangeIndex):
+            index_spec = ("range", index.name, (index.start, index.stop, index.step))
+        elif (
+            not index.dtype.hasobject
+            and not isinstance(index, pd.MultiIndex)
+            and getattr(index, "tz", None) is None
+        ):
+            arrays.append(np.ascontiguousarray(index.to_numpy()))
+            index_spec = ("array", index.name, None)
+        else:
+            index_spec = ("values", index.name, list(index))
+        handles = self._write(arrays)
+        if index_spec[0] == "array":
+            index_spec = ("array", index.name, handles.pop())
+        return SharedFrame(list(zip(names, handles, categories, dtypes)), index_spec)
+
+    def share_frames(self, frames: Dict[str, Any]) -> Dict[str, SharedFrame]:
+        """
+        Publish a universe of frames, e.g. {ticker: VibeFrame}.
+        """
+        return {key: self.share_frame(df) for key, df in frames.items()}
+
+    @property
+    def nbytes(self) -> int:
+        return sum(h.size for k, h in self._segments)
+
+    def close(self) -> None:
+        """
+        Unlink every published segment. Workers still holding views keep their pages
+        until they drop them.
+        """
+        self._finalizer()
+
+    def __enter__(self) -> "SharedStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,204 @@
+import math
+import numpy as np
+import pandas as pd
+from typing import Dict, Hashable, List, Optional, Sequence, Union
+
+# Empirical KLL constant: normalized rank error ~= _KLL_ERROR / k (99% confidence)
+_KLL_ERROR = 1.7
+
+
+def k_for_error(eps: float) -> int:
+    """
+    Smallest KLL parameter k whose expected normalized rank error is at most eps.
+
+    Args:
+        eps (float): Target rank error, e.g. 0.01 for +/-1% of the ranks.
+
+    Returns:
+        int: The k parameter.
+    """
+    if not 0 < eps < 1:
+        raise ValueError("eps must be in (0, 1).")
+    return max(8, int(math.ceil(_KLL_ERROR / eps)))
+
+
+class KLLSketch:
+    """
+    Mergeable KLL quantile sketch (Karnin, Lang, Liberty 2016).
+
+    Keeps O(k) values regardless of how many are added; any quantile is answered
+    within a normalized rank error of about 1.7 / k. Streams of any size are
+    exact while they fit in the first compactor (n <= k).
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None) -> None:
+        """
+        Args:
+            k (int): Accuracy/size parameter (see k_for_error).
+            seed (int, optional): Seed for the random compaction offsets.
+        """
+        self.k = k
+        self.n = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item stays behind; the rest is halved into the next level
+                keep, items = items[: len(items) % 2], items[len(items) % 2 :]
+                promoted = items[self._rng.integers(2) :: 2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def update(self, values: Union[float, Sequence[float], np.ndarray]) -> "KLLSketch":
+        """
+        Add a batch of values (NaNs are ignored).
+
+        Returns:
+            KLLSketch: self, for chaining.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if len(values):
+            self.n += len(values)
+            self.min = min(self.min, values.min())
+            self.max = max(self.max, values.max())
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """
+        Merge another sketch into this one (in place).
+
+        Returns:
+            KLLSketch: self, for chaining.
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def quantile(self, q: Union[float, Sequence[float]]) -> Union[float, np.ndarray]:
+        """
+        Approximate quantile(s) of everything added so far.
+
+        Args:
+            q (float or list): Quantile(s) in [0, 1].
+
+        Returns:
+            float or np.ndarray: Quantile value(s); NaN for an empty sketch.
+        """
+        qs = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        if self.n == 0:
+            out = np.full(len(qs), np.nan)
+        else:
+            values = np.concatenate(self.levels)
+            weights = np.concatenate(
+                [np.full(len(items), 2.0**level) for level, items in enumerate(self.levels)]
+            )
+            order = np.argsort(values, kind="stable")
+            values, cum = values[order], np.cumsum(weights[order])
+            idx = np.searchsorted(cum, qs * cum[-1], side="left")
+            out = values[np.clip(idx, 0, len(values) - 1)]
+            out = np.where(qs <= 0, self.min, np.where(qs >= 1, self.max, out))
+        return float(out[0]) if np.ndim(q) == 0 else out
+
+    def __len__(self) -> int:
+        return self.n
+
+
+class GroupedQuantileSketch:
+    """
+    One KLLSketch per group key, filled chunk by chunk and mergeable across
+    chunks, processes or tickers.
+    """
+
+    def __init__(self, eps: float = 0.01, seed: Optional[int] = 0) -> None:
+        """
+        Args:
+            eps (float): Target normalized rank error per group.
+            seed (int, optional): Base seed for the per-group sketches.
+        """
+        self.eps = eps
+        self.k = k_for_error(eps)
+        self.seed = seed
+        self.sketches: Dict[Hashable, KLLSketch] = {}
+
+    def _sketch(self, key: Hashable) -> KLLSketch:
+        if key not in self.sketches:
+            seed = None if self.seed is None else self.seed + len(self.sketches)
+            self.sketches[key] = KLLSketch(self.k, seed=seed)
+        return self.sketches[key]
+
+    def update(self, keys: Union[pd.Series, pd.DataFrame, Sequence], values) -> "GroupedQuantileSketch":
+        """
+        Add a chunk of (key, value) pairs. Keys may be a Series, a DataFrame of
+        several key columns (tuples become the group keys) or any sequence.
+
+        Returns:
+            GroupedQuantileSketch: self, for chaining.
+        """
+        if isinstance(keys, pd.DataFrame):
+            keys = pd.MultiIndex.from_frame(keys)
+        codes, uniques = pd.factorize(keys, sort=False)
+        values = np.asarray(values, dtype=np.float64)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        for i, key in enumerate(uniques):
+            self._sketch(key).update(values[order[bounds[i] : bounds[i + 1]]])
+        return self
+
+    def merge(self, other: "GroupedQuantileSketch") -> "GroupedQuantileSketch":
+        """
+        Merge another grouped sketch into this one (in place).
+        """
+        for key, sketch in other.sketches.items():
+            self._sketch(key).merge(sketch)
+        return self
+
+    def quantiles(self, qs: Sequence[float] = (0.5,)) -> pd.DataFrame:
+        """
+        Quantiles per group.
+
+        Args:
+            qs (list): Quantiles in [0, 1].
+
+        Returns:
+            pd.DataFrame: One row per group, one column per quantile (named by quantile_label).
+        """
+        keys = list(self.sketches)
+        data = [np.atleast_1d(self.sketches[k].quantile(list(qs))) for k in keys]
+        if keys and isinstance(keys[0], tuple):
+            index = pd.MultiIndex.from_tuples(keys)
+        else:
+            index = pd.Index(keys)
+        out = pd.DataFrame(data, index=index, columns=[quantile_label(q) for q in qs])
+        return out.sort_index()
+
+
+def quantile_label(q: float) -> str:
+    """
+    Column label for a quantile: 0.5 -> "median", 0.05 -> "p5", 0.975 -> "p97.5".
+    """
+    if q == 0.5:
+        return "median"
+    return f"p{q * 100:g}"
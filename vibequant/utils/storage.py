@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+# Calendar columns are stored in their smallest exact dtype on disk
+COMPACT_DTYPES: Dict[str, str] = {
+    "DayOfMonth": "int8",
+    "Month": "int8",
+    "Weekday": "category",
+}
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for saving/loading VibeFrames: pip install pyarrow"
+        ) from e
+    return pa
+
+
+def write_table(df: pd.DataFrame, path: str, compact: bool = True) -> Dict[str, str]:
+    """
+    Write a DataFrame (index included) to an uncompressed Arrow IPC file.
+
+    Float columns keep NaN as a value rather than a null, so numeric columns can be
+    memory-mapped back without a copy.
+
+    Args:
+        df (pd.DataFrame): DataFrame to write.
+        path (str): Destination file.
+        compact (bool): Store calendar columns with COMPACT_DTYPES.
+
+    Returns:
+        Dict[str, str]: Original dtypes of the compacted columns, to restore on read.
+    """
+    pa = _require_pyarrow()
+    import pyarrow.feather as feather
+
+    restore: Dict[str, str] = {}
+    if compact:
+        casts = {}
+        for col, dtype in COMPACT_DTYPES.items():
+            if col in df.columns and str(df[col].dtype) != dtype:
+                restore[col] = str(df[col].dtype)
+                casts[col] = dtype
+        if casts:
+            df = df.astype(casts)
+    table = pa.Table.from_pandas(df)
+    for i, name in enumerate(table.column_names):
+        if name in df.columns and df[name].dtype.kind == "f":
+            values = df[name].to_numpy()
+            table = table.set_column(i, name, pa.array(values, from_pandas=False))
+    # A single record batch keeps every column contiguous for zero-copy reads
+    feather.write_feather(
+        table, path, compression="uncompressed", chunksize=max(table.num_rows, 1)
+    )
+    return restore
+
+
+def read_table(
+    path: str,
+    mmap: bool = True,
+    restore: Optional[Dict[str, str]] = None,
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    Read an Arrow IPC file written by write_table.
+
+    Args:
+        path (str): Source file.
+        mmap (bool): Memory-map the file; numeric columns are then zero-copy (read-only).
+        restore (dict, optional): Column dtypes to cast back to (see write_table).
+        columns (list, optional): Only convert these columns (with mmap, the others are
+            never read from disk).
+
+    Returns:
+        pd.DataFrame: The stored DataFrame.
+    """
+    pa = _require_pyarrow()
+    if mmap:
+        # The mapping stays alive as long as the returned arrays reference it
+        table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+    else:
+        with pa.OSFile(path, "rb") as source:
+            table = pa.ipc.open_file(source).read_all()
+    if columns is not None:
+        table = table.select([c for c in columns if c in table.column_names])
+    df = table.to_pandas(split_blocks=True)
+    for col, dtype in (restore or {}).items():
+        if col in df.columns:
+            df[col] = df[col].astype(np.dtype(dtype))
+    return df
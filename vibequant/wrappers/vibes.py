@@ -1,11 +1,24 @@
 from __future__ import annotations
+import json
+import os
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 from math import sqrt
 
 from pyparsing import col
+from vibequant.analysis.cube import DimSpec, MomentCube
+from vibequant.analysis.events import event_study
+from vibequant.analysis.indicators import IndicatorSet
+from vibequant.analysis.preview import StratifiedPreview
+from vibequant.analysis.simulate import VIEW_KEYS, stress_test
+from vibequant.analysis.spectral import find_cycles, periodogram
+from vibequant.analysis.stability import stability, yearly_view
+from vibequant.utils.backend import ComputeBackend, get_backend
 from vibequant.utils.general import tableize
+from vibequant.utils.returns import compute_returns, normalize_returns
+from vibequant.utils.sketch import GroupedQuantileSketch, quantile_label
+from vibequant.utils.storage import read_table, write_table
 from vibequant.plots.wdm import (
     plot_weekday_averages,
     plot_day_of_month_averages,
@@ -13,6 +26,9 @@ from vibequant.plots.wdm import (
     plot_month_dom_weekday_heatmaps,
     plot_monthly_averages,
 )
+from vibequant.plots.cache import RenderCache, render_bytes
+from vibequant.plots.events import plot_event_study
+from vibequant.plots.spectral import plot_periodogram
 from vibequant.plots.common import (
     plot_bar,
     plot_hist,
@@ -20,7 +36,7 @@ from vibequant.plots.common import (
     plot_correlation,
     plot_time_series,
 )
-from typing import Optional, List, Any, Union, Callable, Dict
+from typing import Optional, List, Any, Union, Callable, Dict, Sequence
 
 STOCK_WEEK_DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
 
@@ -49,7 +65,12 @@ class VibeFrame:
     }
 
     def __init__(
-        self, df: pd.DataFrame, type: Optional[str] = None, is_stock: bool = True
+        self,
+        df: pd.DataFrame,
+        type: Optional[str] = None,
+        is_stock: bool = True,
+        returns: Optional[Union[str, List[str]]] = None,
+        backend: Optional[Union[str, ComputeBackend]] = None,
     ) -> None:
         """
         Initialize a VibeFrame.
@@ -57,14 +78,26 @@ class VibeFrame:
         Args:
             df (pd.DataFrame): The DataFrame to wrap.
             type (str, optional): The type of data (e.g., 'W', 'M', 'WM') for plotting dispatch.
+            returns (str or list, optional): Return definition(s) to compute and aggregate
+                (see vibequant.utils.returns.RETURN_DEFINITIONS). Defaults to ["Change"].
+            backend (str or ComputeBackend, optional): Engine for the calendar features
+                and aggregations ("pandas", "arrow", "polars"). Defaults to the global
+                backend (see vibequant.utils.backend.set_backend).
         """
         self.is_stock = is_stock
+        self.backend = backend
         self.WEEK_DAYS = STOCK_WEEK_DAYS if is_stock else CRYPTO_WEEK_DAYS
-        self._original_df: pd.DataFrame = self._ensure_time_features(df)
+        self.returns: List[str] = normalize_returns(returns)
+        self._original_df: pd.DataFrame = self._ensure_time_features(
+            df, self.returns, backend
+        )
+        self._views: Dict[str, pd.DataFrame] = {}
+        self._preview: Optional[StratifiedPreview] = None
+        self._preview_views: Dict[str, Any] = {}
+        self._indicators: Optional[IndicatorSet] = None
         self.type: Optional[str] = type
-        transform_map = self._get_transform_map()
-        if type in transform_map:
-            self.df: pd.DataFrame = transform_map[type](self._original_df)
+        if type in self._get_transform_map():
+            self.df: pd.DataFrame = self._view(type)
         else:
             self.df: pd.DataFrame = self._original_df.copy()
 
@@ -100,12 +133,14 @@ class VibeFrame:
         Returns:
             str: String representation.
         """
+        if self._preview is not None:
+            return f"VibeFrame(type={self.type}, shape={self.df.shape}, fraction={self._preview.fraction:g})"
         return f"VibeFrame(type={self.type}, shape={self.df.shape})"
 
     # --- Transformation logic ---
 
     @classmethod
-    def _get_transform_map(cls) -> Dict[str, Callable[[pd.DataFrame], pd.DataFrame]]:
+    def _get_transform_map(cls) -> Dict[str, Callable[..., pd.DataFrame]]:
         """
         Returns a mapping from type string to transformation function.
 
@@ -121,14 +156,20 @@ class VibeFrame:
         }
 
     @staticmethod
-    def _ensure_time_features(df: pd.DataFrame) -> pd.DataFrame:
+    def _ensure_time_features(
+        df: pd.DataFrame,
+        returns: Optional[List[str]] = None,
+        backend: Optional[Union[str, ComputeBackend]] = None,
+    ) -> pd.DataFrame:
         """
-        Ensure 'DayOfMonth', 'Weekday', 'Month', and 'Change' columns exist in the DataFrame.
-        If missing, infer from Date index/column and calculate 'Change' from 'Open' and 'Close'.
+        Ensure 'DayOfMonth', 'Weekday', 'Month', and the selected return columns exist in the DataFrame.
+        If missing, infer from Date index/column and compute the returns from the price columns.
         Collapses MultiIndex columns to first level if present.
 
         Args:
             df (pd.DataFrame): Input DataFrame.
+            returns (list, optional): Return columns to ensure. Defaults to ["Change"].
+            backend (str or ComputeBackend, optional): Engine deriving the calendar features.
 
         Returns:
             pd.DataFrame: DataFrame with required time features.
@@ -158,120 +199,220 @@ class VibeFrame:
                     raise ValueError(
                         "No datetime index or column found to infer 'DayOfMonth', 'Weekday', and 'Month'."
                     )
-            df["DayOfMonth"] = date_index.day
-            df["Weekday"] = date_index.day_name()
-            df["Month"] = date_index.month
-        # Calculate Change if missing
-        if "Change" not in df.columns:
-            if "Open" in df.columns and "Close" in df.columns:
-                df["Change"] = ((df["Close"] - df["Open"]) / df["Open"]) * 100
-            else:
-                raise ValueError(
-                    "Cannot compute 'Change': missing 'Open' or 'Close' columns."
-                )
-        return df
+            for name, values in get_backend(backend).calendar(date_index).items():
+                df[name] = values
+        # Compute any missing return columns in a single pass
+        return compute_returns(df, normalize_returns(returns))
+
+    @staticmethod
+    def _date_indexed(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        The frame indexed by date: as is with a DatetimeIndex, or else by the
+        Date/Datetime/Timestamp/Time column it was built from.
+        """
+        if isinstance(df.index, pd.DatetimeIndex):
+            return df
+        for name in df.columns:
+            if isinstance(name, str) and name.lower() in ["date", "datetime", "timestamp", "time"]:
+                return df.set_axis(pd.DatetimeIndex(df[name]), axis=0)
+        raise ValueError("No datetime index or column found.")
+
+    @staticmethod
+    def _dated(df: pd.DataFrame, col: str) -> pd.Series:
+        """
+        A column indexed by date (see _date_indexed).
+        """
+        return VibeFrame._date_indexed(df)[col]
+
+    @staticmethod
+    def _week_days(df: pd.DataFrame) -> List[str]:
+        """
+        Ordered weekday labels present in the DataFrame (stock or full crypto week).
+        """
+        return VibeFrame._ordered_week_days(set(df["Weekday"].unique()))
+
+    @staticmethod
+    def _ordered_week_days(present: set) -> List[str]:
+        """
+        Ordered weekday labels for a set of weekday names.
+        """
+        week_days = [d for d in STOCK_WEEK_DAYS if d in present]
+        if len(week_days) < 7 and set(CRYPTO_WEEK_DAYS).issubset(present):
+            week_days = CRYPTO_WEEK_DAYS
+        return week_days
+
+    @staticmethod
+    def _average_by(
+        df: pd.DataFrame,
+        key: str,
+        labels: List[Any],
+        returns: List[str],
+        backend: Optional[Union[str, ComputeBackend]] = None,
+    ) -> pd.DataFrame:
+        """
+        Average every return column by one key in a single groupby.
+        Columns are named 'Avg<return>' (e.g. 'AvgChange').
+        """
+        means = get_backend(backend).group_mean(df, [key], returns)
+        return VibeFrame._label_averages(means, labels, returns)
+
+    @staticmethod
+    def _label_averages(
+        means: pd.DataFrame, labels: List[Any], returns: List[str]
+    ) -> pd.DataFrame:
+        """
+        Reindex per-key means to the view's labels and name the columns 'Avg<return>'.
+        """
+        out = means.reindex(labels)
+        out.columns = [f"Avg{c}" for c in returns]
+        return out
+
+    @staticmethod
+    def _pivot_weekday(
+        df: pd.DataFrame,
+        keys: List[str],
+        returns: List[str],
+        backend: Optional[Union[str, ComputeBackend]] = None,
+    ) -> pd.DataFrame:
+        """
+        Average every return column by keys + Weekday in a single groupby, with weekdays as columns.
+        With several returns the columns are a (return, Weekday) MultiIndex.
+        """
+        means = get_backend(backend).group_mean(df, keys + ["Weekday"], returns)
+        return VibeFrame._pivot_means(means, keys, returns, VibeFrame._week_days(df))
+
+    @staticmethod
+    def _pivot_means(
+        means: pd.DataFrame,
+        keys: List[str],
+        returns: List[str],
+        week_days: List[str],
+        fill_value: float = 0,
+    ) -> pd.DataFrame:
+        """
+        Pivot means by keys + Weekday to the weekday-column layout of the WM/DWM views.
+        """
+        pivot = means.unstack("Weekday", fill_value=fill_value).reindex(
+            columns=pd.MultiIndex.from_product([returns, week_days]), fill_value=fill_value
+        )
+        if len(returns) == 1:
+            pivot.columns = pivot.columns.droplevel(0)
+            pivot.columns.name = "Weekday"
+        else:
+            pivot.columns.names = [None, "Weekday"]
+        pivot.index.set_names(keys, inplace=True)
+        return pivot
 
     @staticmethod
-    def _transform_weekday(df: pd.DataFrame) -> pd.DataFrame:
+    def _transform_weekday(
+        df: pd.DataFrame,
+        returns: Optional[List[str]] = None,
+        backend: Optional[Union[str, ComputeBackend]] = None,
+    ) -> pd.DataFrame:
         """
         Transform DataFrame to average change by weekday.
 
         Args:
             df (pd.DataFrame): Input DataFrame.
+            returns (list, optional): Return columns to average. Defaults to ["Change"].
+            backend (str or ComputeBackend, optional): Aggregation engine.
 
         Returns:
             pd.DataFrame: DataFrame with average change by weekday.
         """
-        df = VibeFrame._ensure_time_features(df)
-        week_days = [d for d in STOCK_WEEK_DAYS if d in df["Weekday"].unique()]
-        if len(week_days) < 7 and set(CRYPTO_WEEK_DAYS).issubset(
-            set(df["Weekday"].unique())
-        ):
-            week_days = CRYPTO_WEEK_DAYS
-        wdf = df.groupby("Weekday")["Change"].mean().reindex(week_days)
-        return wdf.to_frame(name="AvgChange")
+        returns = normalize_returns(returns)
+        df = VibeFrame._ensure_time_features(df, returns, backend)
+        return VibeFrame._average_by(
+            df, "Weekday", VibeFrame._week_days(df), returns, backend
+        )
 
     @staticmethod
-    def _transform_month(df: pd.DataFrame) -> pd.DataFrame:
+    def _transform_month(
+        df: pd.DataFrame,
+        returns: Optional[List[str]] = None,
+        backend: Optional[Union[str, ComputeBackend]] = None,
+    ) -> pd.DataFrame:
         """
         Transform DataFrame to average change by month.
 
         Args:
             df (pd.DataFrame): Input DataFrame.
+            returns (list, optional): Return columns to average. Defaults to ["Change"].
+            backend (str or ComputeBackend, optional): Aggregation engine.
 
         Returns:
             pd.DataFrame: DataFrame with average change by month.
         """
-        df = VibeFrame._ensure_time_features(df)
-        mdf = df.groupby("Month")["Change"].mean().reindex(range(1, 13))
-        return mdf.to_frame(name="AvgChange")
+        returns = normalize_returns(returns)
+        df = VibeFrame._ensure_time_features(df, returns, backend)
+        return VibeFrame._average_by(df, "Month", list(range(1, 13)), returns, backend)
 
     @staticmethod
-    def _transform_day_of_month(df: pd.DataFrame) -> pd.DataFrame:
+    def _transform_day_of_month(
+        df: pd.DataFrame,
+        returns: Optional[List[str]] = None,
+        backend: Optional[Union[str, ComputeBackend]] = None,
+    ) -> pd.DataFrame:
         """
         Transform DataFrame to average change by day of month.
 
         Args:
             df (pd.DataFrame): Input DataFrame.
+            returns (list, optional): Return columns to average. Defaults to ["Change"].
+            backend (str or ComputeBackend, optional): Aggregation engine.
 
         Returns:
             pd.DataFrame: DataFrame with average change by day of month.
         """
-        df = VibeFrame._ensure_time_features(df)
-        dom_df = df.groupby("DayOfMonth")["Change"].mean().reindex(range(1, 32))
-        return dom_df.to_frame(name="AvgChange")
+        returns = normalize_returns(returns)
+        df = VibeFrame._ensure_time_features(df, returns, backend)
+        return VibeFrame._average_by(
+            df, "DayOfMonth", list(range(1, 32)), returns, backend
+        )
 
     @staticmethod
-    def _transform_weekday_and_dom(df: pd.DataFrame) -> pd.DataFrame:
+    def _transform_weekday_and_dom(
+        df: pd.DataFrame,
+        returns: Optional[List[str]] = None,
+        backend: Optional[Union[str, ComputeBackend]] = None,
+    ) -> pd.DataFrame:
         """
         Transform DataFrame to average change by both weekday and day of month.
 
         Args:
             df (pd.DataFrame): Input DataFrame.
+            returns (list, optional): Return columns to average. Defaults to ["Change"].
+            backend (str or ComputeBackend, optional): Aggregation engine.
 
         Returns:
             pd.DataFrame: Pivot table with average change by day of month and weekday.
         """
-        df = VibeFrame._ensure_time_features(df)
-        week_days = [d for d in STOCK_WEEK_DAYS if d in df["Weekday"].unique()]
-        if len(week_days) < 7 and set(CRYPTO_WEEK_DAYS).issubset(
-            set(df["Weekday"].unique())
-        ):
-            week_days = CRYPTO_WEEK_DAYS
-        pivot = (
-            df.groupby(["DayOfMonth", "Weekday"])["Change"]
-            .mean()
-            .unstack(fill_value=0)
-            .reindex(columns=week_days, fill_value=0)
-        )
-        pivot.index.name = "DayOfMonth"
-        return pivot
+        returns = normalize_returns(returns)
+        df = VibeFrame._ensure_time_features(df, returns, backend)
+        return VibeFrame._pivot_weekday(df, ["DayOfMonth"], returns, backend)
 
     @staticmethod
-    def _transform_weekday_month_dom(df: pd.DataFrame) -> pd.DataFrame:
+    def _transform_weekday_month_dom(
+        df: pd.DataFrame,
+        returns: Optional[List[str]] = None,
+        backend: Optional[Union[str, ComputeBackend]] = None,
+    ) -> pd.DataFrame:
         """
         Transform DataFrame to average change by month, day of month, and weekday.
 
         Args:
             df (pd.DataFrame): Input DataFrame.
+            returns (list, optional): Return columns to average. Defaults to ["Change"].
+            backend (str or ComputeBackend, optional): Aggregation engine.
 
         Returns:
             pd.DataFrame: MultiIndex DataFrame with (Month, DayOfMonth) as index and Weekday as columns.
         """
-        df = VibeFrame._ensure_time_features(df)
-        week_days = [d for d in STOCK_WEEK_DAYS if d in df["Weekday"].unique()]
-        if len(week_days) < 7 and set(CRYPTO_WEEK_DAYS).issubset(
-            set(df["Weekday"].unique())
-        ):
-            week_days = CRYPTO_WEEK_DAYS
-        pivot = (
-            df.groupby(["Month", "DayOfMonth", "Weekday"])["Change"]
-            .mean()
-            .unstack("Weekday", fill_value=0)
-            .reindex(columns=week_days, fill_value=0)
+        returns = normalize_returns(returns)
+        df = VibeFrame._ensure_time_features(df, returns, backend)
+        return VibeFrame._pivot_weekday(
+            df, ["Month", "DayOfMonth"], returns, backend
         )
-        pivot.index.set_names(["Month", "DayOfMonth"], inplace=True)
-        return pivot
 
     def transform_view(self, type: str) -> None:
         """
@@ -281,12 +422,287 @@ class VibeFrame:
             type (str): The type string (e.g., 'W', 'M', 'WM', 'DWM').
         """
         self.type = type
-        df = self.original_df if self.original_df is not None else self.df
-        transform_map = self._get_transform_map()
-        if type in transform_map:
-            self.df = transform_map[type](df)
+        if type in self._get_transform_map():
+            self.df = self._view(type)
         # else: do not mutate self.df
 
+    def _view(self, type: str) -> pd.DataFrame:
+        """
+        Return the view for a type, computing it once per return selection
+        (estimated from the sample in approximate mode).
+        """
+        if self._preview is not None:
+            return self._approximate_view(type)[0]
+        if type not in self._views:
+            transform = self._get_transform_map()[type]
+            self._views[type] = transform(self.original_df, self.returns, self.backend)
+        return self._views[type]
+
+    # --- Approximate mode ---
+
+    def approximate(
+        self, fraction: float = 0.05, min_per_cell: int = 5, seed: Optional[int] = 0
+    ) -> None:
+        """
+        Switch the views to estimates from a sample stratified by (Month, DayOfMonth,
+        Weekday) cell, for quick looks at large intraday frames. All views come from
+        the same sampled cell moments; refine() grows the sample toward the exact
+        answer and standard_errors() tells how far off each cell may be.
+
+        Args:
+            fraction (float): Share of the rows of every cell to sample, in (0, 1].
+            min_per_cell (int): Rows every cell gets at least (small cells are taken whole).
+            seed (int, optional): Seed of the sample.
+        """
+        self._preview = StratifiedPreview(
+            self._original_df, self.returns, fraction, min_per_cell, seed
+        )
+        self._preview_views = {}
+        if self.type in self._get_transform_map():
+            self.df = self._view(self.type)
+
+    def refine(self, fraction: Optional[float] = None) -> float:
+        """
+        Grow the approximate-mode sample, reusing the rows sampled so far, and refresh
+        the current view. At fraction 1 the views are exact and the errors are 0.
+
+        Args:
+            fraction (float, optional): New sampling fraction. Defaults to doubling it.
+
+        Returns:
+            float: The sampling fraction now in use.
+        """
+        if self._preview is None:
+            raise ValueError("Not in approximate mode; call approximate() first.")
+        self._preview.refine(fraction)
+        self._preview_views = {}
+        if self.type in self._get_transform_map():
+            self.df = self._view(self.type)
+        return self._preview.fraction
+
+    def exact(self) -> None:
+        """
+        Leave approximate mode; views are computed from every row again.
+        """
+        self._preview = None
+        self._preview_views = {}
+        if self.type in self._get_transform_map():
+            self.df = self._view(self.type)
+
+    @property
+    def sample_fraction(self) -> Optional[float]:
+        """
+        Sampling fraction of approximate mode, None when the views are exact.
+        """
+        return self._preview.fraction if self._preview is not None else None
+
+    def standard_errors(self, type: Optional[str] = None) -> pd.DataFrame:
+        """
+        Standard errors of the approximate view, cell by cell.
+
+        Args:
+            type (str, optional): View type ("W", "M", "D", "WM", "DWM"). Defaults to the
+                current one.
+
+        Returns:
+            pd.DataFrame: Same layout as the view; NaN where a cell has no data.
+        """
+        if self._preview is None:
+            raise ValueError("Not in approximate mode; call approximate() first.")
+        type = type or self.type
+        if type not in self._get_transform_map():
+            raise ValueError(f"Unknown view type '{type}'.")
+        return self._approximate_view(type)[1]
+
+    def _approximate_view(self, type: str) -> Any:
+        """
+        (view, standard errors) of a type from the sample, computed once per refinement.
+        """
+        if type not in self._preview_views:
+            keys = VIEW_KEYS[type]
+            means, se, _ = self._preview.estimate(keys)
+            if len(keys) == 1:
+                labels = {
+                    "Weekday": self._ordered_week_days(set(means.index)),
+                    "Month": list(range(1, 13)),
+                    "DayOfMonth": list(range(1, 32)),
+                }[keys[0]]
+                frames = tuple(self._label_averages(f, labels, self.returns) for f in (means, se))
+            else:
+                week_days = self._ordered_week_days(set(means.index.get_level_values("Weekday")))
+                frames = (
+                    self._pivot_means(means, keys[:-1], self.returns, week_days),
+                    self._pivot_means(se, keys[:-1], self.returns, week_days, np.nan),
+                )
+            self._preview_views[type] = frames
+        return self._preview_views[type]
+
+    def _reset_preview(self) -> None:
+        """
+        Resample approximate mode after the rows or returns changed, at the same fraction.
+        """
+        if self._preview is not None:
+            p = self._preview
+            self._preview = StratifiedPreview(
+                self._original_df, self.returns, p.fraction, p.min_per_cell, p.seed
+            )
+        self._preview_views = {}
+
+    def set_returns(self, returns: Union[str, List[str]]) -> None:
+        """
+        Select the return definitions to aggregate and refresh the current view.
+        Missing return columns are computed once on the original DataFrame.
+
+        Args:
+            returns (str or list): Return name(s), e.g. ["Change", "Gap", "LogReturn"].
+        """
+        self.returns = normalize_returns(returns)
+        self._original_df = compute_returns(self._original_df, self.returns)
+        self._views = {}
+        self._reset_preview()
+        if self.type in self._get_transform_map():
+            self.transform_view(self.type)
+
+    # --- Indicators ---
+
+    def add_indicators(self, specs: Union[str, List[str]]) -> pd.DataFrame:
+        """
+        Compute technical indicators as columns of the original DataFrame, so they can be
+        used with grouped_stats, t_sorted and the plots like any other column.
+        The indicator state is kept, so append() updates them bar by bar.
+
+        Args:
+            specs (str or list): Indicator specs, e.g. ["EMA_20", "RSI_14", "MACD", "BB_20_2", "ATR"]
+                (see vibequant.analysis.indicators.INDICATORS).
+
+        Returns:
+            pd.DataFrame: The indicator columns.
+        """
+        if isinstance(specs, str):
+            specs = [specs]
+        current = self._indicators.specs if self._indicators is not None else []
+        self._indicators = IndicatorSet(current + list(specs))
+        values = self._indicators.compute_frame(self._original_df)
+        self._original_df = self._original_df.assign(**values)
+        if self.type not in self._get_transform_map():
+            self.df = self._original_df.copy()
+        return values
+
+    def append(self, bars: pd.DataFrame) -> pd.DataFrame:
+        """
+        Append new bars without recomputing the history.
+
+        Time features and returns are computed for the new rows only (using the
+        previous close), and indicators added with add_indicators() are advanced
+        incrementally, O(1) per indicator and bar. Cached views are invalidated.
+
+        Args:
+            bars (pd.DataFrame): New rows with a DatetimeIndex after the last bar and
+                the same price columns.
+
+        Returns:
+            pd.DataFrame: The appended rows as stored.
+        """
+        bars = bars.copy()
+        if isinstance(bars.columns, pd.MultiIndex):
+            bars.columns = bars.columns.get_level_values(0)
+        if not isinstance(bars.index, pd.DatetimeIndex) or not isinstance(
+            self._original_df.index, pd.DatetimeIndex
+        ):
+            raise ValueError("append() requires a DatetimeIndex.")
+        if len(bars) == 0:
+            return bars
+        if bars.index.min() <= self._original_df.index.max():
+            raise ValueError("New bars must come after the last existing bar.")
+        bars = bars.sort_index()
+        # The previous bar provides the prior close for close-to-close returns
+        shared = [c for c in bars.columns if c in self._original_df.columns]
+        context = pd.concat([self._original_df[shared].iloc[-1:], bars])
+        new = self._ensure_time_features(context, self.returns, self.backend).iloc[1:]
+        if self._indicators is not None:
+            if self._indicators.tickers is None:  # e.g. after load(): rebuild the state once
+                self._indicators.compute_frame(self._original_df)
+            rows = [
+                self._indicators.update({f: row[f] for f in self._indicators.inputs}).iloc[0]
+                for _, row in new.iterrows()
+            ]
+            new = new.assign(**pd.DataFrame(rows, index=new.index))
+        self._original_df = pd.concat([self._original_df, new.reindex(columns=self._original_df.columns)])
+        self._views = {}
+        self._reset_preview()
+        if self.type in self._get_transform_map():
+            self.df = self._view(self.type)
+        else:
+            self.df = self._original_df.copy()
+        return new
+
+    # --- Persistence ---
+
+    def save(self, path: str) -> None:
+        """
+        Save the VibeFrame to a directory of Arrow IPC files.
+
+        Stores the original DataFrame (with compact calendar columns), every view
+        computed so far and the active type/is_stock/returns, so load() can reopen
+        it without fetching or transforming again. Requires pyarrow.
+
+        Args:
+            path (str): Target directory (created if missing).
+        """
+        os.makedirs(path, exist_ok=True)
+        meta: Dict[str, Any] = {
+            "version": 1,
+            "type": self.type,
+            "is_stock": self.is_stock,
+            "returns": self.returns,
+            "views": sorted(self._views),
+            "indicators": self._indicators.specs if self._indicators is not None else [],
+        }
+        meta["restore"] = write_table(
+            self.original_df, os.path.join(path, "original.arrow")
+        )
+        for type, view in self._views.items():
+            write_table(view, os.path.join(path, f"view_{type}.arrow"), compact=False)
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=2)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "VibeFrame":
+        """
+        Load a VibeFrame written by save().
+
+        Args:
+            path (str): Directory written by save().
+            mmap (bool): Memory-map the files so numeric columns are zero-copy and read-only.
+
+        Returns:
+            VibeFrame: The restored VibeFrame, with its saved views already cached.
+        """
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        vf = cls.__new__(cls)
+        vf.is_stock = meta["is_stock"]
+        vf.WEEK_DAYS = STOCK_WEEK_DAYS if vf.is_stock else CRYPTO_WEEK_DAYS
+        vf.returns = meta["returns"]
+        vf.backend = None
+        vf._original_df = read_table(
+            os.path.join(path, "original.arrow"), mmap=mmap, restore=meta["restore"]
+        )
+        vf._views = {
+            type: read_table(os.path.join(path, f"view_{type}.arrow"), mmap=mmap)
+            for type in meta["views"]
+        }
+        vf._preview = None
+        vf._preview_views = {}
+        specs = meta.get("indicators")
+        vf._indicators = IndicatorSet(specs) if specs else None
+        vf.type = meta["type"]
+        if vf.type in vf._get_transform_map():
+            vf.df = vf._view(vf.type)
+        else:
+            vf.df = vf._original_df.copy()
+        return vf
+
     # --- Statistics ---
 
     def stat(self) -> pd.DataFrame:
@@ -299,26 +715,93 @@ class VibeFrame:
         return self.df.describe().T
 
     def grouped_stats(
-        self, by: Union[str, List[str]] = "Weekday", col: str = "Change"
+        self,
+        by: Union[str, List[str]] = "Weekday",
+        col: Optional[Union[str, List[str]]] = None,
+        quantiles: Optional[Sequence[float]] = None,
+        eps: Optional[float] = None,
     ) -> pd.DataFrame:
         """
-        Return grouped statistics for a column.
+        Return grouped statistics for one or more columns.
 
         Args:
             by (str or list, optional): Column(s) to group by. Defaults to "Weekday".
-            col (str): Column to compute statistics on.
+            col (str or list, optional): Column(s) to compute statistics on.
+                Defaults to the selected returns.
+            quantiles (list, optional): Extra quantiles to report, e.g. [0.05, 0.25, 0.75, 0.95]
+                (columns "p5", "p25", ...).
+            eps (float, optional): If set, median and quantiles come from streaming KLL
+                sketches with this normalized rank error instead of exact sorts.
 
         Returns:
-            pd.DataFrame: Grouped statistics.
+            pd.DataFrame: Grouped statistics. Columns are (column, stat) when several
+                columns are aggregated.
         """
         if self.original_df is None:
             raise ValueError("No original DataFrame set for grouped statistics.")
-        stats = self.original_df.groupby(by)[col].agg(
-            ["mean", "std", "min", "max", "count", "median"]
+        cols = self.returns if col is None else col
+        if isinstance(cols, list) and len(cols) == 1:
+            cols = cols[0]
+        names = cols if isinstance(cols, list) else [cols]
+        keys = [by] if isinstance(by, str) else list(by)
+        backend = get_backend(self.backend)
+        if not quantiles and eps is None:
+            stats = backend.group_agg(
+                self.original_df, keys, names, ["mean", "std", "min", "max", "count", "median"]
+            )
+            return stats[cols] if not isinstance(cols, list) else stats
+
+        qs = [0.5] + [q for q in quantiles or [] if q != 0.5]
+        stats = backend.group_agg(
+            self.original_df, keys, names, ["mean", "std", "min", "max", "count"]
         )
-        return stats
+        if eps is None:
+            exact = self.original_df.groupby(by)[names].quantile(qs).unstack(-1)
+            exact.columns = [(c, quantile_label(q)) for c, q in exact.columns]
+            parts = [exact]
+        else:
+            parts = []
+            for name in names:
+                q = self.quantile_sketch(by, name, eps).quantiles(qs)
+                q = q.reindex(stats.index)
+                q.columns = [(name, c) for c in q.columns]
+                parts.append(q)
+        stats = pd.concat([stats] + parts, axis=1)
+        order = ["mean", "std", "min", "max", "count"] + [quantile_label(q) for q in qs]
+        stats = stats[[(c, stat) for c in names for stat in order]]
+        stats.columns = pd.MultiIndex.from_tuples(stats.columns)
+        return stats[cols] if not isinstance(cols, list) else stats
+
+    def quantile_sketch(
+        self,
+        by: Union[str, List[str]] = "Weekday",
+        col: Optional[str] = None,
+        eps: float = 0.01,
+        chunk_size: Optional[int] = None,
+    ) -> GroupedQuantileSketch:
+        """
+        Build per-group KLL quantile sketches of a column in one streaming pass.
+        Sketches can be merged across chunks, processes or tickers with .merge().
 
-    def t_sorted(self, type="Weekday", sig=1.5):
+        Args:
+            by (str or list, optional): Column(s) to group by. Defaults to "Weekday".
+            col (str, optional): Column to sketch. Defaults to the first selected return.
+            eps (float): Target normalized rank error per group.
+            chunk_size (int, optional): Rows per update; the whole frame at once if None.
+
+        Returns:
+            GroupedQuantileSketch: Sketches keyed by group.
+        """
+        df = self.original_df
+        col = col or self.returns[0]
+        sketch = GroupedQuantileSketch(eps=eps)
+        step = chunk_size or max(len(df), 1)
+        for start in range(0, len(df), step):
+            chunk = df.iloc[start : start + step]
+            sketch.update(chunk[by], chunk[col].to_numpy())
+        return sketch
+
+    def t_sorted(self, type="Weekday", sig=1.5, col: Optional[str] = None):
         """
         Return a list of (index_label, t_stat) tuples sorted by |t|.
 
@@ -335,7 +818,7 @@ class VibeFrame:
         -------
         list[(label, float)]
         """
-        df = self.grouped_stats(by=type)
+        df = self.grouped_stats(by=type, col=col or self.returns[0])
         # allow either 'count' or 'n'
         n_col = "count" if "count" in df.columns else "n"
         t = df["mean"] / (df["std"] / np.sqrt(df[n_col]))
@@ -344,20 +827,271 @@ class VibeFrame:
         out = [(label, round(t_stat, 3)) for label, t_stat in out if abs(t_stat) > sig]
         return out
 
+    def event_study(
+        self,
+        events: Any,
+        window: int = 5,
+        col: Optional[str] = None,
+        model: str = "mean",
+        estimation: int = 60,
+        benchmark: Optional[pd.Series] = None,
+        confidence: float = 0.95,
+    ) -> pd.DataFrame:
+        """
+        Average and cumulative abnormal returns around event dates.
+
+        Args:
+            events (list): Event dates (rolled forward to the next row if not trading days).
+            window (int): Rows on each side of the event.
+            col (str, optional): Return column. Defaults to the first selected return.
+            model (str): "raw", "mean" or "market" expected-return model.
+            estimation (int): Rows before the window used to fit the model.
+            benchmark (pd.Series, optional): Market returns for model="market".
+            confidence (float): Confidence level of the bands.
+
+        Returns:
+            pd.DataFrame: AAR/CAAR with confidence bands by offset (see vibequant.analysis.events).
+        """
+        series = self._dated(self.original_df, col or self.returns[0])
+        return event_study(
+            series, events, window, model, estimation, benchmark, confidence
+        )
+
+    def stress_test(
+        self,
+        views: Union[str, List[str]] = ("W", "M"),
+        method: str = "block",
+        n_paths: int = 1000,
+        col: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Rerun the seasonal views on simulated histories to judge whether their edges
+        are robust (see vibequant.analysis.simulate.stress_test).
+
+        Args:
+            views (str or list): View types, e.g. ["W", "M"].
+            method (str): "gbm" or "block" (null paths without seasonality) or
+                "calendar" (bootstrap that keeps the calendar, for confidence bands).
+            n_paths (int): Number of simulated paths.
+            col (str, optional): Return column. Defaults to the first selected return.
+            **kwargs: Options such as block, keep, confidence, chunk_size, workers, seed.
+
+        Returns:
+            Dict[str, pd.DataFrame]: Per view, the observed means and edges with simulated
+                bands and p-values.
+        """
+        if isinstance(views, str):
+            views = [views]
+        return stress_test(
+            self.original_df, col or self.returns[0], list(views), method, n_paths, **kwargs
+        )
+
+    def yearly_view(self, type: str = "W", col: Optional[str] = None) -> pd.DataFrame:
+        """
+        A view broken down by year: the mean of every calendar group in every year.
+
+        Args:
+            type (str): View type ("W", "M", "D", "WM", "DWM").
+            col (str, optional): Return column. Defaults to the first selected return.
+
+        Returns:
+            pd.DataFrame: Calendar groups as rows, years as columns.
+        """
+        return yearly_view(self._date_indexed(self.original_df), col or self.returns[0], type)
+
+    def stability(
+        self, type: str = "W", col: Optional[str] = None, min_obs: int = 1
+    ) -> pd.DataFrame:
+        """
+        How consistently each calendar group's edge shows up year after year
+        (see vibequant.analysis.stability.consistency_scores).
+
+        Args:
+            type (str): View type ("W", "M", "D", "WM", "DWM").
+            col (str, optional): Return column. Defaults to the first selected return.
+            min_obs (int): Days a group needs in a year for that year to count.
+
+        Returns:
+            pd.DataFrame: Per calendar group, the pooled mean and t-stat, the share of years
+                with the same sign, the dispersion of the yearly means and the share of
+                the edge owed to the single biggest year.
+        """
+        df = self._date_indexed(self.original_df)
+        return stability(df, col or self.returns[0], type, min_obs)
+
+    def cube(
+        self,
+        dims: Union[Sequence[DimSpec], Dict[str, DimSpec]] = ("Month", "DayOfMonth", "Weekday"),
+        cols: Optional[Union[str, List[str]]] = None,
+    ) -> MomentCube:
+        """
+        Build a moments cube over calendar keys and regimes in one pass, to slice
+        conditional views and contrasts from (see vibequant.analysis.cube.MomentCube).
+
+        Example:
+            cube = vf.cube(["Weekday", "Vol", "MA200"])
+            cube.contrast("Vol", "high", "low", by="Weekday")
+
+        Args:
+            dims (list or dict): Columns, "Year", built-in regimes ("Vol", "MA200", "Bull")
+                or callables df -> labels.
+            cols (str or list, optional): Return columns. Defaults to the selected returns.
+
+        Returns:
+            MomentCube: Sums, sums of squares and counts per cell.
+        """
+        df = self._date_indexed(self.original_df)
+        return MomentCube(df, dims, cols or self.returns)
+
+    def cycles(
+        self,
+        col: Optional[str] = None,
+        top: int = 5,
+        time: str = "calendar",
+        **kwargs,
+    ) -> pd.DataFrame:
+        """
+        Dominant periodicities of a column, found by Lomb-Scargle periodogram
+        (see vibequant.analysis.spectral.find_cycles).
+
+        Args:
+            col (str, optional): Column to analyse, e.g. a return or "Volume". Defaults
+                to the first selected return.
+            top (int): Number of cycles to return.
+            time (str): "calendar" (periods in days) or "trading" (periods in rows).
+            **kwargs: Options such as method, min_period, max_period, oversample.
+
+        Returns:
+            pd.DataFrame: Cycles ranked by power with period, frequency, power and
+                false-alarm probability.
+        """
+        col = col or self.returns[0]
+        return find_cycles(self._dated(self.original_df, col), top, time, **kwargs)
+
     # --- Plotting ---
 
-    def vibe_plot(self, **kwargs) -> Any:
+    def event_plot(
+        self,
+        events: Any,
+        window: int = 5,
+        col: Optional[str] = None,
+        model: str = "mean",
+        estimation: int = 60,
+        benchmark: Optional[pd.Series] = None,
+        confidence: float = 0.95,
+        **kwargs,
+    ) -> Any:
+        """
+        Plot the event study of the given dates.
+
+        Args:
+            events (list): Event dates.
+            window (int): Rows on each side of the event.
+            col, model, estimation, benchmark, confidence: See event_study().
+            **kwargs: Additional keyword arguments passed to the plot function.
+
+        Returns:
+            Any: The plot object (typically matplotlib.pyplot).
+        """
+        study = self.event_study(
+            events, window, col, model, estimation, benchmark, confidence
+        )
+        return plot_event_study(study, **kwargs)
+
+    def cycle_plot(
+        self, col: Optional[str] = None, top: int = 3, time: str = "calendar", **kwargs
+    ) -> Any:
+        """
+        Plot the periodogram of a column with its dominant cycles marked.
+
+        Args:
+            col (str, optional): Column to analyse. Defaults to the first selected return.
+            top (int): Number of cycles to mark.
+            time (str): "calendar" or "trading".
+            **kwargs: Additional keyword arguments passed to the plot function.
+
+        Returns:
+            Any: The plot object (typically matplotlib.pyplot).
+        """
+        col = col or self.returns[0]
+        options = ("method", "min_period", "max_period", "oversample")
+        spec = {k: kwargs.pop(k) for k in options if k in kwargs}
+        series = self._dated(self.original_df, col)
+        return plot_periodogram(
+            periodogram(series, time, **spec),
+            find_cycles(series, top, time, **spec),
+            **kwargs,
+        )
+
+    def vibe_plot(
+        self, col: Optional[str] = None, type: Optional[str] = None, **kwargs
+    ) -> Any:
         """
         Plot the DataFrame based on its type using the appropriate plot function.
 
         Args:
+            col (str, optional): Return to plot for views holding several returns
+                (WM/DWM). Defaults to the first selected return.
+            type (str, optional): Plot this view type instead of the current one,
+                without changing the current view.
             **kwargs: Additional keyword arguments passed to the plot function.
 
         Returns:
             Any: The plot object (typically matplotlib.pyplot).
         """
-        plot_func = self._vibe_plot_map.get(self.type, self.line_plot)
-        return plot_func(df=self.df, **kwargs)
+        type = type or self.type
+        plot_func = self._vibe_plot_map.get(type, self.line_plot)
+        df = self._view(type) if type in self._vibe_plot_map else self.df
+        if isinstance(df.columns, pd.MultiIndex):
+            df = df[col or self.returns[0]]
+        return plot_func(df=df, **kwargs)
+
+    def render(
+        self,
+        plot: str = "vibe",
+        fmt: str = "png",
+        cache: Optional[RenderCache] = None,
+        **kwargs,
+    ) -> bytes:
+        """
+        Render a plot to encoded image bytes, reusing a RenderCache entry when the
+        data, plot, view type and kwargs are unchanged.
+
+        Args:
+            plot (str): One of "vibe", "line", "bar", "hist", "box", "correlation", "time_series".
+            fmt (str): Image format ("png", "svg", ...).
+            cache (RenderCache, optional): Cache to read from and fill. Renders directly if None.
+            **kwargs: Additional keyword arguments passed to the plot method.
+
+        Returns:
+            bytes: The encoded figure.
+        """
+        methods = {
+            "vibe": self.vibe_plot,
+            "line": self.line_plot,
+            "bar": self.bar_plot,
+            "hist": self.hist_plot,
+            "box": self.box_plot,
+            "correlation": self.correlation_plot,
+            "time_series": self.time_series_plot,
+        }
+        if plot not in methods:
+            raise ValueError(
+                f"Unknown plot '{plot}'. Available plots: {', '.join(methods)}"
+            )
+        draw = lambda: methods[plot](**kwargs)  # noqa: E731
+        if cache is None:
+            return render_bytes(draw, fmt)
+        view = kwargs.get("type") or self.type
+        if plot == "vibe" and view in self._vibe_plot_map:
+            frames = [self._view(view)]
+        else:
+            frames = [self.df]
+        if plot == "time_series":
+            frames.append(self.original_df)
+        key = cache.key(plot, frames, fmt=fmt, view=view, **kwargs)
+        return cache.get_or_render(key, draw, fmt)
 
     def line_plot(
         self, columns: Optional[Union[str, List[str]]] = None, df=None, **kwargs